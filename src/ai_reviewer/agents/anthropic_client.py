@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -42,6 +43,8 @@ class AnthropicClient:
             timeout=config.timeout_seconds,
             max_retries=config.max_retries,
         )
+        # Bounds concurrent requests so parallel agents don't trip rate limits
+        self._request_slots = asyncio.Semaphore(config.max_concurrent_requests)
 
     async def run_completion(
         self,
@@ -55,7 +58,7 @@ class AnthropicClient:
         Used for prose generation tasks (e.g. doc drafting) where structured
         output is not needed.
         """
-        response = await self._sdk.messages.create(
+        response = await self._create_message(
             model=model,
             system=system,
             messages=[{"role": "user", "content": user}],
@@ -63,6 +66,11 @@ class AnthropicClient:
         )
         return _extract_text(response)
 
+    async def _create_message(self, **kwargs: Any) -> Any:
+        """Send one Messages API request once a concurrency slot is free."""
+        async with self._request_slots:
+            return await self._sdk.messages.create(**kwargs)
+
     async def close(self) -> None:
         await self._sdk.close()
 
@@ -131,7 +139,7 @@ class AnthropicClient:
                 kwargs["thinking"] = {"type": "adaptive"}
                 kwargs["temperature"] = 1.0
 
-            response = await self._sdk.messages.create(**kwargs)
+            response = await self._create_message(**kwargs)
             _accumulate_usage(usage, response)
 
             stop = getattr(response, "stop_reason", None)
@@ -180,286 +180,300 @@ async def review_pr_async(
     meta: ReviewMeta | None = None
     recheck_review: ConsolidatedReview | None = None
 
-    if output == "github":
-        gh = GitHubClient(config.github.token)
-        pr = gh.get_pull_request(repo, pr_number)
-        current_sha = pr.head.sha
-
-        meta = gh.get_review_metadata(pr)
-        diff_files = {f.filename for f in pr.get_files()}
-        previous_comments = gh.get_previous_review_comments(pr) if meta else []
-        skip_reason = should_skip_before_agents(
-            meta,
-            current_sha,
-            force_review,
-            diff_files=diff_files,
-            previous_comments=previous_comments,
-        )
-        if skip_reason is not None:
-            console.print(
-                f"[dim]⏭️  Skipping review: {skip_reason.value} "
-                f"(use --force-review to override)[/dim]"
+    try:
+        if output == "github":
+            gh = GitHubClient(config.github.token)
+            pr = gh.get_pull_request(repo, pr_number)
+            current_sha = pr.head.sha
+
+            meta = gh.get_review_metadata(pr)
+            diff_files = {f.filename for f in gh.get_pr_files(pr)}
+            previous_comments = gh.get_previous_review_comments(pr) if meta else []
+            skip_reason = should_skip_before_agents(
+                meta,
+                current_sha,
+                force_review,
+                diff_files=diff_files,
+                previous_comments=previous_comments,
             )
-            return
-
-        if meta is not None and not force_review:
-            lgtm_delta = gh.check_lgtm_fast_path(pr, meta)
-            if lgtm_delta is not None:
+            if skip_reason is not None:
                 console.print(
-                    "[dim]🔍 LGTM candidate detected — running lightweight 1-agent re-check…[/dim]"
+                    f"[dim]⏭️  Skipping review: {skip_reason.value} "
+                    f"(use --force-review to override)[/dim]"
                 )
-                try:
-                    recheck_review = await run_review(
-                        repo=repo,
-                        pr_number=pr_number,
-                        anthropic_cfg=anthropic_cfg,
-                        github_token=config.github.token,
-                        num_agents=1,
-                        enable_cross_review=False,
-                        min_validation_agreement=min_validation_agreement,
-                        config=config,
-                    )
-                except Exception as e:
-                    console.print(f"[red]Error during LGTM re-check:[/red] {e}")
-                    console.print(
-                        "[yellow]Falling back to normal review flow after re-check failure[/yellow]"
-                    )
+                return
 
-                if recheck_review is not None and not recheck_review.findings:
-                    formatter = GitHubFormatter(reviewer_name)
-                    lgtm_review_count = meta.review_count + 1
-                    new_meta = ReviewMeta.build(
-                        commit_sha=current_sha,
-                        review_count=lgtm_review_count,
-                        finding_hashes=[],
+            if meta is not None and not force_review:
+                lgtm_delta = gh.check_lgtm_fast_path(pr, meta)
+                if lgtm_delta is not None:
+                    console.print(
+                        "[dim]🔍 LGTM candidate detected — running lightweight 1-agent re-check…[/dim]"
                     )
-                    lgtm_review = lgtm_placeholder_review(repo, pr_number)
-                    if dry_run:
+                    try:
+                        recheck_review = await run_review(
+                            repo=repo,
+                            pr_number=pr_number,
+                            anthropic_cfg=anthropic_cfg,
+                            github_token=config.github.token,
+                            num_agents=1,
+                            enable_cross_review=False,
+                            min_validation_agreement=min_validation_agreement,
+                            config=config,
+                        )
+                    except Exception as e:
+                        console.print(f"[red]Error during LGTM re-check:[/red] {e}")
                         console.print(
-                            "\n[yellow]Dry run - LGTM (verified by 1-agent re-check)[/yellow]"
+                            "[yellow]Falling back to normal review flow after re-check failure[/yellow]"
+                        )
+
+                    if recheck_review is not None and not recheck_review.findings:
+                        formatter = GitHubFormatter(reviewer_name)
+                        lgtm_review_count = meta.review_count + 1
+                        new_meta = ReviewMeta.build(
+                            commit_sha=current_sha,
+                            review_count=lgtm_review_count,
+                            finding_hashes=[],
                         )
-                        print(
-                            formatter.format_review_with_delta(
+                        lgtm_review = lgtm_placeholder_review(repo, pr_number)
+                        if dry_run:
+                            console.print(
+                                "\n[yellow]Dry run - LGTM (verified by 1-agent re-check)[/yellow]"
+                            )
+                            print(
+                                formatter.format_review_with_delta(
+                                    lgtm_review, lgtm_delta, meta=new_meta
+                                )
+                            )
+                        else:
+                            body = formatter.format_review_with_delta_compact(
                                 lgtm_review, lgtm_delta, meta=new_meta
                             )
-                        )
-                    else:
-                        body = formatter.format_review_with_delta_compact(
-                            lgtm_review, lgtm_delta, meta=new_meta
-                        )
-                        gh.post_review(pr, body, "COMMENT")
-                        if lgtm_delta.fixed_findings:
-                            resolved = gh.resolve_fixed_comments(pr, lgtm_delta)
-                            console.print(f"✅ LGTM: resolved {resolved} comments")
+                            gh.post_review(pr, body, "COMMENT")
+                            if lgtm_delta.fixed_findings:
+                                resolved = gh.resolve_fixed_comments(pr, lgtm_delta)
+                                console.print(f"✅ LGTM: resolved {resolved} comments")
+                            console.print(
+                                "[green]🎉 LGTM — all issues resolved (verified by re-check)[/green]"
+                            )
+                        return
+
+                    if recheck_review is not None:
                         console.print(
-                            "[green]🎉 LGTM — all issues resolved (verified by re-check)[/green]"
+                            f"[yellow]Re-check found {len(recheck_review.findings)} issue(s) "
+                            f"— proceeding with normal review flow[/yellow]"
                         )
-                    return
 
-                if recheck_review is not None:
-                    console.print(
-                        f"[yellow]Re-check found {len(recheck_review.findings)} issue(s) "
-                        f"— proceeding with normal review flow[/yellow]"
-                    )
+        # Status callback
+        last_status: list[str | None] = [None]
 
-    # Status callback
-    last_status: list[str | None] = [None]
+        def on_status(status: str) -> None:
+            if status != last_status[0]:
+                console.print(f"  → Agent status: [cyan]{status}[/cyan]")
+                last_status[0] = status
 
-    def on_status(status: str) -> None:
-        if status != last_status[0]:
-            console.print(f"  → Agent status: [cyan]{status}[/cyan]")
-            last_status[0] = status
-
-    try:
-        review = await run_review(
-            repo=repo,
-            pr_number=pr_number,
-            anthropic_cfg=anthropic_cfg,
-            github_token=config.github.token,
-            on_status=on_status,
-            num_agents=num_agents,
-            enable_cross_review=enable_cross_review,
-            min_validation_agreement=min_validation_agreement,
-            config=config,
-        )
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+        try:
+            review = await run_review(
+                repo=repo,
+                pr_number=pr_number,
+                anthropic_cfg=anthropic_cfg,
+                github_token=config.github.token,
+                on_status=on_status,
+                num_agents=num_agents,
+                enable_cross_review=enable_cross_review,
+                min_validation_agreement=min_validation_agreement,
+                config=config,
+            )
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
 
-    # Check if all agents failed
-    if review.all_agents_failed:
-        console.print(f"[red]❌ All {review.agent_count} agents failed![/red]")
-        console.print(f"   Time: {review.total_review_time_ms / 1000:.1f}s")
-        console.print("\n[yellow]Not posting to GitHub - all agents failed.[/yellow]")
-        console.print("\n[bold]Possible causes:[/bold]")
-        console.print("  • Invalid or expired Anthropic API key")
-        console.print("  • Rate limit exceeded")
-        console.print("  • Network connectivity issues")
-        console.print("\nCheck your ANTHROPIC_API_KEY and try again.")
-        sys.exit(1)
+        # Check if all agents failed
+        if review.all_agents_failed:
+            console.print(f"[red]❌ All {review.agent_count} agents failed![/red]")
+            console.print(f"   Time: {review.total_review_time_ms / 1000:.1f}s")
+            console.print("\n[yellow]Not posting to GitHub - all agents failed.[/yellow]")
+            console.print("\n[bold]Possible causes:[/bold]")
+            console.print("  • Invalid or expired Anthropic API key")
+            console.print("  • Rate limit exceeded")
+            console.print("  • Network connectivity issues")
+            console.print("\nCheck your ANTHROPIC_API_KEY and try again.")
+            sys.exit(1)
 
-    effective_agents = review.agent_count
-    cross_review_ran = effective_agents > 1 and enable_cross_review
-    if effective_agents == 1:
-        msg = (
-            "[yellow]Used 1 comprehensive agent (PR too small for multi-agent)[/yellow]"
-            if num_agents > 1
-            else "[yellow]Used 1 comprehensive agent[/yellow]"
-        )
-        console.print(msg)
-    else:
-        agent_types = ["security", "performance", "quality"][:effective_agents]
-        console.print(
-            f"[yellow]Used {effective_agents} specialized agents: {', '.join(agent_types)}[/yellow]"
-        )
-    if effective_agents > 1:
-        if cross_review_ran:
-            console.print("[dim]Cross-review ran: findings validated and ranked[/dim]")
+        effective_agents = review.agent_count
+        cross_review_ran = effective_agents > 1 and enable_cross_review
+        if effective_agents == 1:
+            msg = (
+                "[yellow]Used 1 comprehensive agent (PR too small for multi-agent)[/yellow]"
+                if num_agents > 1
+                else "[yellow]Used 1 comprehensive agent[/yellow]"
+            )
+            console.print(msg)
         else:
-            console.print("[dim]Cross-review disabled[/dim]")
-
-    console.print(f"✅ Review complete: {review.summary}")
-    console.print(
-        f"   Time: {review.total_review_time_ms / 1000:.1f}s | Findings: {len(review.findings)}"
-    )
+            agent_types = ["security", "performance", "quality"][:effective_agents]
+            console.print(
+                f"[yellow]Used {effective_agents} specialized agents: {', '.join(agent_types)}[/yellow]"
+            )
+        if effective_agents > 1:
+            if cross_review_ran:
+                console.print("[dim]Cross-review ran: findings validated and ranked[/dim]")
+            else:
+                console.print("[dim]Cross-review disabled[/dim]")
 
-    # Warn about partial failures
-    if review.failed_agents:
+        console.print(f"✅ Review complete: {review.summary}")
         console.print(
-            f"[yellow]⚠️  {len(review.failed_agents)}/{review.agent_count} agents failed: {', '.join(review.failed_agents)}[/yellow]"
+            f"   Time: {review.total_review_time_ms / 1000:.1f}s | Findings: {len(review.findings)}"
         )
 
-    # Output
-    if output == "json":
-        print(json.dumps(format_review_as_json(review), indent=2))
-    elif output == "markdown":
-        formatter = GitHubFormatter(reviewer_name)
-        print(formatter.format_review(review))
-    else:  # github
-        if gh is None or pr is None:
-            raise click.ClickException(
-                "--output github requires a valid GitHub token and accessible PR"
-            )
-        formatter = GitHubFormatter(reviewer_name)
-        current_sha = pr.head.sha
-
-        # Compute delta from previous reviews
-        console.print("🔄 Checking for previous review comments...")
-        meta_review_count = (meta.review_count + 1) if meta is not None else None
-        delta = gh.compute_review_delta(pr, review.findings, review_count=meta_review_count)
-
-        # Show delta summary
-        if delta.previous_comments:
+        # Warn about partial failures
+        if review.failed_agents:
             console.print(
-                f"   Found {len(delta.previous_comments)} previous comments: "
-                f"[green]{len(delta.fixed_findings)} fixed[/green], "
-                f"[yellow]{len(delta.open_findings)} open[/yellow], "
-                f"[cyan]{len(delta.new_findings)} new[/cyan]"
+                f"[yellow]⚠️  {len(review.failed_agents)}/{review.agent_count} agents failed: {', '.join(review.failed_agents)}[/yellow]"
             )
-        else:
-            console.print("   No previous review comments found (first run)")
 
-        # Accurate review count: prefer metadata, fall back to heuristic
-        review_count: int
-        if meta_review_count is not None:
-            review_count = meta_review_count
-        else:
-            review_count = estimate_review_count(delta)
+        # Output
+        if output == "json":
+            print(json.dumps(format_review_as_json(review), indent=2))
+        elif output == "markdown":
+            formatter = GitHubFormatter(reviewer_name)
+            print(formatter.format_review(review))
+        else:  # github
+            if gh is None or pr is None:
+                raise click.ClickException(
+                    "--output github requires a valid GitHub token and accessible PR"
+                )
+            formatter = GitHubFormatter(reviewer_name)
+            current_sha = pr.head.sha
+
+            # Compute delta from previous reviews
+            console.print("🔄 Checking for previous review comments...")
+            meta_review_count = (meta.review_count + 1) if meta is not None else None
+            # Without prior review metadata there are no earlier findings to track as
+            # fixed, so a clean review can skip the previous-comments fetch entirely.
+            delta = gh.compute_review_delta(
+                pr,
+                review.findings,
+                review_count=meta_review_count,
+                fetch_previous=meta is not None,
+            )
 
-        # Convergence gate: skip posting when findings are unchanged
-        if delta.previous_comments and not force_review:
-            if should_skip_review(review_count, delta):
+            # Show delta summary
+            if delta.previous_comments:
                 console.print(
-                    "[dim]⏭️  Findings unchanged since last review — skipping post "
-                    "(use --force-review to override)[/dim]"
+                    f"   Found {len(delta.previous_comments)} previous comments: "
+                    f"[green]{len(delta.fixed_findings)} fixed[/green], "
+                    f"[yellow]{len(delta.open_findings)} open[/yellow], "
+                    f"[cyan]{len(delta.new_findings)} new[/cyan]"
                 )
-                return
-        elif force_review and delta.previous_comments:
-            console.print("[dim]⚡ --force-review: bypassing convergence check[/dim]")
-
-        # Build metadata to embed in the review comment
-        finding_hashes = [f.finding_hash for f in review.findings]
-        new_meta = ReviewMeta.build(
-            commit_sha=current_sha,
-            review_count=review_count,
-            finding_hashes=finding_hashes,
-        )
+            else:
+                console.print("   No previous review comments found (first run)")
 
-        if dry_run:
-            console.print("\n[yellow]Dry run - not posting to GitHub[/yellow]")
-            if delta.previous_comments:
-                print(formatter.format_review_with_delta(review, delta, meta=new_meta))
+            # Accurate review count: prefer metadata, fall back to heuristic
+            review_count: int
+            if meta_review_count is not None:
+                review_count = meta_review_count
             else:
-                print(formatter.format_review(review, meta=new_meta))
-        else:
-            max_total = config.output.max_total_findings
-            max_per_file = config.output.max_findings_per_file
+                review_count = estimate_review_count(delta)
 
-            # Pre-filter inline findings so the compact body matches what GitHub will accept.
-            candidate_inline_findings = (
-                delta.new_findings if delta.previous_comments else review.findings
-            )
-            postable_inline_findings = gh.get_postable_inline_findings(
-                pr,
-                inline_findings=candidate_inline_findings,
-                max_total=max_total,
-                max_per_file=max_per_file,
+            # Convergence gate: skip posting when findings are unchanged
+            if delta.previous_comments and not force_review:
+                if should_skip_review(review_count, delta):
+                    console.print(
+                        "[dim]⏭️  Findings unchanged since last review — skipping post "
+                        "(use --force-review to override)[/dim]"
+                    )
+                    return
+            elif force_review and delta.previous_comments:
+                console.print("[dim]⚡ --force-review: bypassing convergence check[/dim]")
+
+            # Build metadata to embed in the review comment
+            finding_hashes = [f.finding_hash for f in review.findings]
+            new_meta = ReviewMeta.build(
+                commit_sha=current_sha,
+                review_count=review_count,
+                finding_hashes=finding_hashes,
             )
-            use_compact_body = len(postable_inline_findings) > 0
 
-            if delta.previous_comments:
-                body = (
-                    formatter.format_review_with_delta_compact(
-                        review,
-                        delta,
-                        meta=new_meta,
-                        inline_new_findings=postable_inline_findings,
-                    )
-                    if use_compact_body
-                    else formatter.format_review_with_delta(review, delta, meta=new_meta)
-                )
-                action = formatter.get_review_action_with_delta(review, delta, allow_approve)
+            if dry_run:
+                console.print("\n[yellow]Dry run - not posting to GitHub[/yellow]")
+                if delta.previous_comments:
+                    print(formatter.format_review_with_delta(review, delta, meta=new_meta))
+                else:
+                    print(formatter.format_review(review, meta=new_meta))
             else:
-                body = (
-                    formatter.format_review_compact(
-                        review,
-                        meta=new_meta,
-                        inline_findings=postable_inline_findings,
+                max_total = config.output.max_total_findings
+                max_per_file = config.output.max_findings_per_file
+
+                # Pre-filter inline findings so the compact body matches what GitHub will accept.
+                candidate_inline_findings = (
+                    delta.new_findings if delta.previous_comments else review.findings
+                )
+                postable_inline_findings = gh.get_postable_inline_findings(
+                    pr,
+                    inline_findings=candidate_inline_findings,
+                    max_total=max_total,
+                    max_per_file=max_per_file,
+                )
+                use_compact_body = len(postable_inline_findings) > 0
+
+                if delta.previous_comments:
+                    body = (
+                        formatter.format_review_with_delta_compact(
+                            review,
+                            delta,
+                            meta=new_meta,
+                            inline_new_findings=postable_inline_findings,
+                        )
+                        if use_compact_body
+                        else formatter.format_review_with_delta(review, delta, meta=new_meta)
                     )
-                    if use_compact_body
-                    else formatter.format_review(review, meta=new_meta)
+                    action = formatter.get_review_action_with_delta(review, delta, allow_approve)
+                else:
+                    body = (
+                        formatter.format_review_compact(
+                            review,
+                            meta=new_meta,
+                            inline_findings=postable_inline_findings,
+                        )
+                        if use_compact_body
+                        else formatter.format_review(review, meta=new_meta)
+                    )
+                    action = formatter.get_review_action(review, allow_approve=allow_approve)
+
+                posted = gh.post_review(
+                    pr,
+                    body,
+                    action,
+                    inline_findings=postable_inline_findings or None,
                 )
-                action = formatter.get_review_action(review, allow_approve=allow_approve)
+                console.print(f"📝 Posted review to GitHub ({action}, {posted} inline comments)")
 
-            posted = gh.post_review(
-                pr,
-                body,
-                action,
-                inline_findings=postable_inline_findings or None,
+                if delta.fixed_findings:
+                    console.print(
+                        f"✅ Marking {len(delta.fixed_findings)} fixed issues as resolved..."
+                    )
+                    resolved = gh.resolve_fixed_comments(pr, delta)
+                    console.print(f"   Resolved {resolved} comments")
+
+                # Final status
+                if delta.all_issues_resolved:
+                    console.print("\n[green]🎉 All issues resolved! Ready to merge.[/green]")
+                elif delta.previous_comments:
+                    open_count = len(delta.open_findings) + len(delta.new_findings)
+                    console.print(f"\n[yellow]⚠️  {open_count} issues remaining[/yellow]")
+
+            # Doc review (runs for github output after the main review)
+            _run_doc_review(
+                gh=gh,
+                pr=pr,
+                repo=repo,
+                config=config,
+                doc_check=doc_check,
+                dry_run=dry_run,
             )
-            console.print(f"📝 Posted review to GitHub ({action}, {posted} inline comments)")
-
-            if delta.fixed_findings:
-                console.print(f"✅ Marking {len(delta.fixed_findings)} fixed issues as resolved...")
-                resolved = gh.resolve_fixed_comments(pr, delta)
-                console.print(f"   Resolved {resolved} comments")
-
-            # Final status
-            if delta.all_issues_resolved:
-                console.print("\n[green]🎉 All issues resolved! Ready to merge.[/green]")
-            elif delta.previous_comments:
-                open_count = len(delta.open_findings) + len(delta.new_findings)
-                console.print(f"\n[yellow]⚠️  {open_count} issues remaining[/yellow]")
-
-        # Doc review (runs for github output after the main review)
-        _run_doc_review(
-            gh=gh,
-            pr=pr,
-            repo=repo,
-            config=config,
-            doc_check=doc_check,
-            dry_run=dry_run,
-        )
+
+    finally:
+        if gh is not None:
+            gh.close()
 
 
 def _run_doc_review(
@@ -506,7 +520,7 @@ def _run_doc_review(
         return
 
     # Build changed paths with status from PR files
-    pr_files = list(pr.get_files())
+    pr_files = gh.get_pr_files(pr)
     changed_paths = [f.filename for f in pr_files]
     changed_paths_with_status = {f.filename: getattr(f, "status", "modified") for f in pr_files}
 
@@ -608,18 +622,18 @@ async def _update_docs_async(
         console.print("[red]error:[/red] ANTHROPIC_API_KEY not set")
         raise RuntimeError("ANTHROPIC_API_KEY not set")
 
-    gh = GitHubClient(config.github.token)
     console.print(f"📄 Fetching PR #{pr_number} from [bold]{repo}[/bold]...")
 
-    result = await run_doc_update(
-        repo=repo,
-        pr_number=pr_number,
-        gh=gh,
-        anthropic_cfg=config.anthropic,
-        doc_generation=config.doc_generation,
-        base=base,
-        dry_run=dry_run,
-    )
+    with GitHubClient(config.github.token) as gh:
+        result = await run_doc_update(
+            repo=repo,
+            pr_number=pr_number,
+            gh=gh,
+            anthropic_cfg=config.anthropic,
+            doc_generation=config.doc_generation,
+            base=base,
+            dry_run=dry_run,
+        )
 
     if result.skipped:
         for d in result.failed:
@@ -38,6 +38,8 @@ class AnthropicApiConfig:
     max_combined_context_tokens: int = 80_000
     per_file_max_bytes: int = 512 * 1024
     per_review_github_request_budget: int = 200
+    # Messages API requests a review's agents may have in flight at once
+    max_concurrent_requests: int = 4
 
 
 @dataclass
@@ -221,8 +223,15 @@ def _parse_config(raw: dict[str, Any]) -> Config:
         max_combined_context_tokens=anthropic_raw.get("max_combined_context_tokens", 80_000),
         per_file_max_bytes=anthropic_raw.get("per_file_max_bytes", 512 * 1024),
         per_review_github_request_budget=anthropic_raw.get("per_review_github_request_budget", 200),
+        max_concurrent_requests=anthropic_raw.get("max_concurrent_requests", 4),
     )
 
+    if anthropic.max_concurrent_requests < 1:
+        raise ValueError(
+            "anthropic.max_concurrent_requests must be at least 1, "
+            f"got {anthropic.max_concurrent_requests}"
+        )
+
     # GitHub config
     github_raw = raw.get("github", {})
     github = GitHubConfig(
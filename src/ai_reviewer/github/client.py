@@ -9,19 +9,27 @@ import json
 import logging
 import os
 import re
+import threading
 import time
+from bisect import bisect_left
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 import requests
 import yaml
 from github import Github
+from github.ContentFile import ContentFile
 from github.GithubException import GithubException
 from github.PullRequest import PullRequest, ReviewComment
 from github.PullRequestComment import PullRequestComment
 from github.Repository import Repository
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ai_reviewer.models.context import ReviewContext
 from ai_reviewer.models.findings import ConsolidatedFinding, Severity, compute_fuzzy_hash
@@ -39,12 +47,16 @@ _USER_FETCH_FAILED = "__FETCH_FAILED__"
 # (used to suppress low-severity findings that re-appear on already-fixed lines).
 _FIX_ZONE_TOLERANCE = 3
 
+# Previous comments within this many lines of a modified line count as touched
+# by the change (and are candidates for "no longer detected").
+_MODIFIED_RANGE_TOLERANCE = 3
+
 
 def _raise_if_forbidden(exc: Exception) -> None:
     """Re-raise 403 Forbidden immediately — it won't resolve on retry.
 
     Handles both PyGithub GithubException (REST calls via PyGithub) and
-    requests.HTTPError (direct requests.post calls, e.g. GraphQL endpoint).
+    requests.HTTPError (direct session calls, e.g. GraphQL endpoint).
     """
     if isinstance(exc, GithubException) and exc.status == 403:
         raise PermissionError("GitHub REST API 403 Forbidden — check token scopes") from exc
@@ -54,8 +66,105 @@ def _raise_if_forbidden(exc: Exception) -> None:
             raise PermissionError("GitHub GraphQL 403 Forbidden") from exc
 
 
+# Changed files whose contents the reviewer cannot meaningfully analyze
+# (binaries, lockfiles, minified/generated assets).  Matched case-insensitively
+# against the end of the path so compound suffixes like ".min.js" work.
+_SKIP_CONTENT_SUFFIXES = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".ico",
+    ".webp",
+    ".pdf",
+    ".zip",
+    ".gz",
+    ".tar",
+    ".jar",
+    ".woff",
+    ".woff2",
+    ".ttf",
+    ".eot",
+    ".so",
+    ".dll",
+    ".exe",
+    ".pyc",
+    ".lock",
+    ".map",
+    ".min.js",
+    ".min.css",
+)
+_SKIP_CONTENT_FILENAMES = frozenset({"package-lock.json", "npm-shrinkwrap.json", "pnpm-lock.yaml"})
+# Files with more changed lines than this are treated as generated and not fetched.
+_MAX_FILE_CHANGES = 5000
+
+
+def _should_skip_content(filename: str, changes: int) -> bool:
+    """Return True when a changed file's contents are not worth fetching."""
+    lowered = filename.lower()
+    if lowered.endswith(_SKIP_CONTENT_SUFFIXES):
+        return True
+    if lowered.rsplit("/", 1)[-1] in _SKIP_CONTENT_FILENAMES:
+        return True
+    return changes > _MAX_FILE_CHANGES
+
+
+def _file_diff(file) -> str:
+    """Format one PR file as a unified diff chunk (header + patch + trailing newline)."""
+    name = file.filename
+    return f"diff --git a/{name} b/{name}\n--- a/{name}\n+++ b/{name}\n{file.patch}\n"
+
+
+def _wants_content(file) -> bool:
+    """Return True if a PR file's head contents should be fetched for review."""
+    if file.status == "removed":
+        return False
+    if _should_skip_content(file.filename, file.changes):
+        logger.debug(f"Skipping contents of {file.filename} (binary, lockfile or too large)")
+        return False
+    return True
+
+
 _RESOLVE_COMMENT_DELAY_S: float = float(os.environ.get("AI_REVIEWER_RESOLVE_DELAY", "0.2"))
 _MAX_RESOLVE_COMMENTS: int = int(os.environ.get("AI_REVIEWER_MAX_RESOLVE", "100"))
+# Aliased resolveReviewThread mutations per GraphQL request (keeps node cost bounded)
+_MAX_RESOLVE_BATCH = 50
+# Concurrent reply posts in resolve_fixed_comments
+_RESOLVE_WORKERS = 4
+# Concurrent file-content GETs in get_changed_files / load_pr_artifacts
+_CONTENT_FETCH_WORKERS = 8
+# Aliased blob lookups per GraphQL query when batch-fetching file contents
+_MAX_BLOB_BATCH = 50
+# Items per page for PyGithub listings (GitHub's maximum; the default is 30)
+_PAGE_SIZE = 100
+# Keep-alive connections PyGithub pools; covers the concurrent fetch/reply workers
+_GITHUB_POOL_SIZE = 16
+
+# Repository language stats change rarely; reuse them across PRs for this long.
+# Process-wide so webhook events (one client each) share it: (token key, repo) ->
+# (fetched at, languages).
+_LANGUAGES_TTL_S = 600.0
+_LANGUAGES_CACHE: OrderedDict[tuple[str, str], tuple[float, list[str]]] = OrderedDict()
+_LANGUAGES_CACHE_MAX = 256
+_LANGUAGES_LOCK = threading.Lock()
+
+# Client-side budget for bursts of write calls (replies, reactions), well under
+# GitHub's secondary rate limits.
+_WRITE_RATE_PER_S = 10.0
+_WRITE_BURST = 20
+# When fewer primary-quota requests than this remain, spread the rest until reset
+_RATE_LIMIT_LOW_WATERMARK = 50
+_MAX_RATE_LIMIT_PAUSE_S = 60.0
+
+# Process-wide ETag cache for conditional REST GETs: (token key, url, accept) ->
+# (etag, body). Shared across clients so webhook events for the same PR reuse it.
+# Bounded by entry count and by total body size, since cached PR diffs can be
+# megabytes each; a body larger than the whole size budget is never cached.
+_ETAG_CACHE: OrderedDict[tuple[str, str, str], tuple[str, str]] = OrderedDict()
+_ETAG_CACHE_MAX = 256
+_ETAG_CACHE_MAX_CHARS = 16 * 1024 * 1024
+_ETAG_LOCK = threading.Lock()
+
 _NO_LONGER_DETECTED_REPLY = (
     "✅ **No longer detected** - This issue was not re-detected after the latest changes."
 )
@@ -67,8 +176,30 @@ _RESOLVED_REPLY_MARKERS = (
 )
 
 
+# One alternation scans the body once instead of once per marker.
+_RESOLVED_REPLY_RE = re.compile("|".join(re.escape(m) for m in _RESOLVED_REPLY_MARKERS))
+
+
 def _is_resolved_reply(body: str) -> bool:
-    return any(marker in body for marker in _RESOLVED_REPLY_MARKERS)
+    return _RESOLVED_REPLY_RE.search(body) is not None
+
+
+def _is_allowed_author(author: dict | None, allowed_users: set[str]) -> bool:
+    """Check a GraphQL comment author against the allowed AI reviewer users.
+
+    GraphQL reports bot authors without the ``[bot]`` suffix that REST uses
+    (``github-actions`` vs ``github-actions[bot]``), so the suffixed form is
+    accepted only when the author really is a ``Bot``; a user account with the
+    app's slug as its login does not match.
+    """
+    if not author:
+        return False
+    login = author.get("login")
+    if not login:
+        return False
+    if login in allowed_users:
+        return True
+    return author.get("__typename") == "Bot" and f"{login}[bot]" in allowed_users
 
 
 _SEVERITY_ORDER: list[Severity] = [
@@ -79,6 +210,38 @@ _SEVERITY_ORDER: list[Severity] = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def _normalize_title(title: str) -> str:
+    """Normalize a title for comparison (lowercase, stripped).
+
+    Memoized because ``compute_review_delta`` normalizes the same titles for
+    every previous comment and current finding.
+    """
+    return title.lower().strip()
+
+
+def _merge_line_ranges(lines: set[int], tolerance: int) -> list[tuple[int, int]]:
+    """Collapse line numbers into sorted, non-overlapping ranges widened by *tolerance*.
+
+    Each range ``(lo, hi)`` is inclusive; adjacent or overlapping windows are merged
+    so a lookup only needs one binary search (see ``_line_in_ranges``).
+    """
+    ranges: list[tuple[int, int]] = []
+    for line in sorted(lines):
+        lo, hi = line - tolerance, line + tolerance
+        if ranges and lo <= ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], hi)
+        else:
+            ranges.append((lo, hi))
+    return ranges
+
+
+def _line_in_ranges(line: int, ranges: list[tuple[int, int]]) -> bool:
+    """Return True if *line* falls inside one of the sorted inclusive *ranges*."""
+    i = bisect_left(ranges, line, key=itemgetter(1))
+    return i < len(ranges) and ranges[i][0] <= line
+
+
 def _parse_severity(severity_str: str) -> Severity | None:
     """Convert a severity string (from a previous comment) to a Severity enum.
 
@@ -102,6 +265,20 @@ def compute_findings_hash(finding_hashes: list[str]) -> str:
 
 
 _REVIEW_META_RE = re.compile(r"<!-- ai-reviewer-meta: ({.*?}) -->")
+# Severity prefix of inline comments, and the reverse lookup used to recover a
+# previous comment's severity.
+_SEVERITY_EMOJI = {
+    "critical": "🔴",
+    "warning": "🟡",
+    "suggestion": "💡",
+    "nitpick": "📝",
+}
+_DEFAULT_SEVERITY_EMOJI = "ℹ️"
+_EMOJI_TO_SEVERITY = {emoji: sev for sev, emoji in _SEVERITY_EMOJI.items()}
+_SEVERITY_EMOJI_RE = re.compile("|".join(map(re.escape, _EMOJI_TO_SEVERITY)))
+_SEVERITY_SCAN_CHARS = 256
+_TITLE_RE = re.compile(r"\*\*([^*]+)\*\*")
+_FINDING_HASH_RE = re.compile(r"<!-- ai-reviewer-id: ([a-f0-9]{12}) -->")
 
 
 @dataclass
@@ -216,7 +393,7 @@ def apply_comment_limits(
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubConfig:
     """Configuration for GitHub client."""
 
@@ -224,7 +401,7 @@ class GitHubConfig:
     base_url: str | None = None  # For GitHub Enterprise
 
 
-@dataclass
+@dataclass(slots=True)
 class PreviousComment:
     """Represents a previous review comment from the AI reviewer."""
 
@@ -248,7 +425,7 @@ class PreviousComment:
         return compute_fuzzy_hash(self.file_path, self.title)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewDelta:
     """Tracks changes between review runs."""
 
@@ -368,6 +545,66 @@ def should_skip_before_agents(
     return None
 
 
+class _RateBudget:
+    """Thread-safe token bucket pacing outbound GitHub calls.
+
+    ``acquire`` takes one token, sleeping for the deficit when the bucket is
+    empty. ``pause`` blocks every caller until a deadline, e.g. after GitHub
+    signals ``Retry-After`` or a nearly exhausted quota.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int) -> None:
+        self._rate = rate_per_sec
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a call may be made, then consume one token."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            wait = max(0.0, self._paused_until - now)
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self._rate)
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for *seconds* from now (never shortens a pause)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _rate_limit_pause(response: requests.Response) -> float:
+    """Seconds to back off based on a response's rate-limit headers (0 if none)."""
+    headers = response.headers
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), _MAX_RATE_LIMIT_PAUSE_S)
+        except ValueError:
+            return 0.0
+
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return 0.0
+    try:
+        remaining_n = int(remaining)
+        until_reset = float(reset) - time.time()
+    except ValueError:
+        return 0.0
+    if remaining_n >= _RATE_LIMIT_LOW_WATERMARK or until_reset <= 0:
+        return 0.0
+    # Spread the remaining quota evenly over the window until reset.
+    return min(until_reset / max(remaining_n, 1), _MAX_RATE_LIMIT_PAUSE_S)
+
+
 class GitHubClient:
     """Client for GitHub API operations."""
 
@@ -385,26 +622,93 @@ class GitHubClient:
             extra_reviewer_users: Additional bot/user logins to treat as AI reviewer accounts
         """
         self._token = token
+        # Partitions the shared ETag cache per credential without keeping the token itself.
+        self._token_key = hashlib.sha256(token.encode()).hexdigest()[:16]
         self._base_url = base_url
         self._current_user_login: str | None = None
         self._allowed_users: set[str] | None = None
         self._extra_reviewer_users: set[str] = set(extra_reviewer_users or [])
         self._previous_comments_cache: OrderedDict[int, list[PreviousComment]] = OrderedDict()
         self._previous_comments_cache_max = 50
-
+        self._repo_cache: OrderedDict[str, Repository] = OrderedDict()
+        self._repo_cache_max = 32
+        # Keyed by (PR number, head SHA) so a push between calls is never served stale files.
+        self._pr_files_cache: OrderedDict[tuple[int, str], list] = OrderedDict()
+        self._pr_files_cache_max = 50
+        self._review_comments_cache: OrderedDict[int, list[PullRequestComment]] = OrderedDict()
+        self._review_comments_cache_max = 50
+        # Raw GraphQL review threads from get_previous_review_comments, reused by
+        # resolve_fixed_comments for the comment -> thread mapping.
+        self._review_threads_cache: OrderedDict[int, list[dict]] = OrderedDict()
+        self._review_threads_cache_max = 50
+
+        # pool_size makes PyGithub keep a pooled keep-alive session sized for our
+        # worker pools instead of re-handshaking TLS on concurrent calls.
         if base_url:
-            self._gh = Github(token, base_url=base_url)
+            self._gh = Github(
+                token, base_url=base_url, per_page=_PAGE_SIZE, pool_size=_GITHUB_POOL_SIZE
+            )
         else:
-            self._gh = Github(token)
+            self._gh = Github(token, per_page=_PAGE_SIZE, pool_size=_GITHUB_POOL_SIZE)
+
+        # Persistent session for direct API calls (GraphQL, raw diff) so they
+        # reuse pooled keep-alive connections.
+        self._http = requests.Session()
+        self._http.headers.update(
+            {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+        )
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        self._http.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        )
+
+        # Shared pacing for concurrent write calls; also slowed down by the
+        # rate-limit headers GitHub returns on direct session requests.
+        self._rate = _RateBudget(_WRITE_RATE_PER_S, _WRITE_BURST)
+        self._http.hooks["response"].append(self._observe_rate_limit)
+
+    def _observe_rate_limit(self, response: requests.Response, *args, **kwargs) -> None:
+        """Session response hook: back off when GitHub reports a low quota."""
+        pause = _rate_limit_pause(response)
+        if pause > 0:
+            logger.warning("GitHub rate limit is low; pausing calls for %.1fs", pause)
+            self._rate.pause(pause)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by this client.
+
+        Drops the rate-limit response hook first so the session no longer
+        references this client, then closes both the raw session and
+        PyGithub's connection pool.
+        """
+        self._http.hooks["response"].clear()
+        self._http.close()
+        self._gh.close()
+
+    def __enter__(self) -> GitHubClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def get_tree(self, repo_name: str, sha: str, *, recursive: bool = True):
         """Get the git tree for a commit SHA."""
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         return repo.get_git_tree(sha, recursive=recursive)
 
     def get_file_contents(self, repo_name: str, path: str, ref: str):
         """Get file contents at a specific ref."""
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         return repo.get_contents(path, ref=ref)
 
     def _get_current_user_login(self) -> str | None:
@@ -452,7 +756,15 @@ class GitHubClient:
         Returns:
             Repository object
         """
-        return self._gh.get_repo(repo_name)
+        repo = self._repo_cache.get(repo_name)
+        if repo is not None:
+            self._repo_cache.move_to_end(repo_name)
+            return repo
+        repo = self._gh.get_repo(repo_name)
+        self._repo_cache[repo_name] = repo
+        if len(self._repo_cache) > self._repo_cache_max:
+            self._repo_cache.popitem(last=False)
+        return repo
 
     def get_pull_request(self, repo_name: str, pr_number: int) -> PullRequest:
         """Get a pull request.
@@ -467,27 +779,135 @@ class GitHubClient:
         repo = self.get_repo(repo_name)
         return repo.get_pull(pr_number)
 
+    def get_pr_files(self, pr: PullRequest) -> list:
+        """Get the PR's changed files, fetching the paginated list once per head commit.
+
+        Args:
+            pr: Pull request object
+
+        Returns:
+            List of PullRequest file objects
+        """
+        key = (pr.number, pr.head.sha)
+        files = self._pr_files_cache.get(key)
+        if files is not None:
+            self._pr_files_cache.move_to_end(key)
+            return files
+        files = list(pr.get_files())
+        # Listings for earlier pushes to this PR are never read again
+        for stale in [k for k in self._pr_files_cache if k[0] == pr.number]:
+            del self._pr_files_cache[stale]
+        self._pr_files_cache[key] = files
+        if len(self._pr_files_cache) > self._pr_files_cache_max:
+            self._pr_files_cache.popitem(last=False)
+        return files
+
+    def _get_review_comments(self, pr: PullRequest) -> list[PullRequestComment]:
+        """Get all review comments on a PR, paginating through them once per PR.
+
+        Args:
+            pr: Pull request object
+
+        Returns:
+            List of review comments
+        """
+        comments = self._review_comments_cache.get(pr.number)
+        if comments is not None:
+            self._review_comments_cache.move_to_end(pr.number)
+            return comments
+        comments = list(pr.get_review_comments())
+        self._review_comments_cache[pr.number] = comments
+        if len(self._review_comments_cache) > self._review_comments_cache_max:
+            self._review_comments_cache.popitem(last=False)
+        return comments
+
     def get_pr_diff(self, pr: PullRequest) -> str:
         """Get the unified diff for a PR.
 
+        Uses GitHub's diff media type (one request); falls back to rebuilding
+        the diff from the per-file patches when that fails (e.g. 406 for very
+        large diffs).
+
         Args:
             pr: Pull request object
 
         Returns:
             Unified diff string
         """
-        files = pr.get_files()
-        diff_parts = []
+        raw = self._get_raw_diff(pr.base.repo.full_name, pr.number)
+        if raw is not None:
+            return raw
+        # Each chunk ends in a newline; joining with "\n" keeps a blank line between files.
+        return "\n".join([_file_diff(f) for f in self.get_pr_files(pr) if f.patch])
 
-        for file in files:
-            if file.patch:
-                diff_parts.append(f"diff --git a/{file.filename} b/{file.filename}")
-                diff_parts.append(f"--- a/{file.filename}")
-                diff_parts.append(f"+++ b/{file.filename}")
-                diff_parts.append(file.patch)
-                diff_parts.append("")
+    def _rest_url(self, path: str) -> str:
+        """Absolute REST API URL for a path starting with "/"."""
+        return (self._base_url or "https://api.github.com").rstrip("/") + path
 
-        return "\n".join(diff_parts)
+    def _conditional_get(self, path: str, accept: str) -> str:
+        """GET a REST API path, revalidating a cached body with its ETag.
+
+        A 304 answer doesn't count against the primary rate limit and carries
+        no body, so unchanged resources are served from ``_ETAG_CACHE``.
+
+        Args:
+            path: API path starting with "/" (e.g. "/repos/o/r/languages")
+            accept: Accept header (media type) for the request
+
+        Returns:
+            Response body text
+
+        Raises:
+            requests.RequestException: On connection errors or non-2xx/304 status
+        """
+        url = self._rest_url(path)
+        key = (self._token_key, url, accept)
+        headers = {"Accept": accept}
+        with _ETAG_LOCK:
+            cached = _ETAG_CACHE.get(key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = self._http.get(url, headers=headers, timeout=30)
+        if response.status_code == 304 and cached is not None:
+            with _ETAG_LOCK:
+                if key in _ETAG_CACHE:
+                    _ETAG_CACHE.move_to_end(key)
+            return cached[1]
+        response.raise_for_status()
+
+        body = response.text
+        etag = response.headers.get("ETag")
+        if etag and len(body) <= _ETAG_CACHE_MAX_CHARS:
+            with _ETAG_LOCK:
+                _ETAG_CACHE[key] = (etag, body)
+                _ETAG_CACHE.move_to_end(key)
+                total = sum(len(cached_body) for _, cached_body in _ETAG_CACHE.values())
+                while len(_ETAG_CACHE) > _ETAG_CACHE_MAX or total > _ETAG_CACHE_MAX_CHARS:
+                    _, (_, evicted) = _ETAG_CACHE.popitem(last=False)
+                    total -= len(evicted)
+        return body
+
+    def _get_raw_diff(self, repo_name: str, pr_number: int) -> str | None:
+        """Fetch a PR's unified diff in a single request via the diff media type.
+
+        Args:
+            repo_name: Repository in "owner/name" format
+            pr_number: Pull request number
+
+        Returns:
+            Diff text, or None if the request failed
+        """
+        try:
+            return self._conditional_get(
+                f"/repos/{repo_name}/pulls/{pr_number}", "application/vnd.github.v3.diff"
+            )
+        except Exception as e:
+            _raise_if_forbidden(e)
+            logger.debug(
+                "Raw diff fetch failed for PR #%s, rebuilding from patches: %s", pr_number, e
+            )
+            return None
 
     def get_changed_files(self, pr: PullRequest) -> dict[str, str]:
         """Get the contents of changed files.
@@ -495,25 +915,123 @@ class GitHubClient:
         Args:
             pr: Pull request object
 
+        Binary assets, lockfiles and very large (likely generated) files are
+        skipped before fetching; their changes are still visible in the diff.
+
         Returns:
             Dict mapping file paths to their contents
         """
-        files = {}
+        filenames = [f.filename for f in self.get_pr_files(pr) if _wants_content(f)]
+        return self._fetch_file_contents(pr, filenames)
+
+    def load_pr_artifacts(self, pr: PullRequest) -> tuple[str, dict[str, str]]:
+        """Get a PR's unified diff and changed-file contents in one pass over its files.
+
+        Equivalent to calling ``get_pr_diff`` and ``get_changed_files``.
+
+        Args:
+            pr: Pull request object
+
+        Returns:
+            Tuple of (unified diff string, dict mapping file paths to contents)
+        """
+        raw = self._get_raw_diff(pr.base.repo.full_name, pr.number)
+        diff_chunks: list[str] = []
+        filenames: list[str] = []
+        for f in self.get_pr_files(pr):
+            if raw is None and f.patch:
+                diff_chunks.append(_file_diff(f))
+            if _wants_content(f):
+                filenames.append(f.filename)
+
+        diff = raw if raw is not None else "\n".join(diff_chunks)
+        return diff, self._fetch_file_contents(pr, filenames)
+
+    def _fetch_file_contents(self, pr: PullRequest, filenames: list[str]) -> dict[str, str]:
+        """Fetch the head-revision contents of the given files.
+
+        Args:
+            pr: Pull request object
+            filenames: Paths to fetch
+
+        Returns:
+            Dict mapping file paths to their contents (unreadable files omitted)
+        """
+        if not filenames:
+            return {}
+
         repo = pr.base.repo
+        ref = pr.head.sha
 
-        for file in pr.get_files():
-            if file.status == "removed":
-                continue
+        # Text blobs come back from one aliased GraphQL query per batch; only
+        # binary, truncated or otherwise missing files need a REST GET each.
+        texts: dict[str, str] = {}
+        try:
+            texts = self._fetch_blob_texts(repo.full_name, ref, filenames)
+        except Exception as e:
+            _raise_if_forbidden(e)
+            logger.warning(f"Could not batch-fetch file contents via GraphQL: {e}")
+        missing = [name for name in filenames if name not in texts]
 
+        def fetch(filename: str) -> str | None:
             try:
-                content = repo.get_contents(file.filename, ref=pr.head.sha)
-                if hasattr(content, "decoded_content"):
-                    files[file.filename] = content.decoded_content.decode("utf-8")
+                content = repo.get_contents(filename, ref=ref)
+                # A list means the path is a directory; only files have content.
+                if isinstance(content, ContentFile):
+                    return content.decoded_content.decode("utf-8")
             except Exception as e:
                 _raise_if_forbidden(e)
-                logger.warning(f"Could not fetch {file.filename}: {e}")
+                logger.warning(f"Could not fetch {filename}: {e}")
+            return None
 
-        return files
+        # Each fetch is an independent GET; overlap them on a small pool.
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(_CONTENT_FETCH_WORKERS, len(missing))) as pool:
+                for name, text in zip(missing, pool.map(fetch, missing), strict=True):
+                    if text is not None:
+                        texts[name] = text
+
+        return {name: texts[name] for name in filenames if name in texts}
+
+    def _fetch_blob_texts(self, repo_name: str, ref: str, paths: list[str]) -> dict[str, str]:
+        """Fetch text file contents at *ref* with batched, aliased GraphQL queries.
+
+        Args:
+            repo_name: Repository in "owner/name" format
+            ref: Commit SHA (or other revision) to read from
+            paths: File paths to fetch
+
+        Returns:
+            Dict mapping paths to their text. Binary, truncated or missing
+            blobs, and every path in a failed batch, are left out so the caller
+            can fall back to REST for them.
+        """
+        owner, name = repo_name.split("/", 1)
+        texts: dict[str, str] = {}
+
+        for start in range(0, len(paths), _MAX_BLOB_BATCH):
+            batch = paths[start : start + _MAX_BLOB_BATCH]
+            params = " ".join(f"$e{i}: String!" for i in range(len(batch)))
+            fields = " ".join(
+                f"f{i}: object(expression: $e{i}) {{ ... on Blob {{ text isBinary isTruncated }} }}"
+                for i in range(len(batch))
+            )
+            query = (
+                f"query($owner: String!, $name: String!, {params}) {{ "
+                f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            variables: dict[str, object] = {"owner": owner, "name": name}
+            variables.update({f"e{i}": f"{ref}:{path}" for i, path in enumerate(batch)})
+
+            data = self._graphql_request(query, variables)
+            repo_data = (data or {}).get("repository") or {}
+            for i, path in enumerate(batch):
+                blob = repo_data.get(f"f{i}") or {}
+                text = blob.get("text")
+                if text is not None and not blob.get("isBinary") and not blob.get("isTruncated"):
+                    texts[path] = text
+
+        return texts
 
     def build_review_context(self, pr: PullRequest, repo: Repository) -> ReviewContext:
         """Build review context from a PR.
@@ -525,8 +1043,9 @@ class GitHubClient:
         Returns:
             ReviewContext with PR information
         """
-        labels = [label.name for label in pr.get_labels()]
-        languages = list(repo.get_languages().keys())
+        # pr.labels comes with the PR payload; get_labels() would re-fetch them.
+        labels = [label.name for label in pr.labels]
+        languages = self._get_repo_languages(repo)
 
         return ReviewContext(
             repo_name=repo.full_name,
@@ -543,6 +1062,37 @@ class GitHubClient:
             repo_languages=languages,
         )
 
+    def _get_repo_languages(self, repo: Repository) -> list[str]:
+        """Get a repository's languages, cached for ``_LANGUAGES_TTL_S`` seconds.
+
+        Args:
+            repo: Repository object
+
+        Returns:
+            Language names, most-used first
+        """
+        key = (self._token_key, repo.full_name)
+        now = time.monotonic()
+        with _LANGUAGES_LOCK:
+            cached = _LANGUAGES_CACHE.get(key)
+        if cached is not None and now - cached[0] < _LANGUAGES_TTL_S:
+            return list(cached[1])
+        try:
+            body = self._conditional_get(
+                f"/repos/{repo.full_name}/languages", "application/vnd.github+json"
+            )
+            languages = list(json.loads(body).keys())
+        except Exception as e:
+            _raise_if_forbidden(e)
+            logger.debug("Conditional languages fetch failed, using PyGithub: %s", e)
+            languages = list(repo.get_languages().keys())
+        with _LANGUAGES_LOCK:
+            _LANGUAGES_CACHE[key] = (now, languages)
+            _LANGUAGES_CACHE.move_to_end(key)
+            while len(_LANGUAGES_CACHE) > _LANGUAGES_CACHE_MAX:
+                _LANGUAGES_CACHE.popitem(last=False)
+        return list(languages)
+
     _CONVENTION_FILES = [
         "AGENTS.md",
         "CLAUDE.md",
@@ -559,7 +1109,7 @@ class GitHubClient:
         missing or contains invalid YAML.  403 Forbidden is re-raised via
         ``_raise_if_forbidden`` so callers surface permission problems.
         """
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         try:
             content = repo.get_contents(".ai-reviewer.yaml", ref=ref)
             if isinstance(content, list):
@@ -584,7 +1134,7 @@ class GitHubClient:
 
         Returns ``None`` when no convention files are found.
         """
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         parts: list[str] = []
         for path in self._CONVENTION_FILES:
             try:
@@ -714,16 +1264,9 @@ class GitHubClient:
         if not inline_findings:
             return []
 
-        severity_emoji = {
-            "critical": "🔴",
-            "warning": "🟡",
-            "suggestion": "💡",
-            "nitpick": "📝",
-        }
-
         comments: list[ReviewComment] = []
         for finding in inline_findings:
-            emoji = severity_emoji.get(finding.severity.value, "ℹ️")
+            emoji = _SEVERITY_EMOJI.get(finding.severity.value, _DEFAULT_SEVERITY_EMOJI)
             comment_body = f"{emoji} **{finding.title}**\n\n{finding.description}"
             if finding.suggested_fix:
                 comment_body += f"\n\n**Suggested fix:**\n```\n{finding.suggested_fix}\n```"
@@ -750,7 +1293,7 @@ class GitHubClient:
             return []
 
         file_modified_lines: dict[str, set[int]] = {}
-        for pr_file in pr.get_files():
+        for pr_file in self.get_pr_files(pr):
             if pr_file.patch:
                 file_modified_lines[pr_file.filename] = self._parse_modified_lines(pr_file.patch)
 
@@ -908,18 +1451,32 @@ class GitHubClient:
         comments: list[PreviousComment] = []
         allowed_users = self._get_allowed_users()
 
-        for comment in pr.get_review_comments():
-            if _is_resolved_reply(comment.body):
-                continue
+        threads: list[dict] | None = None
+        try:
+            threads = self._fetch_review_threads(pr.base.repo.full_name, pr.number)
+        except Exception as e:
+            _raise_if_forbidden(e)
+            logger.warning(f"Could not fetch review threads via GraphQL: {e}")
+
+        if threads is not None:
+            comments = self._previous_comments_from_threads(threads, allowed_users)
+            self._review_threads_cache[pr.number] = threads
+            if len(self._review_threads_cache) > self._review_threads_cache_max:
+                self._review_threads_cache.popitem(last=False)
+        else:
+            # REST fallback: pages through every user's comments.
+            for comment in self._get_review_comments(pr):
+                if _is_resolved_reply(comment.body):
+                    continue
 
-            user_login = comment.user.login
+                user_login = comment.user.login
 
-            if user_login not in allowed_users:
-                continue
+                if user_login not in allowed_users:
+                    continue
 
-            parsed = self._parse_review_comment(comment)
-            if parsed:
-                comments.append(parsed)
+                parsed = self._parse_review_comment(comment)
+                if parsed:
+                    comments.append(parsed)
 
         logger.info(f"Found {len(comments)} previous AI review comments")
         self._previous_comments_cache[pr.number] = comments
@@ -927,6 +1484,38 @@ class GitHubClient:
             self._previous_comments_cache.popitem(last=False)
         return comments
 
+    def _previous_comments_from_threads(
+        self, threads: list[dict], allowed_users: set[str]
+    ) -> list[PreviousComment]:
+        """Parse AI reviewer comments out of GraphQL review thread nodes.
+
+        Comments in resolved threads are kept, like the REST fallback keeps
+        them, so a finding that is detected again still matches its earlier
+        comment; the thread state is carried in ``is_resolved``.
+        """
+        comments: list[PreviousComment] = []
+        for thread in threads:
+            is_resolved = bool(thread.get("isResolved"))
+            for node in (thread.get("comments") or {}).get("nodes") or []:
+                body = node.get("body") or ""
+                if _is_resolved_reply(body):
+                    continue
+                if not _is_allowed_author(node.get("author"), allowed_users):
+                    continue
+                comment_id = node.get("databaseId")
+                if not comment_id:
+                    continue
+                parsed = self._parse_comment_body(
+                    comment_id=comment_id,
+                    path=node.get("path") or "",
+                    line=node.get("line") or node.get("originalLine") or 0,
+                    body=body,
+                    is_resolved=is_resolved,
+                )
+                if parsed:
+                    comments.append(parsed)
+        return comments
+
     def _parse_review_comment(self, comment: PullRequestComment) -> PreviousComment | None:
         """Parse a review comment to extract structured data.
 
@@ -936,38 +1525,54 @@ class GitHubClient:
         Returns:
             Parsed comment or None if not parseable
         """
-        body = comment.body
-
-        # Extract severity from emoji
-        severity_map = {
-            "🔴": "critical",
-            "🟡": "warning",
-            "💡": "suggestion",
-            "📝": "nitpick",
-        }
+        return self._parse_comment_body(
+            comment_id=comment.id,
+            path=comment.path,
+            line=comment.line or comment.original_line or 0,
+            body=comment.body,
+        )
 
-        severity = "unknown"
-        for emoji, sev in severity_map.items():
-            if emoji in body:
-                severity = sev
-                break
+    def _parse_comment_body(
+        self, comment_id: int, path: str, line: int, body: str, is_resolved: bool = False
+    ) -> PreviousComment | None:
+        """Parse the body of an AI reviewer comment into a PreviousComment.
+
+        Args:
+            comment_id: Database ID of the review comment
+            path: File path the comment is attached to
+            line: Line number in the new file (0 when unknown)
+            body: Markdown body of the comment
+            is_resolved: Whether the comment's review thread is resolved (only
+                known from GraphQL; REST comments default to False)
+
+        Returns:
+            Parsed comment or None if not parseable
+        """
+
+        # Every AI finding has a **Title**; anything else isn't ours to track.
+        if "**" not in body:
+            return None
+
+        # Extract severity from emoji (always at the start of AI comments)
+        emoji_match = _SEVERITY_EMOJI_RE.search(body, 0, _SEVERITY_SCAN_CHARS)
+        severity = _EMOJI_TO_SEVERITY[emoji_match.group(0)] if emoji_match else "unknown"
 
         # Extract title from **Title** pattern
-        title_match = re.search(r"\*\*([^*]+)\*\*", body)
+        title_match = _TITLE_RE.search(body)
         title = title_match.group(1) if title_match else "Unknown Issue"
 
         # Extract embedded hash for stable cross-run matching
-        hash_match = re.search(r"<!-- ai-reviewer-id: ([a-f0-9]{12}) -->", body)
+        hash_match = _FINDING_HASH_RE.search(body)
         finding_hash = hash_match.group(1) if hash_match else None
 
         return PreviousComment(
-            id=comment.id,
-            file_path=comment.path,
-            line=comment.line or comment.original_line or 0,
+            id=comment_id,
+            file_path=path,
+            line=line,
             title=title,
             severity=severity,
             body=body,
-            is_resolved=False,  # GitHub API doesn't expose this directly
+            is_resolved=is_resolved,
             finding_hash=finding_hash,
         )
 
@@ -976,6 +1581,7 @@ class GitHubClient:
         pr: PullRequest,
         current_findings: list[ConsolidatedFinding],
         review_count: int | None = None,
+        fetch_previous: bool = True,
     ) -> ReviewDelta:
         """Compare current findings with previous comments to compute delta.
 
@@ -984,10 +1590,17 @@ class GitHubClient:
             current_findings: Current review findings
             review_count: Accurate review count from metadata. When ``None``,
                 falls back to ``estimate_review_count()`` heuristic.
+            fetch_previous: When ``False`` and there are no current findings,
+                return an empty delta without fetching previous comments.
+                Callers that need fixed-findings tracking must leave this on.
 
         Returns:
             ReviewDelta showing new, fixed, and open issues
         """
+        if not fetch_previous and not current_findings:
+            logger.debug("No current findings and previous comments not requested; empty delta")
+            return ReviewDelta()
+
         previous_comments = self.get_previous_review_comments(pr)
         delta = ReviewDelta(previous_comments=previous_comments)
 
@@ -1001,7 +1614,7 @@ class GitHubClient:
             fuzzy = comment.finding_hash_fuzzy
             if fuzzy:
                 fuzzy_lookup[fuzzy] = comment
-            key = (comment.file_path, comment.line, self._normalize_title(comment.title))
+            key = (comment.file_path, comment.line, _normalize_title(comment.title))
             title_lookup[key] = comment
 
         # Track which previous comments are still open
@@ -1023,7 +1636,7 @@ class GitHubClient:
                 if fuzzy_hash is not None:
                     matched_comment = fuzzy_lookup.get(fuzzy_hash)
             if matched_comment is None:
-                key = (finding.file_path, finding.line_start, self._normalize_title(finding.title))
+                key = (finding.file_path, finding.line_start, _normalize_title(finding.title))
                 matched_comment = title_lookup.get(key)
 
             if matched_comment is not None:
@@ -1045,14 +1658,18 @@ class GitHubClient:
         #
         # This avoids false "no longer detected" replies on unmodified code while
         # still detecting actual fixes when the relevant lines were changed.
-        pr_files = list(pr.get_files())
+        pr_files = self.get_pr_files(pr)
         changed_files = {f.filename for f in pr_files}
         removed_files = {f.filename for f in pr_files if getattr(f, "status", None) == "removed"}
 
-        file_modified_lines: dict[str, set[int]] = {}
+        # Modified lines per file as merged, tolerance-widened ranges so each
+        # previous comment is checked with a binary search.
+        file_modified_ranges: dict[str, list[tuple[int, int]]] = {}
         for f in pr_files:
             if f.patch:
-                file_modified_lines[f.filename] = self._parse_modified_lines(f.patch)
+                file_modified_ranges[f.filename] = _merge_line_ranges(
+                    self._parse_modified_lines(f.patch), _MODIFIED_RANGE_TOLERANCE
+                )
 
         for comment in previous_comments:
             if comment.id not in matched_previous:
@@ -1060,10 +1677,11 @@ class GitHubClient:
 
                 if file_path not in changed_files or file_path in removed_files:
                     delta.fixed_findings.append(comment)
-                elif file_path in file_modified_lines:
-                    modified_lines = file_modified_lines[file_path]
-                    if self._is_line_in_modified_range(comment.line, modified_lines):
-                        delta.fixed_findings.append(comment)
+                    continue
+
+                ranges = file_modified_ranges.get(file_path)
+                if ranges is not None and _line_in_ranges(comment.line, ranges):
+                    delta.fixed_findings.append(comment)
 
         # Deduplicate by comment ID to prevent exponential growth on re-reviews
         seen: set[int] = set()
@@ -1110,17 +1728,6 @@ class GitHubClient:
 
         return delta
 
-    def _normalize_title(self, title: str) -> str:
-        """Normalize a title for comparison.
-
-        Args:
-            title: Original title
-
-        Returns:
-            Normalized title (lowercase, stripped)
-        """
-        return title.lower().strip()
-
     def _parse_modified_lines(self, patch: str) -> set[int]:
         """Parse a unified diff patch to extract modified line numbers.
 
@@ -1130,52 +1737,42 @@ class GitHubClient:
         Returns:
             Set of line numbers that were added or modified in the new version
         """
-        modified_lines: set[int] = set()
         if not patch:
-            return modified_lines
+            return set()
 
+        # Appending to a list and building the set once is cheaper than
+        # set.add() per line on large patches.
+        added: list[int] = []
         current_line = 0
         for line in patch.split("\n"):
-            # Parse hunk header: @@ -old_start,old_count +new_start,new_count @@
-            if line.startswith("@@"):
-                # Extract new file line number
-                match = re.search(r"\+(\d+)", line)
-                if match:
-                    current_line = int(match.group(1))
-                continue
-
-            if line.startswith("+") and not line.startswith("+++"):
+            first = line[:1]
+            if first == "+":
                 # Added line in the new file — mark and advance.
-                modified_lines.add(current_line)
+                if not line.startswith("+++"):
+                    added.append(current_line)
                 current_line += 1
-            elif line.startswith("-") and not line.startswith("---"):
+            elif first == "-":
                 # Deleted line: exists only in the old file, has no line number in the
                 # new file. Do NOT mark current_line — marking it caused a off-by-one
                 # where the context line immediately following a deletion was incorrectly
-                # flagged as modified. _is_line_in_modified_range() tolerance handles
+                # flagged as modified. _MODIFIED_RANGE_TOLERANCE handles
                 # proximity detection for the surrounding additions.
-                pass
-            else:
-                # Context line or "\ No newline at end of file" marker.
-                if not line.startswith("\\"):
+                if line.startswith("---"):
                     current_line += 1
+            elif first == "@" and line.startswith("@@"):
+                # Parse hunk header: @@ -old_start,old_count +new_start,new_count @@
+                plus = line.find("+", 2)
+                if plus != -1:
+                    end = plus + 1
+                    while end < len(line) and line[end].isdigit():
+                        end += 1
+                    if end > plus + 1:
+                        current_line = int(line[plus + 1 : end])
+            elif first != "\\":
+                # Context line; "\ No newline at end of file" markers don't advance.
+                current_line += 1
 
-        return modified_lines
-
-    def _is_line_in_modified_range(
-        self, line: int, modified_lines: set[int], tolerance: int = 3
-    ) -> bool:
-        """Check if a line number falls within or near modified lines.
-
-        Args:
-            line: Line number to check
-            modified_lines: Set of modified line numbers
-            tolerance: How many lines away still counts as "near"
-
-        Returns:
-            True if the line is within tolerance of any modified line
-        """
-        return any(abs(line - mod_line) <= tolerance for mod_line in modified_lines)
+        return set(added)
 
     def _graphql_request(self, query: str, variables: dict | None = None) -> dict | None:
         """Make a GraphQL request to GitHub API.
@@ -1195,17 +1792,12 @@ class GitHubClient:
         else:
             graphql_url = "https://api.github.com/graphql"
 
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
-        }
-
         payload: dict[str, object] = {"query": query}
         if variables:
             payload["variables"] = variables
 
         try:
-            response = requests.post(graphql_url, json=payload, headers=headers, timeout=30)
+            response = self._http.post(graphql_url, json=payload, timeout=30)
             response.raise_for_status()
             result = response.json()
 
@@ -1223,7 +1815,115 @@ class GitHubClient:
     # Maximum pages to fetch when paginating GraphQL results (prevents runaway loops)
     _MAX_GRAPHQL_PAGES = 20
 
-    def _fetch_thread_mapping(self, repo_name: str, pr_number: int) -> dict[int, str]:
+    _REVIEW_THREADS_QUERY = """
+    query($owner: String!, $name: String!, $pr_number: Int!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        pullRequest(number: $pr_number) {
+          reviewThreads(first: 100, after: $cursor) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+            nodes {
+              id
+              isResolved
+              comments(first: 100) {
+                nodes {
+                  databaseId
+                  body
+                  path
+                  line
+                  originalLine
+                  author {
+                    __typename
+                    login
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+
+    def _fetch_review_threads(self, repo_name: str, pr_number: int) -> list[dict] | None:
+        """Fetch all review threads of a PR, including their comments, via GraphQL.
+
+        Unlike the REST ``get_review_comments`` listing, each page carries the
+        thread's ``isResolved`` state so callers can skip closed findings
+        without parsing them.
+
+        Args:
+            repo_name: Repository in "owner/name" format
+            pr_number: Pull request number
+
+        Returns:
+            List of raw thread nodes, or None when any page fails (callers
+            should fall back to REST rather than act on a partial listing)
+        """
+        owner, name = repo_name.split("/", 1)
+        threads: list[dict] = []
+        cursor = None
+        pages_fetched = 0
+
+        while pages_fetched < self._MAX_GRAPHQL_PAGES:
+            variables = {
+                "owner": owner,
+                "name": name,
+                "pr_number": pr_number,
+                "cursor": cursor,
+            }
+
+            data = self._graphql_request(self._REVIEW_THREADS_QUERY, variables)
+            if not data:
+                return None
+
+            pages_fetched += 1
+            pr_data = (data.get("repository") or {}).get("pullRequest") or {}
+            threads_data = pr_data.get("reviewThreads") or {}
+            threads.extend(threads_data.get("nodes") or [])
+
+            page_info = threads_data.get("pageInfo") or {}
+            if page_info.get("hasNextPage"):
+                cursor = page_info.get("endCursor")
+            else:
+                break
+
+        if pages_fetched >= self._MAX_GRAPHQL_PAGES:
+            logger.warning(
+                f"Hit max page limit ({self._MAX_GRAPHQL_PAGES}) fetching threads for PR #{pr_number}"
+            )
+
+        return threads
+
+    @staticmethod
+    def _thread_mapping_from_threads(threads: list[dict]) -> dict[int, str]:
+        """Map comment database IDs to their thread ID for unresolved threads.
+
+        Args:
+            threads: Raw review thread nodes (see ``_fetch_review_threads``)
+
+        Returns:
+            Dict mapping comment database IDs to their thread's GraphQL node ID
+        """
+        comment_to_thread: dict[int, str] = {}
+        for thread in threads:
+            thread_id = thread.get("id")
+            if thread.get("isResolved") or not thread_id:
+                continue
+            for comment in (thread.get("comments") or {}).get("nodes") or []:
+                db_id = comment.get("databaseId")
+                if db_id:
+                    comment_to_thread[db_id] = thread_id
+        return comment_to_thread
+
+    def _fetch_thread_mapping(
+        self,
+        repo_name: str,
+        pr_number: int,
+        target_ids: set[int] | None = None,
+    ) -> dict[int, str]:
         """Fetch all review threads and build a mapping of comment_id to thread_id.
 
         This batches the GraphQL calls to avoid N+1 queries when resolving multiple
@@ -1232,6 +1932,8 @@ class GitHubClient:
         Args:
             repo_name: Repository in "owner/name" format
             pr_number: Pull request number
+            target_ids: Optional comment IDs the caller needs. Pagination stops
+                as soon as every one of them has been mapped.
 
         Returns:
             Dict mapping comment database IDs to their thread's GraphQL node ID
@@ -1239,6 +1941,7 @@ class GitHubClient:
         """
         owner, name = repo_name.split("/", 1)
         comment_to_thread: dict[int, str] = {}
+        remaining = set(target_ids) if target_ids is not None else None
 
         query = """
         query($owner: String!, $name: String!, $pr_number: Int!, $cursor: String) {
@@ -1297,6 +2000,14 @@ class GitHubClient:
                     db_id = comment.get("databaseId")
                     if db_id:
                         comment_to_thread[db_id] = thread_id
+                        if remaining is not None:
+                            remaining.discard(db_id)
+
+                if remaining is not None and not remaining:
+                    break
+
+            if remaining is not None and not remaining:
+                break
 
             # Check for more pages
             page_info = threads_data.get("pageInfo", {})
@@ -1312,55 +2023,38 @@ class GitHubClient:
 
         return comment_to_thread
 
-    def _resolve_review_thread(self, thread_id: str) -> bool:
-        """Resolve a review thread using GraphQL.
+    def _resolve_review_threads_bulk(self, thread_ids: list[str]) -> dict[str, bool]:
+        """Resolve several review threads with aliased GraphQL mutations.
 
-        Args:
-            thread_id: The GraphQL node ID of the thread
-
-        Returns:
-            True if successfully resolved
-        """
-        mutation = """
-        mutation($thread_id: ID!) {
-          resolveReviewThread(input: {threadId: $thread_id}) {
-            thread {
-              isResolved
-            }
-          }
-        }
-        """
-
-        data = self._graphql_request(mutation, {"thread_id": thread_id})
-        if data:
-            thread = (data.get("resolveReviewThread") or {}).get("thread") or {}
-            return thread.get("isResolved", False)
-        return False
-
-    def _resolve_thread_for_comment(
-        self,
-        comment_id: int,
-        thread_mapping: dict[int, str],
-    ) -> bool:
-        """Resolve the review thread containing a specific comment.
+        Threads are resolved in batches of ``_MAX_RESOLVE_BATCH`` so that N
+        threads cost ceil(N / 50) round trips instead of N.
 
         Args:
-            comment_id: The comment ID whose thread to resolve
-            thread_mapping: Pre-fetched mapping of comment_id to thread_id
+            thread_ids: GraphQL node IDs of the threads to resolve
 
         Returns:
-            True if thread was resolved
+            Dict mapping each thread ID to whether it is now resolved
         """
-        thread_id = thread_mapping.get(comment_id)
-        if not thread_id:
-            logger.debug(f"Could not find thread for comment {comment_id}")
-            return False
+        results: dict[str, bool] = {}
+        unique_ids = list(dict.fromkeys(thread_ids))
+
+        for start in range(0, len(unique_ids), _MAX_RESOLVE_BATCH):
+            batch = unique_ids[start : start + _MAX_RESOLVE_BATCH]
+            params = ", ".join(f"$t{i}: ID!" for i in range(len(batch)))
+            fields = " ".join(
+                f"r{i}: resolveReviewThread(input: {{threadId: $t{i}}}) {{ thread {{ isResolved }} }}"
+                for i in range(len(batch))
+            )
+            mutation = f"mutation({params}) {{ {fields} }}"
 
-        if self._resolve_review_thread(thread_id):
-            logger.info(f"Resolved thread for comment {comment_id}")
-            return True
+            data = self._graphql_request(
+                mutation, {f"t{i}": thread_id for i, thread_id in enumerate(batch)}
+            )
+            for i, thread_id in enumerate(batch):
+                thread = ((data or {}).get(f"r{i}") or {}).get("thread") or {}
+                results[thread_id] = bool(thread.get("isResolved", False))
 
-        return False
+        return results
 
     def resolve_fixed_comments(self, pr: PullRequest, delta: ReviewDelta) -> int:
         """Mark fixed issues as resolved by replying to them.
@@ -1376,10 +2070,8 @@ class GitHubClient:
             logger.debug("No fixed findings to resolve")
             return 0
 
-        resolved_count = 0
-
         # Fetch comments once and pass to helper to avoid redundant API calls
-        raw_comments = list(pr.get_review_comments())
+        raw_comments = self._get_review_comments(pr)
 
         # Get all existing replies to avoid duplicates
         existing_replies = self._get_resolved_comment_ids(pr, raw_comments)
@@ -1390,9 +2082,6 @@ class GitHubClient:
 
         repo_name = pr.base.repo.full_name
 
-        # Batch-fetch all thread mappings once (avoids N+1 GraphQL calls)
-        thread_mapping = self._fetch_thread_mapping(repo_name, pr.number)
-
         findings_to_process = delta.fixed_findings[:_MAX_RESOLVE_COMMENTS]
         if len(delta.fixed_findings) > _MAX_RESOLVE_COMMENTS:
             logger.warning(
@@ -1401,44 +2090,98 @@ class GitHubClient:
                 len(delta.fixed_findings),
             )
 
+        pending_ids: list[int] = []
         for fixed in findings_to_process:
             # Skip if we've already marked this as no longer detected
             # (avoid duplicate replies on re-review)
             if fixed.id in existing_replies:
                 logger.debug(f"Comment {fixed.id} already has resolved reply, skipping")
                 continue
+            pending_ids.append(fixed.id)
 
-            try:
-                # Find the comment and reply to it
-                comment = pr.get_review_comment(fixed.id)
+        if not pending_ids:
+            return 0
 
-                # Add reaction (may already exist, that's ok)
-                with contextlib.suppress(Exception):
-                    comment.create_reaction("hooray")  # 🎉 reaction
+        # Reuse the threads fetched alongside the previous comments when we have
+        # them; otherwise batch-fetch the mapping once (avoids N+1 GraphQL calls),
+        # stopping as soon as every comment we are about to resolve is located.
+        cached_threads = self._review_threads_cache.pop(pr.number, None)
+        if cached_threads is not None:
+            thread_mapping = self._thread_mapping_from_threads(cached_threads)
+        else:
+            thread_mapping = self._fetch_thread_mapping(
+                repo_name, pr.number, target_ids=set(pending_ids)
+            )
 
-                # Post a reply indicating the issue was not re-detected.
-                pr.create_review_comment_reply(
-                    comment_id=fixed.id,
-                    body=_NO_LONGER_DETECTED_REPLY,
-                )
+        # Replies are independent HTTP calls; a small pool overlaps their latency
+        # while staying well below GitHub's secondary rate limits.
+        with ThreadPoolExecutor(max_workers=_RESOLVE_WORKERS) as executor:
+            outcomes = executor.map(
+                lambda cid: self._reply_no_longer_detected(pr, cid),
+                pending_ids,
+            )
+            replied_ids = [cid for cid, ok in zip(pending_ids, outcomes, strict=True) if ok]
+        resolved_count = len(replied_ids)
+        if replied_ids:
+            # New replies were posted; later reads must see them.
+            self._review_comments_cache.pop(pr.number, None)
+
+        # Hand-in-hand: also resolve the threads in GitHub UI (collapse the conversations).
+        # Without this, the replies would show but the threads would stay "open".
+        thread_ids = [thread_mapping[cid] for cid in replied_ids if cid in thread_mapping]
+        thread_results = self._resolve_review_threads_bulk(thread_ids) if thread_ids else {}
+        for comment_id in replied_ids:
+            thread_id = thread_mapping.get(comment_id)
+            if thread_id and thread_results.get(thread_id):
+                logger.info(f"Resolved thread for comment {comment_id}")
+                continue
+            logger.warning(
+                f"Posted 'no longer detected' reply on comment {comment_id} but could not "
+                "resolve the thread (GraphQL resolve failed or thread not found). "
+                "Thread may still appear open in the PR."
+            )
 
-                # Hand-in-hand: also resolve the thread in GitHub UI (collapse the conversation).
-                # Without this, the reply would show but the thread would stay "open".
-                if not self._resolve_thread_for_comment(fixed.id, thread_mapping):
-                    logger.warning(
-                        f"Posted 'no longer detected' reply on comment {fixed.id} but could not "
-                        "resolve the thread (GraphQL resolve failed or thread not found). "
-                        "Thread may still appear open in the PR."
-                    )
+        return resolved_count
 
-                resolved_count += 1
-                logger.debug(f"Marked comment {fixed.id} as resolved")
-                time.sleep(_RESOLVE_COMMENT_DELAY_S)
-            except Exception as e:
-                _raise_if_forbidden(e)
-                logger.warning(f"Could not resolve comment {fixed.id}: {e}")
+    def _reply_no_longer_detected(self, pr: PullRequest, comment_id: int) -> bool:
+        """React to and reply on a fixed finding's comment.
 
-        return resolved_count
+        Both endpoints are addressable by comment ID, so the comment itself is
+        never fetched.
+
+        Args:
+            pr: Pull request object
+            comment_id: ID of the original finding comment
+
+        Returns:
+            True if the reply was posted
+        """
+        try:
+            # Add reaction (may already exist, that's ok)
+            self._rate.acquire()
+            with contextlib.suppress(Exception):
+                self._http.post(
+                    self._rest_url(
+                        f"/repos/{pr.base.repo.full_name}/pulls/comments/{comment_id}/reactions"
+                    ),
+                    json={"content": "hooray"},  # 🎉 reaction
+                    timeout=30,
+                )
+
+            # Post a reply indicating the issue was not re-detected.
+            self._rate.acquire()
+            pr.create_review_comment_reply(
+                comment_id=comment_id,
+                body=_NO_LONGER_DETECTED_REPLY,
+            )
+        except Exception as e:
+            _raise_if_forbidden(e)
+            logger.warning(f"Could not resolve comment {comment_id}: {e}")
+            return False
+
+        logger.debug(f"Marked comment {comment_id} as resolved")
+        time.sleep(_RESOLVE_COMMENT_DELAY_S)
+        return True
 
     def _get_resolved_comment_ids(
         self, pr: PullRequest, raw_comments: list | None = None
@@ -1455,7 +2198,7 @@ class GitHubClient:
         resolved_ids: set[int] = set()
         allowed_users = self._get_allowed_users()
 
-        comments = raw_comments if raw_comments is not None else pr.get_review_comments()
+        comments = raw_comments if raw_comments is not None else self._get_review_comments(pr)
 
         for comment in comments:
             # Check if this is our resolved / "no longer detected" reply with a parent
@@ -1487,7 +2230,7 @@ class GitHubClient:
         Does not recurse into sub-directories — flat docs-site layouts are assumed.
         404s are swallowed; 403s are re-raised.
         """
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         found: list[str] = []
         for dir_path in dirs:
             lookup = dir_path.rstrip("/")
@@ -1511,7 +2254,7 @@ class GitHubClient:
         targets *base_branch*.  Used as an idempotency guard in ``update-docs``
         so that two rapid merges don't produce duplicate PRs.
         """
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         try:
             open_prs = repo.get_pulls(state="open", base=base_branch)
             for pr in open_prs:
@@ -1538,7 +2281,7 @@ class GitHubClient:
         Returns:
             Subset of *paths* that exist at *ref*.
         """
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
         found: set[str] = set()
         for path in paths:
             lookup = path.rstrip("/")
@@ -1588,7 +2331,7 @@ class GitHubClient:
         Returns the HTML URL of the newly opened PR.
         """
         branch_name = f"docs/auto-{base_sha[:7]}"
-        repo = self._gh.get_repo(repo_name)
+        repo = self.get_repo(repo_name)
 
         # Create branch off the base SHA
         try:
@@ -3,19 +3,36 @@
 import asyncio
 import hashlib
 import hmac
-import json
 import logging
 import os
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache, partial
 
-from fastapi import FastAPI, HTTPException, Request
+import httpx
+import orjson
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from fastapi import FastAPI, HTTPException, Request, Response
 
 logger = logging.getLogger(__name__)
 
 _handler_lock = threading.Lock()
 
+# GitHub App installation tokens, keyed by (app_id, owner): token and the time
+# after which it is refreshed. Installation IDs don't change, so they are kept too.
+_APP_TOKEN_DEFAULT_TTL_S = 3600.0
+_APP_TOKEN_REFRESH_MARGIN_S = 300.0
+_app_token_cache: dict[tuple[str, str], tuple[str, float]] = {}
+_installation_ids: dict[tuple[str, str], int] = {}
+_app_token_lock = threading.Lock()
+# Keep-alive client for GitHub App API calls; opened and closed by the app lifespan
+_app_http: httpx.AsyncClient | None = None
+
 
 def _log_task_error(task: asyncio.Task) -> None:
     """Done-callback that logs exceptions from fire-and-forget async tasks."""
@@ -25,6 +42,18 @@ def _log_task_error(task: asyncio.Task) -> None:
             logger.error("Background task %r failed: %s", task.get_name(), exc)
 
 
+async def _review_worker(queue: asyncio.Queue[Callable[[], Awaitable[None]]]) -> None:
+    """Run queued review jobs one at a time until cancelled, logging any failure."""
+    while True:
+        job = await queue.get()
+        try:
+            await job()
+        except Exception:
+            logger.exception("Queued review job failed")
+        finally:
+            queue.task_done()
+
+
 def _get_env_int(key: str, default: int) -> int:
     """Parse env var as int; on ValueError log and return default."""
     try:
@@ -43,7 +72,7 @@ def _get_env_float(key: str, default: float) -> float:
         return default
 
 
-@dataclass
+@dataclass(slots=True)
 class PREvent:
     """Represents a PR webhook event."""
 
@@ -54,10 +83,23 @@ class PREvent:
     installation_id: int | None = None
 
 
+# Pre-encoded bodies for the fixed webhook/health replies (skips per-request JSON encoding)
+_OK_BODY = b'{"status":"ok"}'
+_PONG_BODY = b'{"status":"pong"}'
+_HEALTHY_BODY = b'{"status":"healthy","service":"ai-code-reviewer"}'
+
+# pull_request actions that trigger a review
+_TRIGGER_ACTIONS = frozenset({"opened", "synchronize", "reopened"})
+# X-GitHub-Event types the webhook endpoint acts on; anything else is acknowledged unread
+_HANDLED_EVENTS = frozenset({"pull_request", "issue_comment", "push", "ping"})
+
 # Review trigger - will be set by the application
 _review_handler: Callable | None = None
 # Push trigger for doc-update-on-merge - will be set by the application
 _push_handler: Callable | None = None
+# PRs with a review in flight -> whether another run was requested meanwhile.
+# Only touched from the event loop, so no lock is needed.
+_inflight_reviews: dict[tuple[str, int], bool] = {}
 
 
 def set_review_handler(handler: Callable) -> None:
@@ -74,9 +116,24 @@ def set_push_handler(handler: Callable) -> None:
         _push_handler = handler
 
 
-def _get_github_app_token(app_id: str, private_key: str, repo: str) -> str | None:
+def _get_app_http() -> httpx.AsyncClient:
+    """Shared async client for GitHub App API calls, owned by the webhook app lifespan.
+
+    Raises:
+        RuntimeError: If the webhook app is not running
+    """
+    if _app_http is None:
+        raise RuntimeError("GitHub App HTTP client is only available while the webhook app runs")
+    return _app_http
+
+
+async def _get_github_app_token(app_id: str, private_key: str, repo: str) -> str | None:
     """Generate an installation access token for a GitHub App.
 
+    Tokens are cached per ``(app_id, owner)`` until shortly before they expire,
+    and installation IDs are cached for the life of the process, so bursts of
+    webhooks for the same owner skip the JWT signing and API round trips.
+
     Args:
         app_id: GitHub App ID
         private_key: GitHub App private key (PEM format)
@@ -85,10 +142,15 @@ def _get_github_app_token(app_id: str, private_key: str, repo: str) -> str | Non
     Returns:
         Installation access token or None on failure
     """
-    import time
-
     import jwt
-    import requests
+
+    owner = repo.split("/")[0]
+    key = (app_id, owner)
+    with _app_token_lock:
+        cached = _app_token_cache.get(key)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0]
+        installation_id = _installation_ids.get(key)
 
     try:
         # Generate JWT for GitHub App
@@ -98,53 +160,79 @@ def _get_github_app_token(app_id: str, private_key: str, repo: str) -> str | Non
             "exp": now + 600,  # Expires in 10 minutes
             "iss": app_id,
         }
-        token = jwt.encode(payload, private_key, algorithm="RS256")
+        token = jwt.encode(payload, _load_app_private_key(private_key), algorithm="RS256")
 
-        # Get installation ID for the repo
-        owner = repo.split("/")[0]
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-        }
+        headers = {"Authorization": f"Bearer {token}"}
+        client = _get_app_http()
 
-        # Try to get installation for the repo owner (org or user)
-        response = requests.get(
-            f"https://api.github.com/orgs/{owner}/installation",
-            headers=headers,
-            timeout=10,
-        )
-        if response.status_code == 404:
-            # Try user installation
-            response = requests.get(
-                f"https://api.github.com/users/{owner}/installation",
-                headers=headers,
-                timeout=10,
+        if installation_id is None:
+            # Try to get installation for the repo owner (org or user)
+            response = await client.get(
+                f"https://api.github.com/orgs/{owner}/installation", headers=headers
             )
+            if response.status_code == 404:
+                # Try user installation
+                response = await client.get(
+                    f"https://api.github.com/users/{owner}/installation", headers=headers
+                )
 
-        if response.status_code != 200:
-            # Truncate body to avoid logging sensitive auth details
-            logger.error("Failed to get installation: status=%d", response.status_code)
-            return None
+            if response.status_code != 200:
+                # Truncate body to avoid logging sensitive auth details
+                logger.error("Failed to get installation: status=%d", response.status_code)
+                return None
 
-        installation_id = response.json()["id"]
+            installation_id = response.json()["id"]
 
         # Generate installation access token
-        response = requests.post(
+        response = await client.post(
             f"https://api.github.com/app/installations/{installation_id}/access_tokens",
             headers=headers,
-            timeout=10,
         )
         if response.status_code != 201:
             logger.error("Failed to get access token: status=%d", response.status_code)
+            # The app may have been reinstalled under a new ID; look it up again next time.
+            with _app_token_lock:
+                _installation_ids.pop(key, None)
             return None
 
-        return response.json()["token"]
+        data = response.json()
+        access_token = data["token"]
+        with _app_token_lock:
+            _installation_ids[key] = installation_id
+            _app_token_cache[key] = (
+                access_token,
+                _token_expiry(data.get("expires_at")) - _APP_TOKEN_REFRESH_MARGIN_S,
+            )
+        return access_token
 
     except Exception as e:
         logger.exception(f"Failed to generate GitHub App token: {e}")
         return None
 
 
+@lru_cache(maxsize=4)
+def _load_app_private_key(pem: str) -> RSAPrivateKey:
+    """Parse the GitHub App PEM once; PyJWT would otherwise re-parse it for every JWT.
+
+    Raises:
+        ValueError: If the PEM holds anything other than an RSA key (RS256 needs RSA)
+    """
+    key = load_pem_private_key(pem.encode(), password=None)
+    if not isinstance(key, RSAPrivateKey):
+        raise ValueError(f"GitHub App private key must be RSA, got {type(key).__name__}")
+    return key
+
+
+def _token_expiry(expires_at: str | None) -> float:
+    """Epoch seconds at which an installation token expires (default: one hour from now)."""
+    if expires_at:
+        try:
+            return datetime.fromisoformat(expires_at).timestamp()
+        except ValueError:
+            logger.warning("Unparseable installation token expiry %r", expires_at)
+    return time.time() + _APP_TOKEN_DEFAULT_TTL_S
+
+
 def _setup_default_review_handler() -> Callable:
     """Build and return the default review handler using environment config.
 
@@ -176,7 +264,7 @@ def _setup_default_review_handler() -> Callable:
         # If GitHub App is configured, generate installation token
         if github_app_id and github_app_private_key:
             logger.info(f"Using GitHub App authentication for {repo}")
-            github_token = _get_github_app_token(github_app_id, github_app_private_key, repo)
+            github_token = await _get_github_app_token(github_app_id, github_app_private_key, repo)
             if not github_token:
                 logger.error("Failed to get GitHub App installation token")
                 return
@@ -206,6 +294,7 @@ def _setup_default_review_handler() -> Callable:
             logger.warning("Failed to load config file, using defaults: %s", e)
             webhook_config = None
 
+        gh: GitHubClient | None = None
         try:
             gh = GitHubClient(github_token)
             pr = gh.get_pull_request(repo, pr_number)
@@ -216,7 +305,7 @@ def _setup_default_review_handler() -> Callable:
             meta = gh.get_review_metadata(pr)
             current_sha = pr.head.sha
 
-            diff_files = {f.filename for f in pr.get_files()}
+            diff_files = {f.filename for f in gh.get_pr_files(pr)}
             previous_comments = gh.get_previous_review_comments(pr) if meta else []
             skip_reason = should_skip_before_agents(
                 meta,
@@ -309,7 +398,12 @@ def _setup_default_review_handler() -> Callable:
                 return
 
             meta_review_count = (meta.review_count + 1) if meta is not None else None
-            delta = gh.compute_review_delta(pr, review.findings, review_count=meta_review_count)
+            delta = gh.compute_review_delta(
+                pr,
+                review.findings,
+                review_count=meta_review_count,
+                fetch_previous=meta is not None,
+            )
 
             review_count: int
             if meta_review_count is not None:
@@ -408,6 +502,9 @@ def _setup_default_review_handler() -> Callable:
 
         except Exception as e:
             logger.exception(f"Error reviewing {repo} PR #{pr_number}: {e}")
+        finally:
+            if gh is not None:
+                gh.close()
 
     return default_review_handler
 
@@ -464,23 +561,44 @@ async def handle_push_event(payload: dict) -> None:
         logger.warning("No push handler configured")
 
 
+async def _run_review_coalesced(handler: Callable, repo: str, pr_number: int) -> None:
+    """Run the review handler, folding triggers for a PR that is already under review.
+
+    A trigger that arrives while the same PR is being reviewed (e.g. a burst of
+    ``synchronize`` events from force-pushes) only marks it for one more run,
+    which starts after the current review finishes and sees the latest head.
+    """
+    key = (repo, pr_number)
+    if key in _inflight_reviews:
+        _inflight_reviews[key] = True
+        logger.info("Review already running for %s PR #%d; queued a re-run", repo, pr_number)
+        return
+
+    _inflight_reviews[key] = False
+    try:
+        while True:
+            await handler(repo=repo, pr_number=pr_number)
+            if not _inflight_reviews[key]:
+                break
+            _inflight_reviews[key] = False
+    finally:
+        del _inflight_reviews[key]
+
+
 async def handle_pr_event(event: PREvent) -> None:
     """Handle a PR event by triggering a review if appropriate.
 
     Args:
         event: PR event data
     """
-    # Only review on these actions
-    trigger_actions = {"opened", "synchronize", "reopened"}
-
-    if event.action not in trigger_actions:
+    if event.action not in _TRIGGER_ACTIONS:
         logger.debug(f"Ignoring PR action: {event.action}")
         return
 
     logger.info(f"Triggering review for {event.repo} PR #{event.pr_number}")
 
     if _review_handler:
-        await _review_handler(repo=event.repo, pr_number=event.pr_number)
+        await _run_review_coalesced(_review_handler, event.repo, event.pr_number)
     else:
         logger.warning("No review handler configured")
 
@@ -505,7 +623,7 @@ async def _handle_issue_comment_event(payload: dict) -> None:
     logger.info(f"Triggering review via /ai-review comment on {repo} PR #{pr_number}")
 
     if _review_handler:
-        await _review_handler(repo=repo, pr_number=pr_number)
+        await _run_review_coalesced(_review_handler, repo, pr_number)
     else:
         logger.warning("No review handler configured for /ai-review trigger")
 
@@ -535,35 +653,84 @@ def create_webhook_app(webhook_secret: str | None = None) -> FastAPI:
         if _push_handler is None:
             _push_handler = _setup_default_push_handler()
 
+    # Reviews run on a fixed pool of workers draining a bounded queue. Every
+    # review fans out into many GitHub calls, so capping how many run at once
+    # keeps event bursts clear of GitHub's secondary rate limits.
+    num_workers = max(1, _get_env_int("MAX_CONCURRENT_REVIEWS", 5))
+    review_queue: asyncio.Queue[Callable[[], Awaitable[None]]] = asyncio.Queue(
+        maxsize=max(1, _get_env_int("REVIEW_QUEUE_SIZE", 100))
+    )
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        global _app_http
+        _app_http = httpx.AsyncClient(timeout=10, headers={"Accept": "application/vnd.github+json"})
+        workers = [
+            asyncio.create_task(_review_worker(review_queue), name=f"review-worker-{i}")
+            for i in range(num_workers)
+        ]
+        try:
+            yield
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await _app_http.aclose()
+            _app_http = None
+
+    def enqueue_review(job: Callable[[], Awaitable[None]]) -> None:
+        try:
+            review_queue.put_nowait(job)
+        except asyncio.QueueFull as e:
+            logger.warning("Review queue full (%d pending); rejecting event", review_queue.qsize())
+            raise HTTPException(status_code=503, detail="Review queue is full") from e
+
     app = FastAPI(
         title="AI Code Reviewer Webhook",
         description="Webhook server for AI-powered code reviews",
         version="0.1.0",
+        lifespan=lifespan,
     )
+    app.state.review_queue = review_queue
 
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "service": "ai-code-reviewer"}
+        return Response(_HEALTHY_BODY, media_type="application/json")
 
     @app.post("/webhook")
     async def github_webhook(request: Request):
         """Handle GitHub webhook events."""
-        # Read body once (required for signature verification and parsing)
-        body = await request.body()
-
-        if webhook_secret:
+        # Events we never act on (check_run, status, ...) can carry large payloads;
+        # drop them on the header alone, before reading, hashing or parsing the body.
+        event_type = request.headers.get("X-GitHub-Event", "")
+        if event_type not in _HANDLED_EVENTS:
+            logger.debug(f"Ignoring event type: {event_type}")
+            return Response(_OK_BODY, media_type="application/json")
+
+        # Hash the body while it streams in, so it is buffered once and not
+        # walked a second time for the signature.
+        mac = _hmac_prototype(webhook_secret.encode()).copy() if webhook_secret else None
+        body = bytearray()
+        async for chunk in request.stream():
+            body += chunk
+            if mac is not None:
+                mac.update(chunk)
+
+        if mac is not None:
             signature = request.headers.get("X-Hub-Signature-256", "")
-            if not verify_signature(body, signature, webhook_secret):
+            if not _signature_matches(mac, signature):
                 raise HTTPException(status_code=401, detail="Invalid signature")
 
+        if event_type == "ping":
+            logger.info("Received ping from GitHub")
+            return Response(_PONG_BODY, media_type="application/json")
+
         try:
-            payload = json.loads(body)
-        except json.JSONDecodeError as e:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}") from e
 
-        event_type = request.headers.get("X-GitHub-Event", "")
-
         if event_type == "pull_request":
             try:
                 pr_event = PREvent(
@@ -578,25 +745,16 @@ def create_webhook_app(webhook_secret: str | None = None) -> FastAPI:
                     status_code=400, detail=f"Malformed pull_request payload: missing {e}"
                 ) from e
 
-            # Process async to respond quickly; log exceptions so they aren't silently lost
-            asyncio.create_task(handle_pr_event(pr_event)).add_done_callback(_log_task_error)
+            # Queue for the review workers so we respond quickly
+            enqueue_review(partial(handle_pr_event, pr_event))
 
         elif event_type == "issue_comment":
-            asyncio.create_task(_handle_issue_comment_event(payload)).add_done_callback(
-                _log_task_error
-            )
+            enqueue_review(partial(_handle_issue_comment_event, payload))
 
         elif event_type == "push":
             asyncio.create_task(handle_push_event(payload)).add_done_callback(_log_task_error)
 
-        elif event_type == "ping":
-            logger.info("Received ping from GitHub")
-            return {"status": "pong"}
-
-        else:
-            logger.debug(f"Ignoring event type: {event_type}")
-
-        return {"status": "ok"}
+        return Response(_OK_BODY, media_type="application/json")
 
     @app.get("/")
     async def root():
@@ -613,6 +771,12 @@ def create_webhook_app(webhook_secret: str | None = None) -> FastAPI:
     return app
 
 
+@lru_cache(maxsize=4)
+def _hmac_prototype(secret: bytes) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state to ``copy()`` per request instead of re-deriving the key pads."""
+    return hmac.new(secret, digestmod=hashlib.sha256)
+
+
 def verify_signature(payload: bytes, signature: str, secret: str) -> bool:
     """Verify GitHub webhook signature.
 
@@ -624,16 +788,13 @@ def verify_signature(payload: bytes, signature: str, secret: str) -> bool:
     Returns:
         True if signature is valid
     """
-    if not signature.startswith("sha256="):
-        return False
+    mac = _hmac_prototype(secret.encode()).copy()
+    mac.update(payload)
+    return _signature_matches(mac, signature)
 
-    expected = (
-        "sha256="
-        + hmac.new(
-            secret.encode(),
-            payload,
-            hashlib.sha256,
-        ).hexdigest()
-    )
 
-    return hmac.compare_digest(expected, signature)
+def _signature_matches(mac: hmac.HMAC, signature: str) -> bool:
+    """Compare a fed HMAC-SHA256 against an X-Hub-Signature-256 header in constant time."""
+    if not signature.startswith("sha256="):
+        return False
+    return hmac.compare_digest("sha256=" + mac.hexdigest(), signature)
@@ -5,8 +5,21 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+_PROMPT_CONTEXT_TEMPLATE = """## Pull Request Context
+- Repository: {ctx.repo_name}
+- PR #{ctx.pr_number}: {ctx.pr_title}
+- Author: {ctx.author}
+- Branch: {ctx.head_branch} → {ctx.base_branch}
+- Changes: +{ctx.additions} / -{ctx.deletions} in {ctx.changed_files_count} files
+- Languages: {languages}
+- Labels: {labels}
 
-@dataclass
+## PR Description
+{description}
+"""
+
+
+@dataclass(slots=True)
 class ReviewContext:
     """Context provided to agents for informed reviews."""
 
@@ -28,15 +41,9 @@ class ReviewContext:
 
     def to_prompt_context(self) -> str:
         """Format context for inclusion in agent prompts."""
-        return f"""## Pull Request Context
-- Repository: {self.repo_name}
-- PR #{self.pr_number}: {self.pr_title}
-- Author: {self.author}
-- Branch: {self.head_branch} → {self.base_branch}
-- Changes: +{self.additions} / -{self.deletions} in {self.changed_files_count} files
-- Languages: {", ".join(self.repo_languages) if self.repo_languages else "Unknown"}
-- Labels: {", ".join(self.labels) if self.labels else "None"}
-
-## PR Description
-{self.pr_description or "No description provided."}
-"""
+        return _PROMPT_CONTEXT_TEMPLATE.format(
+            ctx=self,
+            languages=", ".join(self.repo_languages) if self.repo_languages else "Unknown",
+            labels=", ".join(self.labels) if self.labels else "None",
+            description=self.pr_description or "No description provided.",
+        )
@@ -37,6 +37,15 @@ class Severity(Enum):
     NITPICK = "nitpick"  # Style/formatting only; use "Nit: " prefix in title
 
 
+# Priority weight per severity, used by ConsolidatedFinding.priority_score
+_SEVERITY_WEIGHTS: dict[Severity, float] = {
+    Severity.CRITICAL: 1.0,
+    Severity.WARNING: 0.6,
+    Severity.SUGGESTION: 0.3,
+    Severity.NITPICK: 0.1,
+}
+
+
 class Category(Enum):
     """Categories for review findings."""
 
@@ -49,7 +58,7 @@ class Category(Enum):
     DOCUMENTATION = "documentation"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewFinding:
     """A single finding from an agent's review."""
 
@@ -75,7 +84,7 @@ class ReviewFinding:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidatedFinding:
     """A finding that has been merged from multiple agents."""
 
@@ -122,10 +131,4 @@ class ConsolidatedFinding:
     @property
     def priority_score(self) -> float:
         """Compute priority based on severity and consensus."""
-        severity_weights = {
-            Severity.CRITICAL: 1.0,
-            Severity.WARNING: 0.6,
-            Severity.SUGGESTION: 0.3,
-            Severity.NITPICK: 0.1,
-        }
-        return severity_weights[self.severity] * self.consensus_score * self.confidence
+        return _SEVERITY_WEIGHTS[self.severity] * self.consensus_score * self.confidence
@@ -1,12 +1,13 @@
 """Review result models."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from ai_reviewer.models.findings import Category, ConsolidatedFinding, ReviewFinding, Severity
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewHistory:
     """Cross-run history tracking for a single PR.
 
@@ -25,7 +26,7 @@ class ReviewHistory:
     last_review_sha: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreBreakdown:
     """Transparent breakdown of quality score components."""
 
@@ -36,7 +37,7 @@ class ScoreBreakdown:
     raw_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentReview:
     """Complete review from a single agent."""
 
@@ -58,7 +59,7 @@ class AgentReview:
         return sum(1 for f in self.findings if f.severity == Severity.CRITICAL)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidatedReview:
     """Final aggregated review output."""
 
@@ -89,16 +90,14 @@ class ConsolidatedReview:
     def findings_by_severity(self) -> dict[Severity, int]:
         """Count findings by severity level."""
         counts: dict[Severity, int] = dict.fromkeys(Severity, 0)
-        for finding in self.findings:
-            counts[finding.severity] += 1
+        counts.update(Counter(f.severity for f in self.findings))
         return counts
 
     @property
     def findings_by_category(self) -> dict[Category, int]:
         """Count findings by category."""
         counts: dict[Category, int] = dict.fromkeys(Category, 0)
-        for finding in self.findings:
-            counts[finding.category] += 1
+        counts.update(Counter(f.category for f in self.findings))
         return counts
 
     @property
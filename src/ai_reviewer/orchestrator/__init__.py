@@ -1,10 +1,11 @@
 """Orchestrator components for AI Code Reviewer."""
 
-from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+from ai_reviewer.orchestrator.aggregator import IncrementalAggregator, ReviewAggregator
 from ai_reviewer.orchestrator.orchestrator import AgentOrchestrator, InsufficientAgentsError
 
 __all__ = [
     "AgentOrchestrator",
+    "IncrementalAggregator",
     "InsufficientAgentsError",
     "ReviewAggregator",
 ]
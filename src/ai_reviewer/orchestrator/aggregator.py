@@ -2,12 +2,14 @@
 
 import hashlib
 import logging
-import uuid
+import secrets
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
 
 from ai_reviewer.models.findings import (
+    Category,
     ConsolidatedFinding,
     ReviewFinding,
     Severity,
@@ -17,6 +19,12 @@ from ai_reviewer.review import compute_quality_score
 
 logger = logging.getLogger(__name__)
 
+# Position of each severity in declaration order, for O(1) severity comparisons
+_SEVERITY_RANK = {s: i for i, s in enumerate(Severity)}
+
+# Findings whose line ranges are within this many lines count as overlapping
+_LINE_TOLERANCE = 5
+
 
 @dataclass
 class AggregatorConfig:
@@ -67,12 +75,30 @@ class ReviewAggregator:
         # Extract and tag all findings with their agent
         tagged_findings = self._extract_tagged_findings(reviews)
 
-        if not tagged_findings:
-            return self._clean_review(reviews, repo, pr_number)
-
         # Cluster similar findings
         clusters = self._cluster_findings(tagged_findings)
 
+        return self._consolidate(reviews, clusters, repo, pr_number)
+
+    def begin(self) -> "IncrementalAggregator":
+        """Start aggregating reviews one at a time, as their agents finish.
+
+        Returns:
+            An IncrementalAggregator that clusters each review's findings on arrival
+        """
+        return IncrementalAggregator(self)
+
+    def _consolidate(
+        self,
+        reviews: list[AgentReview],
+        clusters: list[list[tuple[str, ReviewFinding]]],
+        repo: str,
+        pr_number: int,
+    ) -> ConsolidatedReview:
+        """Merge clustered findings into the consolidated review."""
+        if not clusters:
+            return self._clean_review(reviews, repo, pr_number)
+
         # Merge each cluster into a consolidated finding
         consolidated_findings = [self._merge_cluster(cluster, len(reviews)) for cluster in clusters]
 
@@ -90,7 +116,7 @@ class ReviewAggregator:
         total_time = sum(r.review_time_ms for r in reviews)
 
         return ConsolidatedReview(
-            id=f"review-{uuid.uuid4().hex[:8]}",
+            id=f"review-{secrets.token_hex(4)}",
             created_at=datetime.now(),
             repo=repo,
             pr_number=pr_number,
@@ -107,83 +133,74 @@ class ReviewAggregator:
         self, reviews: list[AgentReview]
     ) -> list[tuple[str, ReviewFinding]]:
         """Extract all findings tagged with their agent ID."""
-        tagged = []
-        for review in reviews:
-            for finding in review.findings:
-                tagged.append((review.agent_id, finding))
-        return tagged
+        return [(review.agent_id, finding) for review in reviews for finding in review.findings]
 
     def _cluster_findings(
         self, tagged_findings: list[tuple[str, ReviewFinding]]
     ) -> list[list[tuple[str, ReviewFinding]]]:
-        """Cluster similar findings together."""
-        if not tagged_findings:
-            return []
-
-        clusters: list[list[tuple[str, ReviewFinding]]] = []
-        used = set()
-
-        for i, (agent_i, finding_i) in enumerate(tagged_findings):
-            if i in used:
-                continue
-
-            # Start new cluster
-            cluster = [(agent_i, finding_i)]
-            used.add(i)
-
-            # Find similar findings
-            for j, (agent_j, finding_j) in enumerate(tagged_findings):
-                if j in used:
-                    continue
+        """Cluster similar findings together.
 
-                if self._are_similar(finding_i, finding_j):
-                    cluster.append((agent_j, finding_j))
-                    used.add(j)
-
-            clusters.append(cluster)
-
-        return clusters
-
-    def _are_similar(self, f1: ReviewFinding, f2: ReviewFinding) -> bool:
-        """Check if two findings are similar enough to merge."""
-        # Must be same file
-        if f1.file_path != f2.file_path:
+        Each finding joins the first earlier cluster it is similar to, or starts
+        its own; see IncrementalAggregator. Clusters come back in order of their
+        first finding, with members in their original order.
+        """
+        incremental = IncrementalAggregator(self)
+        for agent_id, finding in tagged_findings:
+            incremental.add_finding(agent_id, finding)
+        return incremental.clusters
+
+    def _texts_similar(self, title1: str, desc1: str, title2: str, desc2: str) -> bool:
+        """Check whether lowercased titles/descriptions reach the similarity threshold."""
+        threshold = self.config.similarity_threshold
+
+        # Title similarity, rejecting early when even a perfect description
+        # couldn't lift the combined score to the threshold. real_quick_ratio and
+        # quick_ratio are cheap upper bounds on ratio().
+        title = SequenceMatcher(None, title1, title2, autojunk=False)
+        if title.real_quick_ratio() * 0.6 + 0.4 < threshold:
             return False
-
-        # Must be same category
-        if f1.category != f2.category:
+        if title.quick_ratio() * 0.6 + 0.4 < threshold:
             return False
-
-        # Lines must overlap or be close
-        if not self._lines_overlap(f1, f2):
+        title_sim = title.ratio()
+        if title_sim * 0.6 + 0.4 < threshold:
             return False
 
-        # Title/description similarity
-        title_sim = self._text_similarity(f1.title, f2.title)
-        desc_sim = self._text_similarity(f1.description, f2.description)
+        # Description similarity, bounded the same way given the title score
+        desc = SequenceMatcher(None, desc1, desc2, autojunk=False)
+        if title_sim * 0.6 + desc.real_quick_ratio() * 0.4 < threshold:
+            return False
+        if title_sim * 0.6 + desc.quick_ratio() * 0.4 < threshold:
+            return False
+        desc_sim = desc.ratio()
 
         # Combined similarity
         combined = (title_sim * 0.6) + (desc_sim * 0.4)
-        return combined >= self.config.similarity_threshold
-
-    def _lines_overlap(self, f1: ReviewFinding, f2: ReviewFinding) -> bool:
-        """Check if line ranges overlap or are close."""
-        # Get ranges
-        start1, end1 = f1.line_start, f1.line_end or f1.line_start
-        start2, end2 = f2.line_start, f2.line_end or f2.line_start
-
-        # Allow some tolerance (within 5 lines)
-        tolerance = 5
-        return not (end1 + tolerance < start2 or end2 + tolerance < start1)
-
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Compute text similarity using SequenceMatcher."""
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        return combined >= threshold
 
     def _merge_cluster(
         self, cluster: list[tuple[str, ReviewFinding]], total_agents: int
     ) -> ConsolidatedFinding:
         """Merge a cluster of similar findings into one."""
+        if len(cluster) == 1:
+            # Nothing to merge for a lone finding, the common case
+            agent, finding = cluster[0]
+            id_key = f"{finding.file_path}:{finding.line_start}:{finding.title}"
+            return ConsolidatedFinding(
+                id=f"finding-{hashlib.sha256(id_key.encode()).hexdigest()[:8]}",
+                file_path=finding.file_path,
+                line_start=finding.line_start,
+                line_end=finding.line_end,
+                severity=finding.severity,
+                category=finding.category,
+                title=finding.title,
+                description=finding.description,
+                suggested_fix=finding.suggested_fix,
+                consensus_score=1 / total_agents,
+                agreeing_agents=[agent],
+                confidence=finding.confidence,
+                original_findings=[finding],
+            )
+
         agents = [agent for agent, _ in cluster]
         findings = [finding for _, finding in cluster]
 
@@ -219,7 +236,7 @@ class ReviewAggregator:
             )
 
         # Use most severe rating
-        severity = max(findings, key=lambda f: list(Severity).index(f.severity)).severity
+        severity = max(findings, key=lambda f: _SEVERITY_RANK[f.severity]).severity
 
         # Consensus score
         consensus = len(cluster) / total_agents
@@ -227,8 +244,9 @@ class ReviewAggregator:
         # Average confidence
         avg_confidence = sum(f.confidence for f in findings) / len(findings)
 
+        id_key = f"{base_finding.file_path}:{base_finding.line_start}:{base_finding.title}"
         return ConsolidatedFinding(
-            id=f"finding-{hashlib.md5(f'{base_finding.file_path}:{base_finding.line_start}:{base_finding.title}'.encode()).hexdigest()[:8]}",
+            id=f"finding-{hashlib.sha256(id_key.encode()).hexdigest()[:8]}",
             file_path=base_finding.file_path,
             line_start=base_finding.line_start,
             line_end=base_finding.line_end,
@@ -248,9 +266,7 @@ class ReviewAggregator:
         if not findings:
             return f"✅ No issues found by {agent_count} agents."
 
-        by_severity: dict[Severity, int] = {}
-        for f in findings:
-            by_severity[f.severity] = by_severity.get(f.severity, 0) + 1
+        by_severity = Counter(f.severity for f in findings)
 
         parts = []
         if Severity.CRITICAL in by_severity:
@@ -267,7 +283,7 @@ class ReviewAggregator:
     def _empty_review(self, repo: str, pr_number: int) -> ConsolidatedReview:
         """Create an empty review (no agents)."""
         return ConsolidatedReview(
-            id=f"review-{uuid.uuid4().hex[:8]}",
+            id=f"review-{secrets.token_hex(4)}",
             created_at=datetime.now(),
             repo=repo,
             pr_number=pr_number,
@@ -285,7 +301,7 @@ class ReviewAggregator:
         total_time = sum(r.review_time_ms for r in reviews)
         clean_score, score_breakdown = compute_quality_score([], len(reviews), total_lines=0)
         return ConsolidatedReview(
-            id=f"review-{uuid.uuid4().hex[:8]}",
+            id=f"review-{secrets.token_hex(4)}",
             created_at=datetime.now(),
             repo=repo,
             pr_number=pr_number,
@@ -297,3 +313,86 @@ class ReviewAggregator:
             agent_reviews=reviews,
             score_breakdown=score_breakdown,
         )
+
+
+class IncrementalAggregator:
+    """Clusters findings as agent reviews arrive, so aggregation overlaps slow agents.
+
+    Feeding every review through add_review() and then calling finalize() gives
+    the same result as ReviewAggregator.aggregate() on those reviews in that order.
+    """
+
+    def __init__(self, aggregator: ReviewAggregator) -> None:
+        """Initialize the incremental aggregator.
+
+        Args:
+            aggregator: Aggregator supplying the similarity rules and final merge
+        """
+        self._aggregator = aggregator
+        self.reviews: list[AgentReview] = []
+        self.clusters: list[list[tuple[str, ReviewFinding]]] = []
+        # Findings only merge within the same file and category, so each
+        # (file_path, category) bucket keeps its own cluster seeds: the cluster
+        # index plus the seed's line range and lowercased title/description
+        self._seeds: dict[tuple[str, Category], list[tuple[int, int, int, str, str]]] = defaultdict(
+            list
+        )
+        # Byte-identical findings always share a cluster, so repeats (common when
+        # agents agree) skip the similarity scan
+        self._cluster_of: dict[tuple, int] = {}
+        # Text comparison results by (seed title, seed description, title,
+        # description); the same wording recurs across files and line ranges
+        self._texts_similar_memo: dict[tuple[str, str, str, str], bool] = {}
+
+    def add_review(self, review: AgentReview) -> None:
+        """Cluster the findings of one finished agent review."""
+        self.reviews.append(review)
+        for finding in review.findings:
+            self.add_finding(review.agent_id, finding)
+
+    def add_finding(self, agent_id: str, finding: ReviewFinding) -> None:
+        """Add one finding to the first similar cluster, or start a new one."""
+        f = finding
+        identity = (f.file_path, f.line_start, f.line_end, f.category, f.title, f.description)
+        index = self._cluster_of.get(identity)
+        if index is None:
+            index = self._find_cluster(f)
+            self._cluster_of[identity] = index
+        self.clusters[index].append((agent_id, finding))
+
+    def finalize(self, repo: str = "unknown", pr_number: int = 0) -> ConsolidatedReview:
+        """Merge the clusters gathered so far into a consolidated review.
+
+        Args:
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            Consolidated review with merged findings
+        """
+        if not self.reviews:
+            return self._aggregator._empty_review(repo, pr_number)
+        return self._aggregator._consolidate(list(self.reviews), self.clusters, repo, pr_number)
+
+    def _find_cluster(self, finding: ReviewFinding) -> int:
+        """Return the index of the first cluster whose seed is similar, creating one if none."""
+        start, end = finding.line_start, finding.line_end or finding.line_start
+        title, desc = finding.title.lower(), finding.description.lower()
+        texts_similar = self._aggregator._texts_similar
+        memo = self._texts_similar_memo
+
+        seeds = self._seeds[(finding.file_path, finding.category)]
+        for index, seed_start, seed_end, seed_title, seed_desc in seeds:
+            if seed_end + _LINE_TOLERANCE < start or end + _LINE_TOLERANCE < seed_start:
+                continue
+            texts = (seed_title, seed_desc, title, desc)
+            similar = memo.get(texts)
+            if similar is None:
+                similar = memo[texts] = texts_similar(*texts)
+            if similar:
+                return index
+
+        index = len(self.clusters)
+        self.clusters.append([])
+        seeds.append((index, start, end, title, desc))
+        return index
@@ -2,15 +2,29 @@
 
 import asyncio
 import logging
+import random
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+import anthropic
+
 from ai_reviewer.agents.base import ReviewAgent
 from ai_reviewer.models.context import ReviewContext
 from ai_reviewer.models.review import AgentReview
 
 logger = logging.getLogger(__name__)
 
+# Transient failures worth retrying; anything else (auth, bad request, schema
+# errors) would fail the same way again
+_RETRYABLE_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    anthropic.APIConnectionError,
+    anthropic.RateLimitError,
+    anthropic.InternalServerError,
+)
+
 
 class InsufficientAgentsError(Exception):
     """Raised when too few agents succeed to produce a valid review."""
@@ -18,6 +32,15 @@ class InsufficientAgentsError(Exception):
     pass
 
 
+async def _cancel_unfinished(tasks: list[asyncio.Task[AgentReview]]) -> None:
+    """Cancel agent tasks that are still running and wait for them to unwind."""
+    unfinished = [task for task in tasks if not task.done()]
+    for task in unfinished:
+        task.cancel()
+    if unfinished:
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+
 @dataclass
 class OrchestratorConfig:
     """Configuration for the orchestrator."""
@@ -27,6 +50,13 @@ class OrchestratorConfig:
     max_parallel_agents: int = 5
     retry_on_failure: bool = True
     max_retries: int = 2
+    # Once min_agents_required agents succeed, wait at most this long for the
+    # rest before cancelling them; None waits for every agent
+    straggler_grace_seconds: float | None = None
+    # Retry round n waits retry_base_delay_seconds * 2**(n-1) plus up to
+    # retry_jitter_seconds of random jitter
+    retry_base_delay_seconds: float = 1.0
+    retry_jitter_seconds: float = 0.5
 
 
 class AgentOrchestrator:
@@ -52,12 +82,15 @@ class AgentOrchestrator:
             timeout_seconds=timeout_seconds,
             min_agents_required=min_agents_required,
         )
+        # Caps how many agents call their model at once
+        self._semaphore = asyncio.Semaphore(self.config.max_parallel_agents)
 
     async def review(
         self,
         diff: str,
         file_contents: dict[str, str],
         context: ReviewContext | dict[str, Any],
+        on_review: Callable[[AgentReview], None] | None = None,
     ) -> list[AgentReview]:
         """Execute all agents in parallel and collect results.
 
@@ -65,6 +98,8 @@ class AgentOrchestrator:
             diff: Git diff to review
             file_contents: Full contents of changed files
             context: Review context information
+            on_review: Optional callback given each successful review as soon as
+                its agent finishes, e.g. IncrementalAggregator.add_review
 
         Returns:
             List of successful agent reviews
@@ -77,26 +112,65 @@ class AgentOrchestrator:
         # Create tasks for all agents
         tasks = [
             asyncio.create_task(
-                self._run_agent_with_timeout(agent, diff, file_contents, context),
+                self._run_agent(agent, diff, file_contents, context),
                 name=f"agent-{agent.agent_id}",
             )
             for agent in self.agents
         ]
 
-        # Wait for all tasks, collecting results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Collect tasks as they finish under one shared deadline, so stragglers
+        # can also be cut off once enough agents have succeeded
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.timeout_seconds
+        grace = self.config.straggler_grace_seconds
+        grace_deadline: float | None = None
+        succeeded = 0
+        pending: set[asyncio.Task[AgentReview]] = set(tasks)
+        try:
+            while pending:
+                wait_until = deadline if grace_deadline is None else min(deadline, grace_deadline)
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_until - loop.time(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    succeeded += 1
+                    if on_review is not None and isinstance(task.result(), AgentReview):
+                        on_review(task.result())
+                if (
+                    grace is not None
+                    and grace_deadline is None
+                    and succeeded >= self.config.min_agents_required
+                ):
+                    grace_deadline = loop.time() + grace
+            if pending:
+                logger.info(f"Cancelling {len(pending)} unfinished agents")
+        finally:
+            # Never leave agents running (and spending tokens) past this call
+            await _cancel_unfinished(tasks)
+
+        timed_out = grace_deadline is None or deadline <= grace_deadline
 
         # Process results
         successful_reviews: list[AgentReview] = []
         failed_agents: list[str] = []
 
-        for agent, result in zip(self.agents, results, strict=False):
+        for agent, task in zip(self.agents, tasks, strict=False):
+            if task in pending and timed_out:
+                failed_agents.append(f"{agent.agent_id} (timeout)")
+                logger.warning(f"Agent {agent.agent_id} timed out")
+                continue
+            if task in pending:
+                failed_agents.append(f"{agent.agent_id} (cancelled)")
+                logger.warning(f"Agent {agent.agent_id} cancelled after straggler grace period")
+                continue
+            result = task.exception() or task.result()
             if isinstance(result, AgentReview):
                 successful_reviews.append(result)
                 logger.info(f"Agent {agent.agent_id} completed: {len(result.findings)} findings")
-            elif isinstance(result, asyncio.TimeoutError):
-                failed_agents.append(f"{agent.agent_id} (timeout)")
-                logger.warning(f"Agent {agent.agent_id} timed out")
             elif isinstance(result, Exception):
                 failed_agents.append(f"{agent.agent_id} ({type(result).__name__})")
                 logger.error(f"Agent {agent.agent_id} failed: {result}")
@@ -118,14 +192,14 @@ class AgentOrchestrator:
 
         return successful_reviews
 
-    async def _run_agent_with_timeout(
+    async def _run_agent(
         self,
         agent: ReviewAgent,
         diff: str,
         file_contents: dict[str, str],
         context: ReviewContext | dict[str, Any],
     ) -> AgentReview:
-        """Run a single agent with timeout.
+        """Run a single agent once a parallelism slot is free.
 
         Args:
             agent: Agent to run
@@ -135,14 +209,9 @@ class AgentOrchestrator:
 
         Returns:
             AgentReview from the agent
-
-        Raises:
-            asyncio.TimeoutError: If agent exceeds timeout
         """
-        return await asyncio.wait_for(
-            agent.review(diff, file_contents, context),
-            timeout=self.config.timeout_seconds,
-        )
+        async with self._semaphore:
+            return await agent.review(diff, file_contents, context)
 
     async def review_with_retry(
         self,
@@ -152,6 +221,9 @@ class AgentOrchestrator:
     ) -> list[AgentReview]:
         """Execute review with retry logic for failed agents.
 
+        Only agents that timed out or hit a transient error are retried, after an
+        exponential backoff with jitter.
+
         Args:
             diff: Git diff to review
             file_contents: Full contents of changed files
@@ -166,22 +238,32 @@ class AgentOrchestrator:
 
         while remaining_agents and attempts < self.config.max_retries + 1:
             if attempts > 0:
-                logger.info(f"Retry attempt {attempts} with {len(remaining_agents)} agents")
+                delay = self.config.retry_base_delay_seconds * 2 ** (attempts - 1)
+                delay += random.uniform(0, self.config.retry_jitter_seconds)
+                logger.info(
+                    f"Retry attempt {attempts} with {len(remaining_agents)} agents in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
             tasks = [
-                asyncio.create_task(
-                    self._run_agent_with_timeout(agent, diff, file_contents, context)
-                )
+                asyncio.create_task(self._run_agent(agent, diff, file_contents, context))
                 for agent in remaining_agents
             ]
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # One deadline for the whole attempt; unfinished agents count as failed
+            try:
+                _, pending = await asyncio.wait(tasks, timeout=self.config.timeout_seconds)
+            finally:
+                await _cancel_unfinished(tasks)
 
             # Process results
             still_failing = []
-            for agent, result in zip(remaining_agents, results, strict=False):
+            for agent, task in zip(remaining_agents, tasks, strict=False):
+                result = None if task in pending else task.exception() or task.result()
                 if isinstance(result, AgentReview):
                     all_reviews.append(result)
+                elif isinstance(result, Exception) and not isinstance(result, _RETRYABLE_ERRORS):
+                    logger.error(f"Agent {agent.agent_id} failed, not retrying: {result}")
                 else:
                     still_failing.append(agent)
 
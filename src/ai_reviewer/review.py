@@ -20,13 +20,13 @@ import fnmatch
 import json
 import logging
 import re
+import secrets
 from collections import defaultdict
 from collections.abc import Callable
 from copy import deepcopy
 from datetime import datetime
 from difflib import SequenceMatcher
 from typing import Any
-from uuid import uuid4
 
 from ai_reviewer.agents.anthropic_client import AnthropicClient
 from ai_reviewer.agents.base import ReviewAgent
@@ -671,12 +671,16 @@ def _raw_lines_overlap(raw1: dict, raw2: dict, tolerance: int = 5) -> bool:
 
 
 def _raw_text_similarity(text1: str, text2: str) -> float:
-    """Compute text similarity using SequenceMatcher (0.0–1.0)."""
+    """Compute text similarity using SequenceMatcher (0.0–1.0).
+
+    ``autojunk`` is off so long, repetitive descriptions aren't scored as
+    dissimilar by difflib's popular-character heuristic.
+    """
     if not text1 and not text2:
         return 1.0
     if not text1 or not text2:
         return 0.0
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+    return SequenceMatcher(None, text1.lower(), text2.lower(), autojunk=False).ratio()
 
 
 def _raw_findings_similar(raw1: dict, raw2: dict, threshold: float = _SIMILARITY_THRESHOLD) -> bool:
@@ -707,27 +711,40 @@ def _raw_findings_similar(raw1: dict, raw2: dict, threshold: float = _SIMILARITY
 def _cluster_raw_findings(
     tagged: list[tuple[str, dict]], threshold: float = _SIMILARITY_THRESHOLD
 ) -> list[list[tuple[str, dict]]]:
-    """Cluster similar raw findings so consensus = agents that found the same issue."""
+    """Cluster similar raw findings so consensus = agents that found the same issue.
+
+    Only findings sharing a normalized file path and category can be similar, so
+    each such bucket is clustered on its own instead of comparing every pair.
+    Clusters come back in order of their first finding.
+    """
     if not tagged:
         return []
 
-    clusters: list[list[tuple[str, dict]]] = []
-    used = set()
-
-    for i, (agent_i, raw_i) in enumerate(tagged):
-        if i in used:
-            continue
-        cluster = [(agent_i, raw_i)]
-        used.add(i)
-        for j, (agent_j, raw_j) in enumerate(tagged):
-            if j in used:
-                continue
-            if _raw_findings_similar(raw_i, raw_j, threshold):
-                cluster.append((agent_j, raw_j))
-                used.add(j)
-        clusters.append(cluster)
-
-    return clusters
+    buckets: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for i, (_, raw) in enumerate(tagged):
+        key = (
+            _normalize_path(raw.get("file_path", "")),
+            (raw.get("category") or "logic").lower().strip(),
+        )
+        buckets[key].append(i)
+
+    seeded: list[tuple[int, list[tuple[str, dict]]]] = []
+    for remaining in buckets.values():
+        while remaining:
+            seed = remaining[0]
+            seed_raw = tagged[seed][1]
+            cluster = [tagged[seed]]
+            rest: list[int] = []
+            for j in remaining[1:]:
+                if _raw_findings_similar(seed_raw, tagged[j][1], threshold):
+                    cluster.append(tagged[j])
+                else:
+                    rest.append(j)
+            seeded.append((seed, cluster))
+            remaining = rest
+
+    seeded.sort(key=lambda item: item[0])
+    return [cluster for _, cluster in seeded]
 
 
 CONFIDENCE_THRESHOLDS: dict[Severity, float] = {
@@ -924,7 +941,7 @@ def aggregate_findings(
     quality_score, score_breakdown = compute_quality_score(consolidated, total_agents, total_lines)
 
     return ConsolidatedReview(
-        id=f"review-{uuid4().hex[:8]}",
+        id=f"review-{secrets.token_hex(4)}",
         created_at=datetime.now(),
         repo=repo,
         pr_number=pr_number,
@@ -1080,7 +1097,7 @@ async def _run_single_cross_agent(
     try:
         if on_status:
             on_status(f"Cross-review: {agent_name}")
-        response = await client._sdk.messages.create(
+        response = await client._create_message(
             model="claude-sonnet-4-6",
             system=[
                 {
@@ -1196,200 +1213,211 @@ async def review_pr(
 
     # Get PR information
     gh = GitHubClient(github_token)
-    pr = gh.get_pull_request(repo, pr_number)
-    repo_obj = gh.get_repo(repo)
-
-    diff = gh.get_pr_diff(pr)
-    files = gh.get_changed_files(pr)
-    context = gh.build_review_context(pr, repo_obj)
-
-    context.repo_config = gh.load_repo_config(repo, ref=pr.head.sha)
-    context.conventions = gh.load_repo_conventions(repo, ref=pr.head.sha)
-
-    secret_scan_exclude = config.review_policy.secret_scan_exclude if config else []
-    secret_findings = scan_for_secrets(diff, exclude_patterns=secret_scan_exclude)
-    if secret_findings:
-        logger.warning(
-            "Secret scanner detected %d potential secret(s) — these bypass aggregation/cross-review",
-            len(secret_findings),
+    try:
+        pr = gh.get_pull_request(repo, pr_number)
+        repo_obj = gh.get_repo(repo)
+
+        diff, files = gh.load_pr_artifacts(pr)
+        context = gh.build_review_context(pr, repo_obj)
+
+        context.repo_config = gh.load_repo_config(repo, ref=pr.head.sha)
+        context.conventions = gh.load_repo_conventions(repo, ref=pr.head.sha)
+
+        secret_scan_exclude = config.review_policy.secret_scan_exclude if config else []
+        secret_findings = scan_for_secrets(diff, exclude_patterns=secret_scan_exclude)
+        if secret_findings:
+            logger.warning(
+                "Secret scanner detected %d potential secret(s) — these bypass aggregation/cross-review",
+                len(secret_findings),
+            )
+
+        raw_ignore = (context.repo_config or {}).get("ignore", [])
+        ignore_patterns = (
+            raw_ignore
+            if isinstance(raw_ignore, list)
+            else [raw_ignore]
+            if isinstance(raw_ignore, str)
+            else []
         )
+        if ignore_patterns:
+            pre_file_count = len(files)
+            files = filter_by_ignore_patterns(files, ignore_patterns)
+            diff = filter_diff_by_ignore_patterns(diff, ignore_patterns)
+            logger.info(
+                "Ignore patterns filtered %d file(s) from prompt inputs",
+                pre_file_count - len(files),
+            )
 
-    raw_ignore = (context.repo_config or {}).get("ignore", [])
-    ignore_patterns = (
-        raw_ignore
-        if isinstance(raw_ignore, list)
-        else [raw_ignore]
-        if isinstance(raw_ignore, str)
-        else []
-    )
-    if ignore_patterns:
-        pre_file_count = len(files)
-        files = filter_by_ignore_patterns(files, ignore_patterns)
-        diff = filter_diff_by_ignore_patterns(diff, ignore_patterns)
+        logger.info(f"Reviewing PR #{pr_number}: {context.pr_title}")
         logger.info(
-            "Ignore patterns filtered %d file(s) from prompt inputs",
-            pre_file_count - len(files),
+            f"Files changed: {context.changed_files_count} (+{context.additions}/-{context.deletions})"
         )
 
-    logger.info(f"Reviewing PR #{pr_number}: {context.pr_title}")
-    logger.info(
-        f"Files changed: {context.changed_files_count} (+{context.additions}/-{context.deletions})"
-    )
-
-    effective = _effective_agent_count(
-        context.additions, context.deletions, context.changed_files_count, num_agents
-    )
-    if effective != num_agents:
-        logger.info(f"Effective agent count: {effective} (requested {num_agents})")
-    num_agents = effective
-    if num_agents <= 2:
-        enable_cross_review = False
-
-    changed_paths = list(files.keys())
-    pr_type, _pr_size = classify_pr(changed_paths, context.additions, context.deletions)
-    if pr_type != "code":
-        logger.info(f"PR type: {pr_type} – using context-aware review rules")
-
-    # Select agents to run (resolve from config.agents, fall back to defaults)
-    configured_names = [a.name for a in (config.agents if config and config.agents else [])]
-    effective_order = configured_names or DEFAULT_AGENT_ORDER
-    agent_order = effective_order[: min(num_agents, len(effective_order))]
-    agents_to_run = [{"name": n} for n in agent_order]
-
-    # When a single agent runs, it must cover ALL perspectives (not just security).
-    _single_agent_comprehensive = num_agents == 1
-
-    session = ReviewSession(
-        repo=repo,
-        head_sha=pr.head.sha,
-        github_budget=anthropic_cfg.per_review_github_request_budget,
-    )
-
-    async with AnthropicClient(anthropic_cfg) as client:
-        system_blocks, user_blocks = await _prepare_shared_context(
-            session=session,
-            gh=gh,
-            pr=pr,
-            diff=diff,
-            changed_file_contents=files,
-            anthropic_cfg=anthropic_cfg,
+        effective = _effective_agent_count(
+            context.additions, context.deletions, context.changed_files_count, num_agents
+        )
+        if effective != num_agents:
+            logger.info(f"Effective agent count: {effective} (requested {num_agents})")
+        num_agents = effective
+        if num_agents <= 2:
+            enable_cross_review = False
+
+        changed_paths = list(files.keys())
+        pr_type, _pr_size = classify_pr(changed_paths, context.additions, context.deletions)
+        if pr_type != "code":
+            logger.info(f"PR type: {pr_type} – using context-aware review rules")
+
+        # Select agents to run (resolve from config.agents, fall back to defaults)
+        configured_names = [a.name for a in (config.agents if config and config.agents else [])]
+        effective_order = configured_names or DEFAULT_AGENT_ORDER
+        agent_order = effective_order[: min(num_agents, len(effective_order))]
+        agents_to_run = [{"name": n} for n in agent_order]
+
+        # When a single agent runs, it must cover ALL perspectives (not just security).
+        _single_agent_comprehensive = num_agents == 1
+
+        session = ReviewSession(
+            repo=repo,
+            head_sha=pr.head.sha,
+            github_budget=anthropic_cfg.per_review_github_request_budget,
         )
 
-        if on_status:
-            on_status("CREATING")
-
-        tasks: list[Any] = []
-        instantiated: list[tuple[str, ReviewAgent]] = []
-        for i, agent_name in enumerate(agent_order):
-            cls = _AGENT_CLASSES.get(agent_name)
-            if not cls:
-                logger.warning("Unknown agent %s; skipping", agent_name)
-                continue
-            agent_cfg = next(
-                (a for a in (config.agents if config else []) if a.name == agent_name), None
+        # One client for both rounds so cross-review reuses the agents' connections
+        async with AnthropicClient(anthropic_cfg) as client:
+            system_blocks, user_blocks = await _prepare_shared_context(
+                session=session,
+                gh=gh,
+                pr=pr,
+                diff=diff,
+                changed_file_contents=files,
+                anthropic_cfg=anthropic_cfg,
             )
-            allow_tools = agent_cfg.allow_tool_use if agent_cfg else True
-            max_tool_calls = agent_cfg.max_tool_calls if agent_cfg else 20
-            registry = (
-                ToolRegistry(
-                    session=session,
-                    github_client=gh,
+
+            if on_status:
+                on_status("CREATING")
+
+            tasks: list[Any] = []
+            instantiated: list[tuple[str, ReviewAgent]] = []
+            for i, agent_name in enumerate(agent_order):
+                cls = _AGENT_CLASSES.get(agent_name)
+                if not cls:
+                    logger.warning("Unknown agent %s; skipping", agent_name)
+                    continue
+                agent_cfg = next(
+                    (a for a in (config.agents if config else []) if a.name == agent_name), None
+                )
+                allow_tools = agent_cfg.allow_tool_use if agent_cfg else True
+                max_tool_calls = agent_cfg.max_tool_calls if agent_cfg else 20
+                registry = (
+                    ToolRegistry(
+                        session=session,
+                        github_client=gh,
+                        agent_id=f"{agent_name}-{i}",
+                        max_calls=max_tool_calls,
+                        per_file_max_bytes=anthropic_cfg.per_file_max_bytes,
+                    )
+                    if allow_tools
+                    else None
+                )
+                # When only 1 agent runs (small PR), override its system blocks
+                # with a comprehensive prompt covering ALL review perspectives.
+                agent_system = system_blocks
+                if _single_agent_comprehensive:
+                    comprehensive_block = {
+                        "type": "text",
+                        "text": (
+                            "**IMPORTANT: You are the ONLY reviewer for this PR. "
+                            "Analyze from ALL perspectives**: security, performance, "
+                            "logic, architecture, and code quality. Do NOT limit "
+                            "yourself to your default focus area."
+                        ),
+                    }
+                    agent_system = [comprehensive_block, *system_blocks]
+
+                agent = cls(
+                    client=client,
                     agent_id=f"{agent_name}-{i}",
-                    max_calls=max_tool_calls,
-                    per_file_max_bytes=anthropic_cfg.per_file_max_bytes,
+                    system_blocks=agent_system,
+                    user_blocks=user_blocks,
+                    tool_registry=registry,
+                    max_tokens=agent_cfg.max_tokens if agent_cfg else 8192,
+                    temperature=agent_cfg.temperature if agent_cfg else 0.3,
+                    thinking_enabled=agent_cfg.thinking_enabled if agent_cfg else None,
                 )
-                if allow_tools
-                else None
-            )
-            # When only 1 agent runs (small PR), override its system blocks
-            # with a comprehensive prompt covering ALL review perspectives.
-            agent_system = system_blocks
-            if _single_agent_comprehensive:
-                comprehensive_block = {
-                    "type": "text",
-                    "text": (
-                        "**IMPORTANT: You are the ONLY reviewer for this PR. "
-                        "Analyze from ALL perspectives**: security, performance, "
-                        "logic, architecture, and code quality. Do NOT limit "
-                        "yourself to your default focus area."
-                    ),
+                instantiated.append((agent_name, agent))
+                tasks.append(_run_agent_safe(agent, context, on_status))
+
+            agent_results = await asyncio.gather(*tasks)
+
+            all_findings: list[tuple[str, list[dict[str, Any]], str]] = []
+            for (agent_name, _agent), result in zip(instantiated, agent_results, strict=False):
+                if isinstance(result, Exception):
+                    all_findings.append((agent_name, [], f"Agent failed: {result}"))
+                    continue
+                dicts = [_review_finding_to_dict(f) for f in result.findings]
+                all_findings.append((agent_name, dicts, result.summary))
+
+            # Aggregate findings
+            confidence_thresholds = None
+            if config:
+                confidence_thresholds = {
+                    Severity.CRITICAL: config.aggregator.min_confidence_critical,
+                    Severity.WARNING: config.aggregator.min_confidence_warning,
+                    Severity.SUGGESTION: config.aggregator.min_confidence_suggestion,
+                    Severity.NITPICK: config.aggregator.min_confidence_nitpick,
                 }
-                agent_system = [comprehensive_block, *system_blocks]
-
-            agent = cls(
-                client=client,
-                agent_id=f"{agent_name}-{i}",
-                system_blocks=agent_system,
-                user_blocks=user_blocks,
-                tool_registry=registry,
-                max_tokens=agent_cfg.max_tokens if agent_cfg else 8192,
-                temperature=agent_cfg.temperature if agent_cfg else 0.3,
-                thinking_enabled=agent_cfg.thinking_enabled if agent_cfg else None,
+            total_lines = context.additions + context.deletions
+            review = aggregate_findings(
+                list(all_findings),
+                repo,
+                pr_number,
+                confidence_thresholds=confidence_thresholds,
+                total_lines=total_lines,
             )
-            instantiated.append((agent_name, agent))
-            tasks.append(_run_agent_safe(agent, context, on_status))
-
-        agent_results = await asyncio.gather(*tasks)
-
-    all_findings: list[tuple[str, list[dict[str, Any]], str]] = []
-    for (agent_name, _agent), result in zip(instantiated, agent_results, strict=False):
-        if isinstance(result, Exception):
-            all_findings.append((agent_name, [], f"Agent failed: {result}"))
-            continue
-        dicts = [_review_finding_to_dict(f) for f in result.findings]
-        all_findings.append((agent_name, dicts, result.summary))
-
-    # Aggregate findings
-    confidence_thresholds = None
-    if config:
-        confidence_thresholds = {
-            Severity.CRITICAL: config.aggregator.min_confidence_critical,
-            Severity.WARNING: config.aggregator.min_confidence_warning,
-            Severity.SUGGESTION: config.aggregator.min_confidence_suggestion,
-            Severity.NITPICK: config.aggregator.min_confidence_nitpick,
-        }
-    total_lines = context.additions + context.deletions
-    review = aggregate_findings(
-        list(all_findings),
-        repo,
-        pr_number,
-        confidence_thresholds=confidence_thresholds,
-        total_lines=total_lines,
-    )
-
-    # Optional: cross-review round (agents validate and rank findings).
-    # Note: cross-review doubles API calls; disable with --no-cross-review for cost-sensitive use.
-    if enable_cross_review and num_agents > 1 and review.findings and not review.all_agents_failed:
-        # Only run cross-review with agents that succeeded in round 1
-        agents_for_cross = [c for c in agents_to_run if c["name"] not in review.failed_agents]
-        if not agents_for_cross:
-            logger.info("Skipping cross-review: no round-1 agents succeeded")
-        else:
-            logger.info("Running cross-review round (validate and rank findings)...")
-            async with AnthropicClient(anthropic_cfg) as cross_client:
-                cross_results = await run_cross_review_round(
-                    client=cross_client,
-                    session=session,
-                    gh=gh,
-                    pr=pr,
-                    review=review,
-                    context=context,
-                    diff=diff,
-                    agents_to_run=agents_for_cross,
-                    anthropic_cfg=anthropic_cfg,
-                    on_status=on_status,
-                )
-            if cross_results:
-                review = apply_cross_review(review, cross_results, min_validation_agreement)
-                logger.info(f"Cross-review done: {len(review.findings)} findings after validation")
-
-    if secret_findings:
-        review.findings = secret_findings + review.findings
 
-    review.total_review_time_ms = int((time.time() - start_time) * 1000)
+            # Optional: cross-review round (agents validate and rank findings).
+            # Note: cross-review doubles API calls; disable with --no-cross-review for cost-sensitive use.
+            if (
+                enable_cross_review
+                and num_agents > 1
+                and review.findings
+                and not review.all_agents_failed
+            ):
+                # Only run cross-review with agents that succeeded in round 1
+                agents_for_cross = [
+                    c for c in agents_to_run if c["name"] not in review.failed_agents
+                ]
+                if not agents_for_cross:
+                    logger.info("Skipping cross-review: no round-1 agents succeeded")
+                else:
+                    logger.info("Running cross-review round (validate and rank findings)...")
+                    cross_results = await run_cross_review_round(
+                        client=client,
+                        session=session,
+                        gh=gh,
+                        pr=pr,
+                        review=review,
+                        context=context,
+                        diff=diff,
+                        agents_to_run=agents_for_cross,
+                        anthropic_cfg=anthropic_cfg,
+                        on_status=on_status,
+                    )
+                    if cross_results:
+                        review = apply_cross_review(review, cross_results, min_validation_agreement)
+                        logger.info(
+                            f"Cross-review done: {len(review.findings)} findings after validation"
+                        )
+
+        if secret_findings:
+            review.findings = secret_findings + review.findings
+
+        review.total_review_time_ms = int((time.time() - start_time) * 1000)
 
-    logger.info(
-        f"Review complete: {len(review.findings)} findings from {review.agent_count} agent(s) in {review.total_review_time_ms}ms"
-    )
+        logger.info(
+            f"Review complete: {len(review.findings)} findings from {review.agent_count} agent(s) in {review.total_review_time_ms}ms"
+        )
 
-    return review
+        return review
+    finally:
+        gh.close()
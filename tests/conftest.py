@@ -3,6 +3,7 @@
 from pathlib import Path
 
 import pytest
+import requests
 
 # Sample diffs for testing
 SAMPLE_SECURE_DIFF = """\
@@ -123,3 +124,19 @@ def mock_review_context() -> dict:
 def fixtures_dir() -> Path:
     """Path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def _block_real_http(request, monkeypatch):
+    """Fail fast on real HTTP from requests sessions outside integration tests.
+
+    Without this, GraphQL calls made by unpatched clients would go through
+    the session's retry/backoff policy before giving up.
+    """
+    if request.node.get_closest_marker("integration"):
+        return
+
+    def _refuse(_self, req, **_kwargs):
+        raise requests.ConnectionError(f"network disabled in tests: {req.url}")
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", _refuse)
@@ -241,3 +241,191 @@ class TestReviewAggregator:
         assert consolidated.agent_count == 2
         # Clean review should have good quality score
         assert consolidated.review_quality_score >= 0.9
+
+    def test_clusters_per_file_in_first_seen_order(self):
+        """Interleaved findings cluster within their file and keep first-seen order."""
+        from ai_reviewer.models.findings import Category, ReviewFinding, Severity
+        from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+
+        def finding(path: str, title: str) -> ReviewFinding:
+            return ReviewFinding(
+                file_path=path,
+                line_start=10,
+                line_end=None,
+                severity=Severity.WARNING,
+                category=Category.LOGIC,
+                title=title,
+                description="Same description",
+                suggested_fix=None,
+                confidence=0.8,
+            )
+
+        tagged = [
+            ("a1", finding("a.py", "Off by one")),
+            ("a1", finding("b.py", "Off by one")),
+            ("a2", finding("a.py", "Off by one")),
+            ("a2", finding("c.py", "Unchecked None")),
+            ("a3", finding("b.py", "Off by one")),
+        ]
+
+        clusters = ReviewAggregator()._cluster_findings(tagged)
+
+        assert [[agent for agent, _ in c] for c in clusters] == [["a1", "a2"], ["a1", "a3"], ["a2"]]
+        assert [c[0][1].file_path for c in clusters] == ["a.py", "b.py", "c.py"]
+
+    def test_identical_findings_compared_once(self):
+        """Byte-identical findings share a cluster without extra similarity checks."""
+        from unittest.mock import patch
+
+        from ai_reviewer.models.findings import Category, ReviewFinding, Severity
+        from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+
+        def finding(title: str, confidence: float) -> ReviewFinding:
+            return ReviewFinding(
+                file_path="a.py",
+                line_start=10,
+                line_end=None,
+                severity=Severity.WARNING,
+                category=Category.LOGIC,
+                title=title,
+                description="Same description",
+                suggested_fix=None,
+                confidence=confidence,
+            )
+
+        tagged = [
+            ("a1", finding("Off by one", 0.8)),
+            ("a2", finding("Unchecked None", 0.9)),
+            ("a3", finding("Off by one", 0.7)),
+            ("a4", finding("Off by one", 0.6)),
+        ]
+
+        aggregator = ReviewAggregator()
+        with patch.object(
+            aggregator, "_texts_similar", wraps=aggregator._texts_similar
+        ) as texts_similar:
+            clusters = aggregator._cluster_findings(tagged)
+
+        assert texts_similar.call_count == 1
+        assert [[agent for agent, _ in c] for c in clusters] == [["a1", "a3", "a4"], ["a2"]]
+
+    def test_incremental_matches_batch_aggregate(self):
+        """Adding reviews one at a time gives the same findings as aggregate()."""
+        from ai_reviewer.models.findings import Category, ReviewFinding, Severity
+        from ai_reviewer.models.review import AgentReview
+        from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+
+        def review(agent_id: str, *titles: str) -> AgentReview:
+            return AgentReview(
+                agent_id=agent_id,
+                agent_type="claude",
+                focus_areas=["security"],
+                findings=[
+                    ReviewFinding(
+                        file_path="auth/login.py",
+                        line_start=15,
+                        line_end=16,
+                        severity=Severity.WARNING,
+                        category=Category.SECURITY,
+                        title=title,
+                        description="User input reaches the query",
+                        suggested_fix=None,
+                        confidence=0.9,
+                    )
+                    for title in titles
+                ],
+                summary="",
+                review_time_ms=1000,
+            )
+
+        reviews = [
+            review("agent-1", "SQL Injection"),
+            review("agent-2", "SQL Injection", "Missing rate limit"),
+            review("agent-3"),
+        ]
+        aggregator = ReviewAggregator()
+
+        incremental = aggregator.begin()
+        for r in reviews:
+            incremental.add_review(r)
+        streamed = incremental.finalize("org/repo", 7)
+        batch = aggregator.aggregate(reviews, "org/repo", 7)
+
+        assert streamed.agent_count == 3
+        assert streamed.pr_number == 7
+        assert [(f.title, f.agreeing_agents) for f in streamed.findings] == [
+            (f.title, f.agreeing_agents) for f in batch.findings
+        ]
+        assert streamed.summary == batch.summary
+
+    def test_incremental_without_reviews_is_empty(self):
+        """Finalizing before any review arrives gives the empty review."""
+        from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+
+        consolidated = ReviewAggregator().begin().finalize()
+
+        assert consolidated.agent_count == 0
+        assert consolidated.findings == []
+
+    def test_singleton_cluster_copies_finding(self):
+        """A lone finding becomes a consolidated finding with its own fields."""
+        from ai_reviewer.models.findings import Category, ReviewFinding, Severity
+        from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+
+        finding = ReviewFinding(
+            file_path="auth/login.py",
+            line_start=15,
+            line_end=16,
+            severity=Severity.CRITICAL,
+            category=Category.SECURITY,
+            title="SQL Injection",
+            description="User input in query",
+            suggested_fix="Use params",
+            confidence=0.95,
+        )
+
+        merged = ReviewAggregator()._merge_cluster([("agent-1", finding)], total_agents=4)
+
+        assert merged.id.startswith("finding-")
+        assert merged.severity == Severity.CRITICAL
+        assert merged.description == "User input in query"
+        assert merged.suggested_fix == "Use params"
+        assert merged.consensus_score == 0.25
+        assert merged.agreeing_agents == ["agent-1"]
+        assert merged.confidence == 0.95
+        assert merged.original_findings == [finding]
+
+    def test_repeated_wording_compared_once(self):
+        """The same text pair in different files is only scored once per aggregation."""
+        from unittest.mock import patch
+
+        from ai_reviewer.models.findings import Category, ReviewFinding, Severity
+        from ai_reviewer.orchestrator.aggregator import ReviewAggregator
+
+        def finding(path: str, title: str) -> ReviewFinding:
+            return ReviewFinding(
+                file_path=path,
+                line_start=10,
+                line_end=None,
+                severity=Severity.NITPICK,
+                category=Category.STYLE,
+                title=title,
+                description="Public function lacks a docstring",
+                suggested_fix=None,
+                confidence=0.8,
+            )
+
+        tagged = [
+            ("a1", finding(path, title))
+            for path in ("a.py", "b.py", "c.py")
+            for title in ("Missing docstring", "Unused import")
+        ]
+
+        aggregator = ReviewAggregator()
+        with patch.object(
+            aggregator, "_texts_similar", wraps=aggregator._texts_similar
+        ) as texts_similar:
+            clusters = aggregator._cluster_findings(tagged)
+
+        assert texts_similar.call_count == 1
+        assert len(clusters) == 6
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -355,3 +356,29 @@ async def test_run_completion_uses_system_and_user():
     call_kwargs = client._sdk.messages.create.call_args.kwargs
     assert call_kwargs["system"] == "sys prompt"
     assert call_kwargs["messages"] == [{"role": "user", "content": "user prompt"}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_capped():
+    cfg = AnthropicApiConfig(api_key="sk-test", max_concurrent_requests=2)
+    client = AnthropicClient(cfg)
+    client._sdk = MagicMock()
+
+    in_flight = 0
+    peak = 0
+
+    async def create(**_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _fake_response("result")
+
+    client._sdk.messages.create = create
+
+    await asyncio.gather(
+        *(client.run_completion(model="claude-sonnet-4-6", system="s", user="u") for _ in range(5))
+    )
+
+    assert peak == 2
@@ -3,6 +3,8 @@
 import textwrap
 from pathlib import Path
 
+import pytest
+
 from ai_reviewer.config import load_config
 
 
@@ -37,3 +39,10 @@ def test_load_anthropic_config(tmp_path: Path, monkeypatch):
     assert cfg.agents[0].thinking_budget_tokens == 8192
     assert cfg.agents[0].allow_tool_use is True
     assert cfg.agents[0].max_tool_calls == 20
+
+
+def test_rejects_non_positive_max_concurrent_requests(tmp_path: Path):
+    cfg_file = tmp_path / "config.yaml"
+    cfg_file.write_text("anthropic:\n  max_concurrent_requests: 0\n")
+    with pytest.raises(ValueError, match="max_concurrent_requests must be at least 1"):
+        load_config(cfg_file)
@@ -1286,6 +1286,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.get_review_metadata.return_value = meta
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch("ai_reviewer.cli.load_config") as mock_load,
@@ -1359,6 +1360,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.get_review_metadata.return_value = meta
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch("ai_reviewer.cli.load_config") as mock_load,
@@ -1450,6 +1452,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.compute_review_delta.return_value = normal_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch("ai_reviewer.cli.load_config") as mock_load,
@@ -1529,6 +1532,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.compute_review_delta.return_value = normal_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch("ai_reviewer.cli.load_config") as mock_load,
@@ -1598,6 +1602,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.get_review_metadata.return_value = meta
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch.dict(
@@ -1696,6 +1701,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.compute_review_delta.return_value = normal_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch.dict(
@@ -1773,6 +1779,7 @@ class TestLgtmLightweightRecheck:
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.compute_review_delta.return_value = normal_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch.dict(
@@ -1993,6 +2000,7 @@ class TestCLIPreAgentChecks:
         mock_gh.get_review_metadata.return_value = meta
         mock_gh.check_lgtm_fast_path.return_value = lgtm_delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch("ai_reviewer.cli.load_config") as mock_load,
@@ -2066,6 +2074,7 @@ class TestCLIPreAgentChecks:
         mock_gh.check_lgtm_fast_path.return_value = None
         mock_gh.compute_review_delta.return_value = delta
         mock_gh.get_previous_review_comments.return_value = [_prev_comment()]
+        mock_gh.get_pr_files.return_value = mock_pr.get_files.return_value
 
         with (
             patch("ai_reviewer.cli.load_config") as mock_load,
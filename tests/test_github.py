@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from github.ContentFile import ContentFile
 
 
 class TestGitHubClient:
@@ -14,7 +15,7 @@ class TestGitHubClient:
 
         from ai_reviewer.github.client import GitHubClient
 
-        mock_file = MagicMock(filename="foo.py", status="modified")
+        mock_file = MagicMock(filename="foo.py", status="modified", changes=4)
         mock_repo = MagicMock()
         mock_repo.get_contents.side_effect = GithubException(
             status=403, data={"message": "Forbidden"}, headers={}
@@ -30,6 +31,33 @@ class TestGitHubClient:
                 client.get_changed_files(mock_pr)
             assert mock_repo.get_contents.call_count == 1
 
+    def test_get_changed_files_skips_binary_lockfiles_and_huge_files(self):
+        """Unreviewable files are filtered out before any content fetch."""
+        from ai_reviewer.github.client import GitHubClient
+
+        files = [
+            MagicMock(filename="src/app.py", status="modified", changes=10),
+            MagicMock(filename="assets/logo.PNG", status="added", changes=0),
+            MagicMock(filename="web/package-lock.json", status="modified", changes=40),
+            MagicMock(filename="poetry.lock", status="modified", changes=12),
+            MagicMock(filename="dist/bundle.min.js", status="modified", changes=1),
+            MagicMock(filename="generated.py", status="added", changes=20000),
+        ]
+        mock_repo = MagicMock()
+        mock_repo.get_contents.return_value = MagicMock(
+            spec=ContentFile, decoded_content=b"print('hi')\n"
+        )
+        mock_pr = MagicMock()
+        mock_pr.get_files.return_value = files
+        mock_pr.base.repo = mock_repo
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+            result = client.get_changed_files(mock_pr)
+
+        assert list(result) == ["src/app.py"]
+        mock_repo.get_contents.assert_called_once()
+
     def test_extracts_pr_diff(self):
         """Test extracting diff from a PR."""
         from ai_reviewer.github.client import GitHubClient
@@ -52,6 +80,219 @@ class TestGitHubClient:
             assert "auth/login.py" in diff
             assert "+new code" in diff
 
+    def test_pr_diff_layout_across_files(self):
+        """Files are separated by a blank line and patchless files are skipped."""
+        from ai_reviewer.github.client import GitHubClient
+
+        mock_pr = MagicMock()
+        mock_pr.get_files.return_value = [
+            MagicMock(filename="a.py", patch="@@ -1 +1 @@\n+a"),
+            MagicMock(filename="img.png", patch=None),
+            MagicMock(filename="b.py", patch="@@ -1 +1 @@\n+b"),
+        ]
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        assert client.get_pr_diff(mock_pr) == (
+            "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n@@ -1 +1 @@\n+a\n"
+            "\n"
+            "diff --git a/b.py b/b.py\n--- a/b.py\n+++ b/b.py\n@@ -1 +1 @@\n+b\n"
+        )
+
+    def test_changed_files_fetched_concurrently_keep_order(self):
+        """Contents come back in PR order; a failed fetch only drops that file."""
+        from ai_reviewer.github.client import GitHubClient
+
+        names = [f"f{i}.py" for i in range(12)]
+        mock_pr = MagicMock()
+        mock_pr.get_files.return_value = [
+            MagicMock(filename=n, status="modified", changes=1) for n in names
+        ]
+
+        def get_contents(path, **_kwargs):
+            if path == "f3.py":
+                raise RuntimeError("boom")
+            return MagicMock(spec=ContentFile, decoded_content=path.encode())
+
+        mock_pr.base.repo.get_contents.side_effect = get_contents
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        files = client.get_changed_files(mock_pr)
+
+        assert list(files) == [n for n in names if n != "f3.py"]
+        assert files["f0.py"] == "f0.py"
+
+    def test_changed_files_batch_fetched_via_graphql(self):
+        """Text blobs come from batched GraphQL; only the rest fall back to REST."""
+        from ai_reviewer.github.client import GitHubClient
+
+        names = [f"f{i}.py" for i in range(51)]
+        mock_pr = MagicMock()
+        mock_pr.head.sha = "abc"
+        mock_pr.base.repo.full_name = "org/repo"
+        mock_pr.get_files.return_value = [
+            MagicMock(filename=n, status="modified", changes=1) for n in names
+        ]
+        mock_pr.base.repo.get_contents.return_value = MagicMock(
+            spec=ContentFile, decoded_content=b"rest"
+        )
+
+        def graphql(_query, variables):
+            blobs = {}
+            for key, expr in variables.items():
+                if key.startswith("e"):
+                    path = expr.split(":", 1)[1]
+                    binary = path == "f1.py"
+                    blobs[f"f{key[1:]}"] = {"text": path, "isBinary": binary, "isTruncated": False}
+            return {"repository": blobs}
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+        client._graphql_request = MagicMock(side_effect=graphql)
+
+        files = client.get_changed_files(mock_pr)
+
+        assert client._graphql_request.call_count == 2
+        assert client._graphql_request.call_args_list[0].args[1]["e0"] == "abc:f0.py"
+        assert list(files) == names
+        assert files["f0.py"] == "f0.py"
+        assert files["f1.py"] == "rest"
+        mock_pr.base.repo.get_contents.assert_called_once_with("f1.py", ref="abc")
+
+    def test_listings_use_max_page_size(self):
+        """PyGithub listings fetch 100 items per page instead of the default 30."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github") as mock_github:
+            GitHubClient(token="test-token")
+
+        assert mock_github.call_args.kwargs["per_page"] == 100
+
+    def test_pygithub_keeps_a_connection_pool(self):
+        """PyGithub is given a pool large enough for the concurrent workers."""
+        from ai_reviewer.github.client import _CONTENT_FETCH_WORKERS, GitHubClient
+
+        with patch("ai_reviewer.github.client.Github") as mock_github:
+            GitHubClient(token="test-token", base_url="https://ghe.example/api/v3")
+
+        assert mock_github.call_args.kwargs["pool_size"] >= _CONTENT_FETCH_WORKERS
+
+    def test_pr_diff_uses_diff_media_type(self):
+        """get_pr_diff fetches GitHub's own diff in one request when available."""
+        from ai_reviewer.github.client import GitHubClient
+
+        mock_pr = MagicMock()
+        mock_pr.number = 5
+        mock_pr.base.repo.full_name = "org/repo"
+        mock_resp = MagicMock(text="diff --git a/x b/x\n", status_code=200, headers={})
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token", base_url="https://ghe.example/api/v3")
+
+        with patch.object(client._http, "get", return_value=mock_resp) as mock_get:
+            assert client.get_pr_diff(mock_pr) == "diff --git a/x b/x\n"
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0] == "https://ghe.example/api/v3/repos/org/repo/pulls/5"
+        assert mock_get.call_args.kwargs["headers"]["Accept"] == "application/vnd.github.v3.diff"
+        mock_pr.get_files.assert_not_called()
+
+    def test_conditional_get_revalidates_with_etag(self):
+        """A cached body is sent back with If-None-Match and reused on 304."""
+        from ai_reviewer.github import client as client_mod
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        first = MagicMock(status_code=200, text='{"Python": 10}', headers={"ETag": '"v1"'})
+        not_modified = MagicMock(status_code=304, text="", headers={})
+        with (
+            patch.dict(client_mod._ETAG_CACHE, clear=True),
+            patch.object(client._http, "get", side_effect=[first, not_modified]) as mock_get,
+        ):
+            assert client._conditional_get("/repos/o/r/languages", "application/json") == (
+                '{"Python": 10}'
+            )
+            assert client._conditional_get("/repos/o/r/languages", "application/json") == (
+                '{"Python": 10}'
+            )
+
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    def test_etag_cache_bounded_by_body_size(self):
+        """Old entries are evicted past the size budget and oversized bodies are not cached."""
+        from ai_reviewer.github import client as client_mod
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        def resp(text):
+            return MagicMock(status_code=200, text=text, headers={"ETag": '"v"'})
+
+        with (
+            patch.dict(client_mod._ETAG_CACHE, clear=True),
+            patch.object(client_mod, "_ETAG_CACHE_MAX_CHARS", 10),
+            patch.object(
+                client._http,
+                "get",
+                side_effect=[resp("aaaa"), resp("bbbb"), resp("cccc"), resp("x" * 11)],
+            ),
+        ):
+            for name in ("a", "b", "c", "big"):
+                client._conditional_get(f"/repos/o/{name}", "application/json")
+
+            assert [key[1].rsplit("/", 1)[1] for key in client_mod._ETAG_CACHE] == ["b", "c"]
+
+    def test_pr_diff_falls_back_to_patches_on_error(self):
+        """A failed diff request (e.g. 406 for huge diffs) rebuilds from file patches."""
+        import requests
+
+        from ai_reviewer.github.client import GitHubClient
+
+        mock_pr = MagicMock()
+        mock_pr.get_files.return_value = [MagicMock(filename="a.py", patch="@@ -1 +1 @@\n+a")]
+        mock_resp = MagicMock()
+        mock_resp.raise_for_status.side_effect = requests.HTTPError(
+            response=MagicMock(status_code=406)
+        )
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        with patch.object(client._http, "get", return_value=mock_resp):
+            diff = client.get_pr_diff(mock_pr)
+
+        assert diff.startswith("diff --git a/a.py b/a.py\n")
+
+    def test_load_pr_artifacts_matches_separate_calls(self):
+        """load_pr_artifacts returns the same diff and contents as the two getters."""
+        from ai_reviewer.github.client import GitHubClient
+
+        mock_pr = MagicMock()
+        mock_pr.number = 3
+        mock_pr.get_files.return_value = [
+            MagicMock(filename="a.py", patch="@@ -1 +1 @@\n+a", status="modified", changes=1),
+            MagicMock(filename="gone.py", patch="@@ -1 +0,0 @@\n-x", status="removed", changes=1),
+        ]
+        mock_pr.base.repo.get_contents.return_value = MagicMock(
+            spec=ContentFile, decoded_content=b"a = 1\n"
+        )
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        diff, files = client.load_pr_artifacts(mock_pr)
+
+        assert diff == client.get_pr_diff(mock_pr)
+        assert files == {"a.py": "a = 1\n"}
+        mock_pr.get_files.assert_called_once()
+
     def test_extra_reviewer_users_included_in_allowed_users(self):
         """extra_reviewer_users passed to GitHubClient are included in allowed set."""
         from ai_reviewer.github.client import GitHubClient
@@ -78,6 +319,7 @@ class TestGitHubClient:
 
     def test_builds_review_context(self):
         """Test building review context from PR."""
+        from ai_reviewer.github import client as client_mod
         from ai_reviewer.github.client import GitHubClient
 
         mock_pr = MagicMock()
@@ -90,20 +332,30 @@ class TestGitHubClient:
         mock_pr.additions = 100
         mock_pr.deletions = 10
         mock_pr.changed_files = 5
-        mock_pr.get_labels.return_value = [MagicMock(name="enhancement")]
+        label = MagicMock()
+        label.name = "enhancement"
+        mock_pr.labels = [label]
 
         mock_repo = MagicMock()
         mock_repo.full_name = "test-org/test-repo"
         mock_repo.get_languages.return_value = {"Python": 1000, "JavaScript": 500}
 
-        with patch("ai_reviewer.github.client.Github"):
+        with (
+            patch("ai_reviewer.github.client.Github"),
+            patch.dict(client_mod._LANGUAGES_CACHE, clear=True),
+        ):
             client = GitHubClient(token="test-token")
             context = client.build_review_context(mock_pr, mock_repo)
+            # A fresh client (next webhook event) reuses the process-wide cache
+            GitHubClient(token="test-token").build_review_context(mock_pr, mock_repo)
 
             assert context.pr_number == 42
             assert context.pr_title == "Add authentication"
             assert context.author == "testuser"
+            assert context.labels == ["enhancement"]
             assert "Python" in context.repo_languages
+            mock_pr.get_labels.assert_not_called()
+            mock_repo.get_languages.assert_called_once()
 
     def test_build_review_comments_uses_plain_dict_payloads(self):
         """Inline review payloads should not depend on PyGithub's internal ReviewComment type."""
@@ -178,6 +430,34 @@ class TestGitHubPRHandler:
             await handle_pr_event(event)
             mock_handler.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_rapid_events_for_same_pr_coalesce(self):
+        """Events arriving during a review fold into a single follow-up run."""
+        import asyncio
+
+        from ai_reviewer.github import webhook
+        from ai_reviewer.github.webhook import PREvent, handle_pr_event
+
+        release = asyncio.Event()
+        calls = []
+
+        async def handler(repo, pr_number):
+            calls.append((repo, pr_number))
+            if len(calls) == 1:
+                await release.wait()
+
+        event = PREvent(repo="o/r", pr_number=1, action="synchronize")
+        with patch.object(webhook, "_review_handler", handler):
+            first = asyncio.create_task(handle_pr_event(event))
+            await asyncio.sleep(0)
+            await handle_pr_event(event)
+            await handle_pr_event(event)
+            release.set()
+            await first
+
+        assert calls == [("o/r", 1), ("o/r", 1)]
+        assert webhook._inflight_reviews == {}
+
     @pytest.mark.asyncio
     async def test_ai_review_comment_triggers_review(self):
         """Posting '/ai-review' as a PR comment should trigger a review."""
@@ -214,6 +494,286 @@ class TestGitHubPRHandler:
             await _handle_issue_comment_event(payload)
             mock_handler.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_review_worker_survives_failing_jobs(self):
+        """A failing job is logged and the worker moves on to the next one."""
+        import asyncio
+
+        from ai_reviewer.github.webhook import _review_worker
+
+        done = []
+
+        async def ok():
+            done.append("ok")
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        queue = asyncio.Queue()
+        for job in (boom, ok):
+            queue.put_nowait(job)
+        worker = asyncio.create_task(_review_worker(queue))
+        await queue.join()
+        worker.cancel()
+
+        assert done == ["ok"]
+
+    def test_webhook_rejects_events_when_review_queue_full(self):
+        """Events beyond the queue capacity get a 503 instead of piling up."""
+        import json
+
+        from fastapi.testclient import TestClient
+
+        from ai_reviewer.github import webhook
+
+        body = json.dumps(
+            {"action": "opened", "repository": {"full_name": "o/r"}, "pull_request": {"number": 1}}
+        ).encode()
+        with (
+            patch.dict("os.environ", {"REVIEW_QUEUE_SIZE": "1"}),
+            patch.object(webhook, "_review_handler", AsyncMock()),
+            patch.object(webhook, "_push_handler", AsyncMock()),
+        ):
+            # Without entering the client the lifespan never starts workers,
+            # so queued events stay put.
+            client = TestClient(webhook.create_webhook_app(webhook_secret=""))
+            headers = {"X-GitHub-Event": "pull_request"}
+            first = client.post("/webhook", content=body, headers=headers)
+            second = client.post("/webhook", content=body, headers=headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 503
+
+    def test_app_http_client_scoped_to_lifespan(self):
+        """The GitHub App HTTP client opens with the app and is closed on shutdown."""
+        from fastapi.testclient import TestClient
+
+        from ai_reviewer.github import webhook
+
+        with (
+            patch.object(webhook, "_review_handler", AsyncMock()),
+            patch.object(webhook, "_push_handler", AsyncMock()),
+            TestClient(webhook.create_webhook_app(webhook_secret="")),
+        ):
+            http = webhook._get_app_http()
+            assert not http.is_closed
+
+        assert http.is_closed
+        with pytest.raises(RuntimeError):
+            webhook._get_app_http()
+
+    def test_verify_signature(self):
+        """Signatures match GitHub's sha256 HMAC and repeated checks stay independent."""
+        import hashlib
+        import hmac
+
+        from ai_reviewer.github.webhook import verify_signature
+
+        body = b'{"action": "opened"}'
+        good = "sha256=" + hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+
+        assert verify_signature(body, good, "s3cret")
+        assert verify_signature(body, good, "s3cret")
+        assert not verify_signature(body + b" ", good, "s3cret")
+        assert not verify_signature(body, good, "other")
+        assert not verify_signature(body, good.removeprefix("sha256="), "s3cret")
+
+    def test_webhook_ignores_unhandled_events_before_parsing(self):
+        """Unhandled event types are acknowledged without signature check or JSON parse."""
+        from fastapi.testclient import TestClient
+
+        from ai_reviewer.github import webhook
+
+        with (
+            patch.object(webhook, "_review_handler", AsyncMock()),
+            patch.object(webhook, "_push_handler", AsyncMock()),
+        ):
+            client = TestClient(webhook.create_webhook_app(webhook_secret="s3cret"))
+
+            ignored = client.post(
+                "/webhook", content=b"not json", headers={"X-GitHub-Event": "check_run"}
+            )
+            rejected = client.post(
+                "/webhook", content=b"not json", headers={"X-GitHub-Event": "pull_request"}
+            )
+
+        assert ignored.status_code == 200
+        assert ignored.json() == {"status": "ok"}
+        assert rejected.status_code == 401
+
+    def test_webhook_rejects_malformed_json(self):
+        """A signed pull_request event with an unparseable body is a 400."""
+        import hashlib
+        import hmac
+
+        from fastapi.testclient import TestClient
+
+        from ai_reviewer.github import webhook
+
+        body = b"{not json"
+        signature = "sha256=" + hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        with (
+            patch.object(webhook, "_review_handler", AsyncMock()),
+            patch.object(webhook, "_push_handler", AsyncMock()),
+        ):
+            client = TestClient(webhook.create_webhook_app(webhook_secret="s3cret"))
+            response = client.post(
+                "/webhook",
+                content=body,
+                headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": signature},
+            )
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Invalid JSON")
+
+    def test_webhook_accepts_signed_streamed_body(self):
+        """A correctly signed pull_request event is verified and dispatched."""
+        import hashlib
+        import hmac
+        import json
+
+        from fastapi.testclient import TestClient
+
+        from ai_reviewer.github import webhook
+
+        body = json.dumps(
+            {
+                "action": "labeled",
+                "repository": {"full_name": "o/r"},
+                "pull_request": {"number": 3},
+            }
+        ).encode()
+        signature = "sha256=" + hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        with (
+            patch.object(webhook, "_review_handler", AsyncMock()),
+            patch.object(webhook, "_push_handler", AsyncMock()),
+        ):
+            client = TestClient(webhook.create_webhook_app(webhook_secret="s3cret"))
+            ok = client.post(
+                "/webhook",
+                content=body,
+                headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": signature},
+            )
+            tampered = client.post(
+                "/webhook",
+                content=body + b" ",
+                headers={"X-GitHub-Event": "pull_request", "X-Hub-Signature-256": signature},
+            )
+
+        assert ok.status_code == 200
+        assert ok.json() == {"status": "ok"}
+        assert tampered.status_code == 401
+
+    def test_health_and_ping_return_json(self):
+        """Pre-encoded replies are served as JSON."""
+        from fastapi.testclient import TestClient
+
+        from ai_reviewer.github import webhook
+
+        with (
+            patch.object(webhook, "_review_handler", AsyncMock()),
+            patch.object(webhook, "_push_handler", AsyncMock()),
+        ):
+            client = TestClient(webhook.create_webhook_app(webhook_secret=""))
+            health = client.get("/health")
+            ping = client.post("/webhook", content=b"{}", headers={"X-GitHub-Event": "ping"})
+
+        assert health.headers["content-type"] == "application/json"
+        assert health.json() == {"status": "healthy", "service": "ai-code-reviewer"}
+        assert ping.json() == {"status": "pong"}
+
+
+class TestGitHubAppToken:
+    """Tests for GitHub App installation token caching in the webhook server."""
+
+    def _client(self, expires_at="2099-01-01T00:00:00Z"):
+        installation = MagicMock(status_code=200)
+        installation.json.return_value = {"id": 123}
+        access = MagicMock(status_code=201)
+        access.json.return_value = {"token": "ghs_abc", "expires_at": expires_at}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=installation)
+        client.post = AsyncMock(return_value=access)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_token_reused_until_expiry(self):
+        """A second call for the same owner makes no API calls."""
+        from ai_reviewer.github import webhook
+
+        client = self._client()
+        with (
+            patch.dict(webhook._app_token_cache, clear=True),
+            patch.dict(webhook._installation_ids, clear=True),
+            patch("jwt.encode", return_value="jwt"),
+            patch.object(webhook, "_load_app_private_key", return_value="key"),
+            patch.object(webhook, "_get_app_http", return_value=client),
+        ):
+            assert await webhook._get_github_app_token("1", "pem", "org/a") == "ghs_abc"
+            assert await webhook._get_github_app_token("1", "pem", "org/b") == "ghs_abc"
+
+        client.get.assert_awaited_once()
+        client.post.assert_awaited_once()
+
+    def test_private_key_parsed_once(self):
+        """The PEM is parsed into a key object once and reused."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        from ai_reviewer.github.webhook import _load_app_private_key
+
+        pem = (
+            rsa.generate_private_key(public_exponent=65537, key_size=2048)
+            .private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+            .decode()
+        )
+
+        assert _load_app_private_key(pem) is _load_app_private_key(pem)
+
+    def test_non_rsa_private_key_rejected(self):
+        """RS256 needs an RSA key, so other key types fail at load time."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+
+        from ai_reviewer.github.webhook import _load_app_private_key
+
+        pem = (
+            ed25519.Ed25519PrivateKey.generate()
+            .private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+            .decode()
+        )
+
+        with pytest.raises(ValueError, match="must be RSA"):
+            _load_app_private_key(pem)
+
+    @pytest.mark.asyncio
+    async def test_expired_token_refreshed_without_installation_lookup(self):
+        """An expiring token is re-issued using the cached installation ID."""
+        from ai_reviewer.github import webhook
+
+        client = self._client(expires_at="2000-01-01T00:00:00+00:00")
+        with (
+            patch.dict(webhook._app_token_cache, clear=True),
+            patch.dict(webhook._installation_ids, clear=True),
+            patch("jwt.encode", return_value="jwt"),
+            patch.object(webhook, "_load_app_private_key", return_value="key"),
+            patch.object(webhook, "_get_app_http", return_value=client),
+        ):
+            await webhook._get_github_app_token("1", "pem", "org/a")
+            await webhook._get_github_app_token("1", "pem", "org/a")
+
+        client.get.assert_awaited_once()
+        assert client.post.await_count == 2
+        assert client.post.call_args.args[0].endswith("/app/installations/123/access_tokens")
+
 
 class TestReviewFormatter:
     """Tests for GitHub comment formatting."""
@@ -963,6 +1523,56 @@ class TestResolveFixedComments:
         # Line wasn't modified → NOT fixed (might still be an issue)
         assert len(delta.fixed_findings) == 0
 
+    def test_compute_review_delta_skips_fetch_when_not_requested(self):
+        """fetch_previous=False with no findings returns an empty delta without API calls."""
+        from ai_reviewer.github.client import GitHubClient
+
+        mock_pr = MagicMock()
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        with patch.object(client, "get_previous_review_comments") as mock_prev:
+            delta = client.compute_review_delta(mock_pr, [], fetch_previous=False)
+
+        mock_prev.assert_not_called()
+        mock_pr.get_files.assert_not_called()
+        assert delta.previous_comments == []
+        assert delta.fixed_findings == []
+
+    def test_parse_comment_body_requires_title_markup(self):
+        """Bodies without **Title** markup are not treated as AI findings."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        assert client._parse_comment_body(1, "a.py", 3, "Thanks, fixed!") is None
+
+        parsed = client._parse_comment_body(
+            2,
+            "a.py",
+            3,
+            "🟡 **Missing check**\n\n" + "x" * 300 + " 🔴\n<!-- ai-reviewer-id: abcdef123456 -->",
+        )
+        assert parsed is not None
+        assert parsed.severity == "warning"
+        assert parsed.title == "Missing check"
+        assert parsed.finding_hash == "abcdef123456"
+
+    def test_parse_comment_body_uses_leading_severity_emoji(self):
+        """The first severity emoji in the body wins, not the most severe one."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        parsed = client._parse_comment_body(
+            1, "a.py", 3, "💡 **Cache this**\n\nAvoids a 🔴 regression later."
+        )
+        assert parsed is not None
+        assert parsed.severity == "suggestion"
+
     def test_parse_modified_lines_extracts_added_lines(self):
         """Test that _parse_modified_lines correctly extracts modified line numbers."""
         from ai_reviewer.github.client import GitHubClient
@@ -988,26 +1598,57 @@ class TestResolveFixedComments:
             # Line 8 (context) should not be in modified
             assert 8 not in modified
 
-    def test_is_line_in_modified_range_with_tolerance(self):
-        """Test that _is_line_in_modified_range respects tolerance."""
+    def test_parse_modified_lines_multiple_hunks_with_section_headers(self):
+        """Each hunk resets to its new-file start, ignoring '+' in the section header."""
         from ai_reviewer.github.client import GitHubClient
 
+        diff_patch = (
+            "@@ -1,2 +1,3 @@ def add(a, b=a+1):\n"
+            " ctx 1\n"
+            "+added 2\n"
+            " ctx 3\n"
+            "@@ -40,2 +41,2 @@ class Foo:\n"
+            "-old 41\n"
+            "+new 41\n"
+            " ctx 42"
+        )
+
         with patch("ai_reviewer.github.client.Github"):
             client = GitHubClient(token="test-token")
 
-            modified_lines = {10, 11, 12}
+        assert client._parse_modified_lines(diff_patch) == {2, 41}
 
-            # Line 10 is exactly modified
-            assert client._is_line_in_modified_range(10, modified_lines) is True
+    def test_line_ranges_respect_tolerance(self):
+        """Lines within the tolerance of a modified line fall inside the merged ranges."""
+        from ai_reviewer.github.client import _line_in_ranges, _merge_line_ranges
 
-            # Line 13 is within tolerance (3) of line 12
-            assert client._is_line_in_modified_range(13, modified_lines, tolerance=3) is True
+        ranges = _merge_line_ranges({10, 11, 12}, 3)
 
-            # Line 7 is within tolerance (3) of line 10
-            assert client._is_line_in_modified_range(7, modified_lines, tolerance=3) is True
+        # Line 10 is exactly modified
+        assert _line_in_ranges(10, ranges) is True
 
-            # Line 20 is outside tolerance
-            assert client._is_line_in_modified_range(20, modified_lines, tolerance=3) is False
+        # Line 15 is within tolerance (3) of line 12
+        assert _line_in_ranges(15, ranges) is True
+
+        # Line 7 is within tolerance (3) of line 10
+        assert _line_in_ranges(7, ranges) is True
+
+        # Lines 6 and 16 are outside tolerance
+        assert _line_in_ranges(6, ranges) is False
+        assert _line_in_ranges(16, ranges) is False
+
+    def test_merged_line_ranges_match_tolerance_scan(self):
+        """Merged ranges + bisect agree with the per-line tolerance check."""
+        from ai_reviewer.github.client import _line_in_ranges, _merge_line_ranges
+
+        modified = {10, 11, 12, 30}
+        ranges = _merge_line_ranges(modified, 3)
+
+        assert ranges == [(7, 15), (27, 33)]
+        for line in range(0, 40):
+            expected = any(abs(line - m) <= 3 for m in modified)
+            assert _line_in_ranges(line, ranges) is expected
+        assert _line_in_ranges(5, []) is False
 
     def test_resolve_fixed_comments_skips_when_already_replied(self):
         """resolve_fixed_comments does not post a second Resolved reply."""
@@ -1061,39 +1702,6 @@ class TestResolveFixedComments:
         assert count == 0
         mock_pr.create_review_comment_reply.assert_not_called()
 
-    def test_resolve_thread_for_comment_uses_mapping(self):
-        """Test that thread resolution uses pre-fetched mapping."""
-        from ai_reviewer.github.client import GitHubClient
-
-        with patch("ai_reviewer.github.client.Github"):
-            client = GitHubClient(token="test-token")
-
-            # Mock the resolve method
-            client._resolve_review_thread = MagicMock(return_value=True)
-
-            # Pre-built mapping from comment_id to thread_id
-            thread_mapping = {456: "thread_123", 789: "thread_456"}
-
-            result = client._resolve_thread_for_comment(456, thread_mapping)
-
-            assert result is True
-            client._resolve_review_thread.assert_called_once_with("thread_123")
-
-    def test_resolve_thread_for_comment_missing_in_mapping(self):
-        """Test that missing comment in mapping returns False."""
-        from ai_reviewer.github.client import GitHubClient
-
-        with patch("ai_reviewer.github.client.Github"):
-            client = GitHubClient(token="test-token")
-            client._resolve_review_thread = MagicMock(return_value=True)
-
-            thread_mapping = {456: "thread_123"}  # 999 not in mapping
-
-            result = client._resolve_thread_for_comment(999, thread_mapping)
-
-            assert result is False
-            client._resolve_review_thread.assert_not_called()
-
     def test_fetch_thread_mapping_respects_max_pages(self):
         """Test that thread mapping fetch respects max page limit."""
         from ai_reviewer.github.client import GitHubClient
@@ -1130,6 +1738,159 @@ class TestResolveFixedComments:
             # Should still return the mapping it built
             assert 123 in result
 
+    def test_resolve_review_threads_bulk_batches_aliases(self):
+        """Threads are resolved with one aliased mutation per batch of 50."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        def fake_request(_query, variables):
+            return {f"r{i}": {"thread": {"isResolved": True}} for i in range(len(variables))}
+
+        client._graphql_request = MagicMock(side_effect=fake_request)
+        thread_ids = [f"T{i}" for i in range(60)]
+
+        results = client._resolve_review_threads_bulk(thread_ids)
+
+        assert client._graphql_request.call_count == 2
+        first_query, first_vars = client._graphql_request.call_args_list[0].args
+        assert "r49: resolveReviewThread" in first_query
+        assert first_vars["t0"] == "T0"
+        assert results == dict.fromkeys(thread_ids, True)
+
+    def test_resolve_fixed_comments_resolves_threads_in_one_request(self):
+        """All replied comments' threads are resolved with a single bulk call."""
+        from ai_reviewer.github.client import GitHubClient, PreviousComment, ReviewDelta
+
+        mock_pr = MagicMock()
+        mock_pr.get_review_comments.return_value = []
+        mock_pr.base.repo.full_name = "test/repo"
+        mock_pr.number = 1
+        delta = ReviewDelta(
+            fixed_findings=[
+                PreviousComment(
+                    id=cid, file_path="a.py", line=1, title="T", severity="warning", body="b"
+                )
+                for cid in (1, 2, 3)
+            ]
+        )
+
+        with (
+            patch("ai_reviewer.github.client.Github"),
+            patch("ai_reviewer.github.client._RESOLVE_COMMENT_DELAY_S", 0),
+        ):
+            client = GitHubClient(token="test-token")
+            client._fetch_thread_mapping = MagicMock(return_value={1: "T1", 2: "T2"})
+            client._resolve_review_threads_bulk = MagicMock(return_value={"T1": True, "T2": False})
+
+            count = client.resolve_fixed_comments(mock_pr, delta)
+
+        assert count == 3
+        client._resolve_review_threads_bulk.assert_called_once_with(["T1", "T2"])
+
+    def test_resolve_fixed_comments_reply_failure_isolated(self):
+        """A failed reply on one comment doesn't stop replies on the others."""
+        from ai_reviewer.github.client import GitHubClient, PreviousComment, ReviewDelta
+
+        mock_pr = MagicMock()
+        mock_pr.get_review_comments.return_value = []
+        mock_pr.base.repo.full_name = "test/repo"
+        mock_pr.number = 1
+
+        def reply(*, comment_id, **_kwargs):
+            if comment_id == 2:
+                raise RuntimeError("boom")
+
+        mock_pr.create_review_comment_reply.side_effect = reply
+        delta = ReviewDelta(
+            fixed_findings=[
+                PreviousComment(
+                    id=cid, file_path="a.py", line=1, title="T", severity="warning", body="b"
+                )
+                for cid in (1, 2, 3)
+            ]
+        )
+
+        with (
+            patch("ai_reviewer.github.client.Github"),
+            patch("ai_reviewer.github.client._RESOLVE_COMMENT_DELAY_S", 0),
+        ):
+            client = GitHubClient(token="test-token")
+            client._fetch_thread_mapping = MagicMock(return_value={1: "T1", 2: "T2", 3: "T3"})
+            client._resolve_review_threads_bulk = MagicMock(return_value={})
+
+            count = client.resolve_fixed_comments(mock_pr, delta)
+
+        assert count == 2
+        assert mock_pr.create_review_comment_reply.call_count == 3
+        client._resolve_review_threads_bulk.assert_called_once_with(["T1", "T3"])
+
+    def test_resolve_fixed_comments_reacts_by_comment_id(self):
+        """The reaction is posted by ID without fetching the comment first."""
+        from ai_reviewer.github.client import GitHubClient, PreviousComment, ReviewDelta
+
+        mock_pr = MagicMock()
+        mock_pr.get_review_comments.return_value = []
+        mock_pr.base.repo.full_name = "test/repo"
+        mock_pr.number = 1
+        delta = ReviewDelta(
+            fixed_findings=[
+                PreviousComment(
+                    id=7, file_path="a.py", line=1, title="Bug", severity="critical", body="b"
+                )
+            ]
+        )
+
+        with (
+            patch("ai_reviewer.github.client.Github"),
+            patch("ai_reviewer.github.client._RESOLVE_COMMENT_DELAY_S", 0),
+        ):
+            client = GitHubClient(token="test-token")
+            client._fetch_thread_mapping = MagicMock(return_value={})
+            with patch.object(client._http, "post") as mock_post:
+                assert client.resolve_fixed_comments(mock_pr, delta) == 1
+
+        mock_pr.get_review_comment.assert_not_called()
+        mock_post.assert_called_once_with(
+            "https://api.github.com/repos/test/repo/pulls/comments/7/reactions",
+            json={"content": "hooray"},
+            timeout=30,
+        )
+        mock_pr.create_review_comment_reply.assert_called_once()
+
+    def test_fetch_thread_mapping_stops_once_targets_found(self):
+        """No further pages are fetched after every target comment is mapped."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        def page(thread_id, db_id):
+            return {
+                "repository": {
+                    "pullRequest": {
+                        "reviewThreads": {
+                            "pageInfo": {"hasNextPage": True, "endCursor": thread_id},
+                            "nodes": [
+                                {
+                                    "id": thread_id,
+                                    "isResolved": False,
+                                    "comments": {"nodes": [{"databaseId": db_id}]},
+                                }
+                            ],
+                        }
+                    }
+                }
+            }
+
+        client._graphql_request = MagicMock(side_effect=[page("T1", 1), page("T2", 2)])
+
+        result = client._fetch_thread_mapping("test/repo", 1, target_ids={1})
+
+        assert result == {1: "T1"}
+        assert client._graphql_request.call_count == 1
+
     def test_fixed_findings_deduplicated_by_id(self):
         """compute_review_delta must deduplicate fixed_findings by comment ID."""
         from ai_reviewer.github.client import GitHubClient, PreviousComment
@@ -1193,12 +1954,34 @@ class TestResolveFixedComments:
         mock_resp = MagicMock()
         mock_resp.raise_for_status.return_value = None
         mock_resp.json.return_value = {"errors": [{"message": "secret internal detail"}]}
-        with patch("requests.post", return_value=mock_resp), caplog.at_level(logging.WARNING):
+        with (
+            patch.object(client._http, "post", return_value=mock_resp),
+            caplog.at_level(logging.WARNING),
+        ):
             result = client._graphql_request("{ viewer { login } }")
         assert result is None
         warning_msgs = [r.message for r in caplog.records if r.levelno == logging.WARNING]
         assert not any("secret internal detail" in m for m in warning_msgs)
 
+    def test_graphql_requests_reuse_client_session(self):
+        """GraphQL calls go through the client's pooled session, not requests.post."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"data": {"viewer": {"login": "bot"}}}
+        with patch.object(client._http, "post", return_value=mock_resp) as mock_post:
+            client._graphql_request("{ viewer { login } }")
+            client._graphql_request("{ viewer { login } }")
+
+        assert mock_post.call_count == 2
+        assert client._http.headers["Authorization"] == "Bearer test-token"
+
+        with patch.object(client._http, "close") as mock_close, client:
+            pass
+        mock_close.assert_called_once()
+
 
 class TestPostReviewPendingRetry:
     """Tests for dismiss-and-retry logic when post_review hits a 422 pending review."""
@@ -2456,6 +3239,316 @@ class TestPreviousCommentsCacheLRU:
         assert len(client._previous_comments_cache) == 5
 
 
+class TestRepoCache:
+    """Tests for the LRU-bounded repository cache behind get_repo."""
+
+    def _make_client(self):
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+        return client
+
+    def test_get_repo_fetches_once_per_name(self):
+        """Repeated lookups (including via other helpers) hit the API once."""
+        client = self._make_client()
+
+        repo = client.get_repo("owner/repo")
+        client.get_file_contents("owner/repo", "README.md", ref="main")
+        client.get_pull_request("owner/repo", 1)
+
+        assert client.get_repo("owner/repo") is repo
+        client._gh.get_repo.assert_called_once_with("owner/repo")
+
+    def test_repo_cache_evicts_oldest(self):
+        """The cache never grows beyond its max size."""
+        client = self._make_client()
+        client._repo_cache_max = 2
+
+        for name in ("a/one", "a/two", "a/three"):
+            client.get_repo(name)
+
+        assert list(client._repo_cache.keys()) == ["a/two", "a/three"]
+
+    def test_context_manager_closes_session_and_pygithub(self):
+        """Leaving the with-block closes both pools and drops the rate-limit hook."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        with patch.object(client._http, "close") as mock_close, client:
+            pass
+
+        mock_close.assert_called_once()
+        client._gh.close.assert_called_once()
+        assert client._http.hooks["response"] == []
+
+
+class TestRateBudget:
+    """Tests for the client-side token bucket and rate-limit header handling."""
+
+    def test_acquire_sleeps_only_after_burst(self):
+        from ai_reviewer.github.client import _RateBudget
+
+        with (
+            patch("ai_reviewer.github.client.time.monotonic", return_value=100.0),
+            patch("ai_reviewer.github.client.time.sleep") as mock_sleep,
+        ):
+            budget = _RateBudget(rate_per_sec=10, burst=2)
+            budget.acquire()
+            budget.acquire()
+            mock_sleep.assert_not_called()
+
+            budget.acquire()
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args.args[0] == pytest.approx(0.1)
+
+    def test_rate_limit_pause_from_headers(self):
+        from ai_reviewer.github.client import _rate_limit_pause
+
+        def resp(headers):
+            r = MagicMock()
+            r.headers = headers
+            return r
+
+        assert _rate_limit_pause(resp({})) == 0.0
+        assert _rate_limit_pause(resp({"Retry-After": "5"})) == 5.0
+        assert _rate_limit_pause(resp({"Retry-After": "9999"})) == 60.0
+
+        with patch("ai_reviewer.github.client.time.time", return_value=1000.0):
+            plenty = {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "1100"}
+            low = {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1100"}
+            assert _rate_limit_pause(resp(plenty)) == 0.0
+            assert _rate_limit_pause(resp(low)) == pytest.approx(10.0)
+
+
+class TestPrFilesCache:
+    """Tests for the per-PR file list cache behind get_pr_files."""
+
+    def test_files_fetched_once_across_helpers(self):
+        """Diff, contents and delta helpers share one pr.get_files() fetch."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        mock_file = MagicMock(
+            filename="a.py", patch="@@ -1 +1 @@\n-x\n+y", status="modified", changes=2
+        )
+        pr = MagicMock()
+        pr.number = 7
+        pr.get_files.return_value = [mock_file]
+
+        client.get_pr_diff(pr)
+        client.get_changed_files(pr)
+        client.compute_review_delta(pr, [])
+
+        pr.get_files.assert_called_once()
+
+    def test_files_refetched_after_new_push(self):
+        """A new head SHA is a cache miss and replaces the PR's older listing."""
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+
+        pr = MagicMock()
+        pr.number = 7
+        pr.head.sha = "aaa"
+        pr.get_files.return_value = []
+
+        client.get_pr_files(pr)
+        client.get_pr_files(pr)
+        assert pr.get_files.call_count == 1
+
+        pr.head.sha = "bbb"
+        client.get_pr_files(pr)
+        assert pr.get_files.call_count == 2
+        assert list(client._pr_files_cache) == [(7, "bbb")]
+
+    def test_review_comments_shared_until_replies_posted(self):
+        """Previous-comment parsing and resolve share one get_review_comments() fetch."""
+        from ai_reviewer.github.client import GitHubClient, PreviousComment, ReviewDelta
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+        client._fetch_review_threads = MagicMock(return_value=None)
+        client._fetch_thread_mapping = MagicMock(return_value={})
+
+        pr = MagicMock()
+        pr.number = 7
+        pr.get_review_comments.return_value = []
+        delta = ReviewDelta(
+            fixed_findings=[
+                PreviousComment(
+                    id=1, file_path="a.py", line=1, title="T", severity="warning", body="b"
+                )
+            ]
+        )
+
+        client.get_previous_review_comments(pr)
+        with patch("ai_reviewer.github.client._RESOLVE_COMMENT_DELAY_S", 0):
+            client.resolve_fixed_comments(pr, delta)
+        pr.get_review_comments.assert_called_once()
+
+        # The posted reply invalidated the cache
+        client._get_review_comments(pr)
+        assert pr.get_review_comments.call_count == 2
+
+
+class TestPreviousCommentsGraphQL:
+    """Tests for fetching previous AI comments via GraphQL review threads."""
+
+    def _make_client(self, threads):
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+        client._fetch_review_threads = MagicMock(return_value=threads)
+        client._allowed_users = {"github-actions[bot]", "my-bot"}
+        return client
+
+    def _make_pr(self):
+        pr = MagicMock()
+        pr.number = 7
+        pr.base.repo.full_name = "test/repo"
+        return pr
+
+    @staticmethod
+    def _node(db_id, body, login="github-actions", path="a.py", line=10, typename="Bot"):
+        return {
+            "databaseId": db_id,
+            "body": body,
+            "path": path,
+            "line": line,
+            "originalLine": line,
+            "author": {"__typename": typename, "login": login},
+        }
+
+    def test_parses_bot_comments_without_rest_fetch(self):
+        """GraphQL bot logins (no [bot] suffix) are matched; REST is never paged."""
+        threads = [
+            {
+                "id": "T1",
+                "isResolved": False,
+                "comments": {"nodes": [self._node(1, "🔴 **SQL Injection**\n\nbad")]},
+            }
+        ]
+        client = self._make_client(threads)
+        pr = self._make_pr()
+
+        comments = client.get_previous_review_comments(pr)
+
+        assert [c.id for c in comments] == [1]
+        assert comments[0].severity == "critical"
+        assert comments[0].title == "SQL Injection"
+        pr.get_review_comments.assert_not_called()
+
+    def test_keeps_resolved_threads_skips_human_comments_and_resolved_replies(self):
+        """Resolved-thread comments stay matchable (flagged), like the REST fallback."""
+        threads = [
+            {
+                "id": "T1",
+                "isResolved": True,
+                "comments": {"nodes": [self._node(1, "🟡 **Old issue**")]},
+            },
+            {
+                "id": "T2",
+                "isResolved": False,
+                "comments": {
+                    "nodes": [
+                        self._node(2, "🟡 **Open issue**", login="my-bot", typename="User"),
+                        self._node(3, "✅ **No longer detected** - gone"),
+                        self._node(4, "🔴 **Looks like ours**", login="human-dev", typename="User"),
+                    ]
+                },
+            },
+        ]
+        client = self._make_client(threads)
+
+        comments = client.get_previous_review_comments(self._make_pr())
+
+        assert [(c.id, c.is_resolved) for c in comments] == [(1, True), (2, False)]
+
+    def test_user_with_bot_slug_login_is_not_matched(self):
+        """A user account named like the bot's slug is not treated as the bot."""
+        threads = [
+            {
+                "id": "T1",
+                "isResolved": False,
+                "comments": {
+                    "nodes": [
+                        self._node(1, "🔴 **Impostor**", login="github-actions", typename="User")
+                    ]
+                },
+            }
+        ]
+        client = self._make_client(threads)
+
+        assert client.get_previous_review_comments(self._make_pr()) == []
+
+    def test_falls_back_to_rest_when_graphql_fails(self):
+        client = self._make_client(None)
+        pr = self._make_pr()
+        rest_comment = MagicMock()
+        rest_comment.body = "💡 **Use a set**"
+        rest_comment.user.login = "github-actions[bot]"
+        rest_comment.id = 5
+        rest_comment.path = "b.py"
+        rest_comment.line = 3
+        pr.get_review_comments.return_value = [rest_comment]
+
+        comments = client.get_previous_review_comments(pr)
+
+        assert [c.id for c in comments] == [5]
+        pr.get_review_comments.assert_called_once()
+
+    def test_resolve_reuses_fetched_threads_for_mapping(self):
+        """resolve_fixed_comments maps threads from the earlier GraphQL fetch."""
+        from ai_reviewer.github.client import ReviewDelta
+
+        threads = [
+            {
+                "id": "T1",
+                "isResolved": False,
+                "comments": {"nodes": [self._node(1, "🔴 **SQL Injection**")]},
+            }
+        ]
+        client = self._make_client(threads)
+        client._fetch_thread_mapping = MagicMock()
+        client._resolve_review_threads_bulk = MagicMock(return_value={"T1": True})
+        pr = self._make_pr()
+        pr.get_review_comments.return_value = []
+
+        previous = client.get_previous_review_comments(pr)
+        with patch("ai_reviewer.github.client._RESOLVE_COMMENT_DELAY_S", 0):
+            count = client.resolve_fixed_comments(pr, ReviewDelta(fixed_findings=previous))
+
+        assert count == 1
+        client._fetch_thread_mapping.assert_not_called()
+        client._resolve_review_threads_bulk.assert_called_once_with(["T1"])
+
+    def test_fetch_review_threads_returns_none_on_failed_page(self):
+        from ai_reviewer.github.client import GitHubClient
+
+        with patch("ai_reviewer.github.client.Github"):
+            client = GitHubClient(token="test-token")
+        first_page = {
+            "repository": {
+                "pullRequest": {
+                    "reviewThreads": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                        "nodes": [{"id": "T1", "isResolved": False}],
+                    }
+                }
+            }
+        }
+        client._graphql_request = MagicMock(side_effect=[first_page, None])
+
+        assert client._fetch_review_threads("test/repo", 1) is None
+
+
 class TestCreateDocUpdatePR:
     """Tests for GitHubClient.create_doc_update_pr()."""
 
@@ -141,6 +141,11 @@ class TestConsolidatedReview:
 
         assert review.agent_count == 3
         assert len(review.findings) == 2
+        assert review.findings_by_severity[Severity.CRITICAL] == 1
+        assert review.findings_by_severity[Severity.NITPICK] == 0
+        assert review.findings_by_category[Category.PERFORMANCE] == 1
+        assert len(review.findings_by_category) == len(Category)
+        assert review.has_critical_issues
         # First finding has full consensus
         assert review.findings[0].consensus_score == 1.0
 
@@ -289,3 +294,31 @@ class TestFindingHashFuzzy:
         f1 = _make_consolidated_finding(line_start=10)
         f2 = _make_consolidated_finding(line_start=50)
         assert f1.finding_hash != f2.finding_hash  # Primary IS line-sensitive
+
+
+def test_review_context_prompt_renders_fields_and_fallbacks():
+    """Prompt context renders every field, with fallbacks for empty lists and description."""
+    from ai_reviewer.models.context import ReviewContext
+
+    ctx = ReviewContext(
+        repo_name="org/repo",
+        pr_number=7,
+        pr_title="Fix {braces} in title",
+        pr_description="",
+        base_branch="main",
+        head_branch="feature",
+        author="dev",
+        changed_files_count=2,
+        additions=10,
+        deletions=3,
+        labels=["bug", "ci"],
+    )
+
+    text = ctx.to_prompt_context()
+
+    assert "- PR #7: Fix {braces} in title" in text
+    assert "- Branch: feature → main" in text
+    assert "- Changes: +10 / -3 in 2 files" in text
+    assert "- Languages: Unknown" in text
+    assert "- Labels: bug, ci" in text
+    assert text.endswith("## PR Description\nNo description provided.\n")
@@ -164,3 +164,272 @@ class TestAgentOrchestrator:
                 file_contents={},
                 context=mock_review_context,
             )
+
+    @pytest.mark.asyncio
+    async def test_cancels_stragglers_after_grace(
+        self, sample_vulnerable_diff, mock_review_context
+    ):
+        """Test that slow agents are cancelled once enough agents succeed."""
+        from ai_reviewer.models.review import AgentReview
+        from ai_reviewer.orchestrator.orchestrator import AgentOrchestrator, OrchestratorConfig
+
+        cancelled = []
+
+        def make_agent(agent_id, delay):
+            agent = MagicMock()
+            agent.agent_id = agent_id
+
+            async def review(*_args, **_kwargs):
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    cancelled.append(agent_id)
+                    raise
+                return AgentReview(
+                    agent_id=agent_id,
+                    agent_type="claude",
+                    focus_areas=["security"],
+                    findings=[],
+                    summary="Done",
+                    review_time_ms=int(delay * 1000),
+                )
+
+            agent.review = review
+            return agent
+
+        orchestrator = AgentOrchestrator(
+            agents=[make_agent("fast-agent", 0.01), make_agent("slow-agent", 10)],
+            config=OrchestratorConfig(
+                timeout_seconds=30, min_agents_required=1, straggler_grace_seconds=0.05
+            ),
+        )
+
+        start_time = datetime.now()
+        results = await orchestrator.review(
+            diff=sample_vulnerable_diff,
+            file_contents={},
+            context=mock_review_context,
+        )
+        total_time = (datetime.now() - start_time).total_seconds()
+
+        assert [r.agent_id for r in results] == ["fast-agent"]
+        assert cancelled == ["slow-agent"]
+        assert total_time < 1
+
+    @pytest.mark.asyncio
+    async def test_reports_timed_out_agents(self, sample_vulnerable_diff, mock_review_context):
+        """Test that agents still running at the deadline are reported as timeouts."""
+        from ai_reviewer.orchestrator.orchestrator import (
+            AgentOrchestrator,
+            InsufficientAgentsError,
+        )
+
+        slow_agent = MagicMock()
+        slow_agent.agent_id = "slow-agent"
+
+        async def slow_review(*_args, **_kwargs):
+            await asyncio.sleep(10)
+
+        slow_agent.review = slow_review
+
+        orchestrator = AgentOrchestrator(
+            agents=[slow_agent],
+            timeout_seconds=0.05,
+            min_agents_required=1,
+        )
+
+        with pytest.raises(InsufficientAgentsError, match=r"slow-agent \(timeout\)"):
+            await orchestrator.review(
+                diff=sample_vulnerable_diff,
+                file_contents={},
+                context=mock_review_context,
+            )
+
+    @pytest.mark.asyncio
+    async def test_limits_parallel_agents(self, sample_vulnerable_diff, mock_review_context):
+        """Test that no more than max_parallel_agents run at once."""
+        from ai_reviewer.models.review import AgentReview
+        from ai_reviewer.orchestrator.orchestrator import AgentOrchestrator, OrchestratorConfig
+
+        running = 0
+        peak = 0
+
+        def make_agent(agent_id):
+            agent = MagicMock()
+            agent.agent_id = agent_id
+
+            async def review(*_args, **_kwargs):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return AgentReview(
+                    agent_id=agent_id,
+                    agent_type="claude",
+                    focus_areas=["security"],
+                    findings=[],
+                    summary="Done",
+                    review_time_ms=10,
+                )
+
+            agent.review = review
+            return agent
+
+        orchestrator = AgentOrchestrator(
+            agents=[make_agent(f"agent-{i}") for i in range(5)],
+            config=OrchestratorConfig(min_agents_required=5, max_parallel_agents=2),
+        )
+
+        results = await orchestrator.review(
+            diff=sample_vulnerable_diff,
+            file_contents={},
+            context=mock_review_context,
+        )
+
+        assert len(results) == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_review_cancels_agents(
+        self, sample_vulnerable_diff, mock_review_context
+    ):
+        """Test that agent tasks do not outlive a cancelled review."""
+        from ai_reviewer.orchestrator.orchestrator import AgentOrchestrator
+
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        slow_agent = MagicMock()
+        slow_agent.agent_id = "slow-agent"
+
+        async def slow_review(*_args, **_kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        slow_agent.review = slow_review
+
+        orchestrator = AgentOrchestrator(
+            agents=[slow_agent],
+            timeout_seconds=30,
+            min_agents_required=1,
+        )
+
+        review = asyncio.create_task(
+            orchestrator.review(
+                diff=sample_vulnerable_diff,
+                file_contents={},
+                context=mock_review_context,
+            )
+        )
+        await started.wait()
+        review.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await review
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_on_review_called_as_agents_finish(
+        self, sample_vulnerable_diff, mock_review_context
+    ):
+        """Test that each successful review is handed over when its agent finishes."""
+        from ai_reviewer.models.review import AgentReview
+        from ai_reviewer.orchestrator.orchestrator import AgentOrchestrator
+
+        def make_agent(agent_id, delay, fail=False):
+            agent = MagicMock()
+            agent.agent_id = agent_id
+
+            async def review(*_args, **_kwargs):
+                await asyncio.sleep(delay)
+                if fail:
+                    raise Exception("Agent failed")
+                return AgentReview(
+                    agent_id=agent_id,
+                    agent_type="claude",
+                    focus_areas=["security"],
+                    findings=[],
+                    summary="Done",
+                    review_time_ms=int(delay * 1000),
+                )
+
+            agent.review = review
+            return agent
+
+        orchestrator = AgentOrchestrator(
+            agents=[
+                make_agent("slow-agent", 0.05),
+                make_agent("failing-agent", 0.01, fail=True),
+                make_agent("fast-agent", 0.01),
+            ],
+            timeout_seconds=10,
+            min_agents_required=2,
+        )
+
+        arrived = []
+        results = await orchestrator.review(
+            diff=sample_vulnerable_diff,
+            file_contents={},
+            context=mock_review_context,
+            on_review=lambda review: arrived.append(review.agent_id),
+        )
+
+        assert arrived == ["fast-agent", "slow-agent"]
+        assert [r.agent_id for r in results] == ["slow-agent", "fast-agent"]
+
+    @pytest.mark.asyncio
+    async def test_retries_only_transient_failures(
+        self, sample_vulnerable_diff, mock_review_context
+    ):
+        """Test that transient errors are retried and permanent ones are not."""
+        from ai_reviewer.models.review import AgentReview
+        from ai_reviewer.orchestrator.orchestrator import AgentOrchestrator, OrchestratorConfig
+
+        calls = {"flaky-agent": 0, "broken-agent": 0}
+
+        def make_agent(agent_id, error):
+            agent = MagicMock()
+            agent.agent_id = agent_id
+
+            async def review(*_args, **_kwargs):
+                calls[agent_id] += 1
+                if calls[agent_id] == 1 or agent_id == "broken-agent":
+                    raise error
+                return AgentReview(
+                    agent_id=agent_id,
+                    agent_type="claude",
+                    focus_areas=["security"],
+                    findings=[],
+                    summary="Done",
+                    review_time_ms=10,
+                )
+
+            agent.review = review
+            return agent
+
+        orchestrator = AgentOrchestrator(
+            agents=[
+                make_agent("flaky-agent", ConnectionError("reset")),
+                make_agent("broken-agent", ValueError("bad schema")),
+            ],
+            config=OrchestratorConfig(
+                min_agents_required=1,
+                max_retries=2,
+                retry_base_delay_seconds=0,
+                retry_jitter_seconds=0,
+            ),
+        )
+
+        results = await orchestrator.review_with_retry(
+            diff=sample_vulnerable_diff,
+            file_contents={},
+            context=mock_review_context,
+        )
+
+        assert [r.agent_id for r in results] == ["flaky-agent"]
+        assert calls == {"flaky-agent": 2, "broken-agent": 1}
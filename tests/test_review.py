@@ -64,6 +64,18 @@ class TestRawFindingsSimilar:
         }
         assert _raw_findings_similar(raw1, raw2) is True
 
+    def test_long_repetitive_descriptions_similar(self):
+        """Long near-identical descriptions cluster despite difflib's autojunk heuristic."""
+        raw1 = {
+            "file_path": "src/auth.py",
+            "line_start": 10,
+            "category": "logic",
+            "title": "Unchecked return value",
+            "description": "the value is not checked here. " * 10,
+        }
+        raw2 = dict(raw1, description="the value is not checked there. " * 10)
+        assert _raw_findings_similar(raw1, raw2) is True
+
     def test_different_files_not_similar(self):
         """Findings in different files are not similar."""
         raw1 = {